@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+QuranBot - Search Benchmark
+===========================
+
+Latency and relevance benchmark for src/utils/search.py. Runs locally
+without a Discord connection.
+
+Reports, per engine:
+- p50 / p99 latency and throughput over the labeled query set
+- Peak memory allocated per query (tracemalloc)
+- Top-1 / top-5 accuracy, overall and per query category
+
+Engines:
+- indexed: SurahSearch with its result cache disabled (cost of a cold query)
+- cached: SurahSearch with its LRU result cache (cost of a repeated query)
+- legacy: the original SequenceMatcher scan over all 114 surahs, as a baseline
+
+Usage:
+    python benchmarks/search_benchmark.py
+    python benchmarks/search_benchmark.py --engine indexed --iterations 200 --misses
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Add project root to Python path so src/ imports work without installation
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logger import logger
+from src.utils.search import SurahSearch
+
+
+# Labeled queries shipped next to this script
+QUERIES_FILE: Path = Path(__file__).parent / "search_queries.json"
+
+# An engine takes (query, limit) and returns surah numbers, best first
+Engine = Callable[[str, int], List[int]]
+
+
+def legacy_engine(search: SurahSearch) -> Engine:
+    """
+    Build the pre-index search algorithm as a baseline.
+
+    Scores every surah with three SequenceMatcher ratios plus substring
+    boosts and a 0.3 threshold, exactly like the original implementation.
+    """
+    def run(query: str, limit: int) -> List[int]:
+        query = query.strip()
+        if query.isdigit():
+            num: int = int(query)
+            return [num] if 1 <= num <= 114 and search.records[num] else []
+
+        query_lower: str = query.lower()
+        results: List[Tuple[float, int]] = []
+        for record in search.records:
+            if record is None:
+                continue
+            best: float = max(
+                SequenceMatcher(None, query, record.arabic).ratio(),
+                SequenceMatcher(None, query_lower, record.english.lower()).ratio(),
+                SequenceMatcher(None, query_lower, record.translation.lower()).ratio(),
+            )
+            if query in record.arabic:
+                best = max(best, 0.8)
+            if query_lower in record.english.lower():
+                best = max(best, 0.8)
+            if query_lower in record.translation.lower():
+                best = max(best, 0.7)
+            if best > 0.3:
+                results.append((best, record.number))
+        results.sort(key=lambda r: r[0], reverse=True)
+        return [number for _, number in results[:limit]]
+    return run
+
+
+def indexed_engine(search: SurahSearch) -> Engine:
+    """Run SurahSearch.search and return the surah numbers."""
+    def run(query: str, limit: int) -> List[int]:
+        return [result.number for result in search.search(query, limit)]
+    return run
+
+
+def build_engines() -> Dict[str, Engine]:
+    """Create every engine on its own SurahSearch so caches don't interact."""
+    uncached: SurahSearch = SurahSearch()
+    uncached.CACHE_SIZE = 0
+    cached: SurahSearch = SurahSearch()
+    return {
+        "indexed": indexed_engine(uncached),
+        "cached": indexed_engine(cached),
+        "legacy": legacy_engine(uncached),
+    }
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list."""
+    ordered: List[float] = sorted(samples)
+    index: int = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def benchmark(engine: Engine, queries: List[Dict[str, Any]], iterations: int) -> Dict[str, Any]:
+    """
+    Measure one engine over the query set.
+
+    Args:
+        engine: Engine under test
+        queries: Labeled queries
+        iterations: Timed passes over the full query set
+
+    Returns:
+        Dict of latency, throughput, allocation and accuracy figures
+    """
+    # Relevance: one pass, top-5 results per query
+    top1: int = 0
+    top5: int = 0
+    by_category: Dict[str, List[int]] = {}
+    misses: List[str] = []
+    for item in queries:
+        numbers: List[int] = engine(item["query"], 5)
+        hit1: bool = bool(numbers) and numbers[0] == item["expected"]
+        hit5: bool = item["expected"] in numbers
+        top1 += hit1
+        top5 += hit5
+        stats: List[int] = by_category.setdefault(item["category"], [0, 0, 0])
+        stats[0] += hit1
+        stats[1] += hit5
+        stats[2] += 1
+        if not hit1:
+            misses.append(f"{item['query']!r} → {numbers[:3]} (expected {item['expected']})")
+
+    # Allocations: peak bytes traced while answering each query once
+    tracemalloc.start()
+    peaks: List[int] = []
+    for item in queries:
+        tracemalloc.reset_peak()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        engine(item["query"], 5)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    # Latency: every query timed individually across all passes
+    samples: List[float] = []
+    started: float = time.perf_counter()
+    for _ in range(iterations):
+        for item in queries:
+            t0: int = time.perf_counter_ns()
+            engine(item["query"], 5)
+            samples.append((time.perf_counter_ns() - t0) / 1000)
+    elapsed: float = time.perf_counter() - started
+
+    return {
+        "p50_us": percentile(samples, 50),
+        "p99_us": percentile(samples, 99),
+        "mean_us": statistics.fmean(samples),
+        "throughput_qps": len(samples) / elapsed if elapsed else 0.0,
+        "alloc_peak_kb": statistics.fmean(peaks) / 1024,
+        "top1": top1 / len(queries),
+        "top5": top5 / len(queries),
+        "categories": {name: (s[0] / s[2], s[1] / s[2], s[2]) for name, s in sorted(by_category.items())},
+        "misses": misses,
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the selected engines and print a report."""
+    parser = argparse.ArgumentParser(description="Benchmark surah search latency and relevance")
+    parser.add_argument("--engine", choices=["indexed", "cached", "legacy", "all"], default="all")
+    parser.add_argument("--iterations", type=int, default=50, help="timed passes over the query set")
+    parser.add_argument("--queries", type=Path, default=QUERIES_FILE, help="labeled query file")
+    parser.add_argument("--misses", action="store_true", help="list queries whose top result was wrong")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    # Keep search debug trees out of the measurements and the output
+    logger.set_levels(console=logger.ERROR, file=logger.ERROR)
+
+    queries: List[Dict[str, Any]] = json.loads(args.queries.read_text(encoding="utf-8"))["queries"]
+    engines: Dict[str, Engine] = build_engines()
+    selected: List[str] = list(engines) if args.engine == "all" else [args.engine]
+
+    results: Dict[str, Dict[str, Any]] = {name: benchmark(engines[name], queries, args.iterations) for name in selected}
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print(f"\n{len(queries)} queries × {args.iterations} iterations\n")
+    print(f"{'engine':<10}{'p50 µs':>10}{'p99 µs':>10}{'qps':>12}{'alloc KB':>10}{'top-1':>8}{'top-5':>8}")
+    for name, r in results.items():
+        print(
+            f"{name:<10}{r['p50_us']:>10.1f}{r['p99_us']:>10.1f}{r['throughput_qps']:>12,.0f}"
+            f"{r['alloc_peak_kb']:>10.1f}{r['top1']:>8.1%}{r['top5']:>8.1%}"
+        )
+
+    for name, r in results.items():
+        print(f"\n{name} accuracy by category (top-1 / top-5):")
+        for category, (t1, t5, count) in r["categories"].items():
+            print(f"  {category:<12}{t1:>7.0%}{t5:>7.0%}  ({count} queries)")
+        if args.misses and r["misses"]:
+            print(f"  misses:")
+            for miss in r["misses"]:
+                print(f"    {miss}")
+
+
+if __name__ == "__main__":
+    main()
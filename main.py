@@ -170,6 +170,10 @@ async def main() -> None:
         
         # Log successful shutdown completion
         logger.success("TahaBot 24/7 stopped successfully")
+        
+        # Make sure every queued log record reaches the console and log file
+        # The writer thread is also flushed and stopped by an atexit hook
+        logger.flush()
 
 
 if __name__ == "__main__":
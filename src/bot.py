@@ -19,7 +19,7 @@ Version: v1.0.0
 import asyncio
 import discord
 from discord.ext import commands
-from typing import Optional, Union
+from typing import Optional, Union, List, Dict, Tuple
 
 from src.core.logger import logger
 from src.core.config import Config, get_config
@@ -27,6 +27,9 @@ from src.core.persistence import PersistenceManager
 from src.services.audio.audio_service import AudioService
 from src.ui.control_panel import ControlPanel
 from src.handlers.presence_handler import PresenceHandler
+from src.handlers.admin_commands import AdminCommands
+from src.handlers.playback_commands import PlaybackCommands
+from src.utils.search import SurahSearch, get_surah_search
 
 
 class TahaBot(commands.Bot):
@@ -65,16 +68,21 @@ class TahaBot(commands.Bot):
         self.persistence: PersistenceManager = PersistenceManager()
         
         # Load previously saved state if it exists
-        # This allows the bot to resume from where it left off after a restart
-        saved_state = self.persistence.load_state()
+        # The playback journal is replayed on top so an interrupted surah resumes exactly
+        saved_state = self.persistence.load_resume_state()
         
         # Initialize the audio service with saved state for seamless continuity
         # If no saved state exists, defaults to Surah 1 and Saad Al Ghamdi
         self.audio_service: AudioService = AudioService(
             saved_surah=saved_state.get('current_surah'),
-            saved_reciter=saved_state.get('reciter')
+            saved_reciter=saved_state.get('reciter'),
+            saved_position=saved_state.get('position', 0.0)
         )
         
+        # Preload the shared surah search engine so no interaction pays for
+        # parsing and indexing the mapper file on the event loop
+        self.surah_search: SurahSearch = get_surah_search()
+        
         # Control panel will be created when we send it to the stage channel
         self.control_panel: Optional[ControlPanel] = None
         
@@ -87,6 +95,9 @@ class TahaBot(commands.Bot):
         # Pass presence handler to audio service
         self.audio_service.presence_handler = self.presence_handler
         
+        # Pass playback journal to audio service so every playback event is recorded
+        self.audio_service.journal = self.persistence.journal
+        
         # Configure Discord bot intents for required functionality
         # These intents allow the bot to access specific Discord features
         intents: discord.Intents = discord.Intents.default()
@@ -108,6 +119,28 @@ class TahaBot(commands.Bot):
             ("Intents", "message_content, guilds, voice_states")
         ])
     
+    async def setup_hook(self) -> None:
+        """
+        Register cogs before the bot connects to the gateway.
+        
+        Admin commands are owner-only and used for production triage.
+        Playback slash commands are synced so /play and /reciter appear
+        in Discord with their autocomplete.
+        """
+        await self.add_cog(AdminCommands(self))
+        await self.add_cog(PlaybackCommands(self, self.audio_service))
+        
+        try:
+            synced = await self.tree.sync()
+            logger.tree("🌐 Slash Commands Synced", [
+                ("Commands", ", ".join(f"/{command.name}" for command in synced))
+            ])
+        except Exception as e:
+            logger.error_tree("Failed to sync slash commands", e, [
+                ("Commands", "/play, /reciter"),
+                ("Action", "Existing registrations stay in effect")
+            ])
+    
     async def on_ready(self) -> None:
         """
         Event handler for bot ready state.
@@ -183,10 +216,12 @@ class TahaBot(commands.Bot):
     
     async def send_control_panel(self, voice_channel: Union[discord.StageChannel, discord.VoiceChannel]) -> None:
         """
-        Send control panel to the stage channel itself.
+        Show the control panel in the stage channel itself.
         
         Stage channels in Discord can receive text messages directly,
-        so we send the control panel to the stage channel.
+        so the control panel lives in the stage channel. The panel message ID
+        is persisted, so on restart the existing message is edited in place
+        instead of purging the channel and sending a new one.
         
         Args:
             voice_channel: The voice/stage channel bot is connected to
@@ -197,35 +232,41 @@ class TahaBot(commands.Bot):
             if isinstance(voice_channel, discord.StageChannel):
                 # Verify bot has permission to send messages in the stage channel
                 if voice_channel.permissions_for(voice_channel.guild.me).send_messages:
-                    # Clean up any existing messages before sending the control panel
-                    # This ensures a clean interface for users
-                    if voice_channel.permissions_for(voice_channel.guild.me).manage_messages:
-                        try:
-                            logger.tree("🧹 Purging Stage Messages", [
-                        ("Channel", voice_channel.name),
-                        ("Action", "Clearing old messages")
-                    ])
-                            # Delete up to 100 messages to clean the channel
-                            deleted = await voice_channel.purge(limit=100)
-                            logger.tree("✅ Messages Purged", [
-                        ("Channel", voice_channel.name),
-                        ("Messages Deleted", str(len(deleted)))
-                    ])
-                        except Exception as e:
-                            logger.tree("⚠️ Message Purge Failed", [
-                                ("Error", str(e)),
-                                ("Channel", voice_channel.name),
-                                ("Action", "Continuing without purge")
-                            ])
+                    # Only reuse the tracked panel if it lives in this channel
+                    # A panel left behind in another channel becomes stale
+                    message_id: Optional[int] = self.persistence.panel_message_id
+                    panel_channel_id: Optional[int] = self.persistence.panel_channel_id
+                    if message_id and panel_channel_id != voice_channel.id:
+                        if panel_channel_id:
+                            self.persistence.mark_stale(panel_channel_id, message_id)
+                        message_id = None
+                    
+                    # Stop the previous panel instance (e.g. after a reconnect)
+                    if self.control_panel:
+                        self.control_panel.shutdown()
                     
                     # Create the interactive control panel with audio service integration
                     self.control_panel = ControlPanel(self.audio_service, self.user)
                     
-                    # Send the control panel to the stage channel
-                    await self.control_panel.send_panel(voice_channel)
+                    # Register as a persistent view so the stable custom_ids on the
+                    # existing panel message are routed to this instance
+                    self.add_view(self.control_panel, message_id=message_id)
+                    
+                    # Edit the existing panel in place, or send a new one if it's gone
+                    message: discord.Message = await self.control_panel.send_panel(voice_channel, message_id)
                     
-                    # Remember which channel the panel was sent to for future management
+                    # Remember which channel and message hold the panel for future restarts
                     self.panel_channel_id = voice_channel.id
+                    self.persistence.set_panel_message(voice_channel.id, message.id)
+                    self.persistence.save_state(
+                        self.audio_service.resume_surah,
+                        self.audio_service.default_reciter,
+                        force=True,
+                        position=self.audio_service.playback_position
+                    )
+                    
+                    # Delete only the messages we tracked as stale, in bulk per channel
+                    await self.delete_stale_messages()
                     
                     logger.tree("🎛️ Control Panel Sent", [
                         ("Channel", voice_channel.name),
@@ -255,6 +296,95 @@ class TahaBot(commands.Bot):
                 ("Channel Type", type(voice_channel).__name__ if voice_channel else "Unknown")
             ])
     
+    async def delete_stale_messages(self) -> None:
+        """
+        Delete bot-sent messages that were tracked as stale.
+        
+        Messages are grouped by the channel they were sent to, which is
+        not necessarily the one the bot streams to now, and each channel
+        gets a single bulk delete where possible instead of scanning and
+        purging its history.
+        """
+        by_channel: Dict[int, List[int]] = {}
+        for channel_id, message_id in self.persistence.stale_messages:
+            if message_id != self.persistence.panel_message_id:
+                by_channel.setdefault(channel_id, []).append(message_id)
+        if not by_channel:
+            return
+        
+        deleted: List[Tuple[int, int]] = []
+        for channel_id, message_ids in by_channel.items():
+            channel = self.get_channel(channel_id)
+            if channel is None:
+                try:
+                    channel = await self.fetch_channel(channel_id)
+                except discord.NotFound:
+                    # The channel is gone, and its messages with it
+                    deleted.extend((channel_id, m) for m in message_ids)
+                    continue
+                except discord.HTTPException as e:
+                    # Unknown whether the messages still exist; keep them for next time
+                    logger.tree("⚠️ Stale Message Channel Unavailable", [
+                        ("Channel ID", str(channel_id)),
+                        ("Error", str(e)),
+                        ("Action", "Keeping stale messages for the next cleanup")
+                    ])
+                    continue
+            
+            for message_id in await self.delete_channel_messages(channel, message_ids):
+                deleted.append((channel_id, message_id))
+        
+        self.persistence.clear_stale(deleted)
+        self.persistence.save_state(
+            self.audio_service.resume_surah,
+            self.audio_service.default_reciter,
+            force=True,
+            position=self.audio_service.playback_position
+        )
+        logger.tree("🧹 Stale Messages Deleted", [
+            ("Channels", str(len(by_channel))),
+            ("Tracked", str(sum(len(ids) for ids in by_channel.values()))),
+            ("Deleted", str(len(deleted)))
+        ])
+    
+    async def delete_channel_messages(self, channel: discord.abc.Messageable, message_ids: List[int]) -> List[int]:
+        """
+        Delete messages from one channel, in bulk where possible.
+        
+        Args:
+            channel: Channel the messages were sent to
+            message_ids: IDs of the messages to delete
+            
+        Returns:
+            IDs of the messages that are gone (deleted now or already missing)
+        """
+        deleted: List[int] = []
+        try:
+            # Bulk delete accepts up to 100 messages per call
+            for i in range(0, len(message_ids), 100):
+                batch: List[int] = message_ids[i:i + 100]
+                await channel.delete_messages([discord.Object(id=m) for m in batch])
+                deleted.extend(batch)
+        except discord.HTTPException as e:
+            # Bulk delete rejects messages older than 14 days; fall back to single deletes
+            for message_id in message_ids:
+                if message_id in deleted:
+                    continue
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                    deleted.append(message_id)
+                except discord.NotFound:
+                    # The channel exists, so the message really is gone
+                    deleted.append(message_id)
+                except discord.HTTPException:
+                    pass
+            logger.tree("⚠️ Bulk Delete Fell Back", [
+                ("Error", str(e)),
+                ("Channel", getattr(channel, "name", str(channel.id))),
+                ("Action", "Deleted stale messages individually")
+            ])
+        return deleted
+    
     async def on_voice_state_update(
         self, 
         member: discord.Member, 
@@ -306,15 +436,22 @@ class TahaBot(commands.Bot):
         # This ensures the bot resumes from the exact position when restarted
         if self.audio_service:
             self.persistence.save_state(
-                self.audio_service.current_surah,
-                self.audio_service.default_reciter
+                self.audio_service.resume_surah,
+                self.audio_service.default_reciter,
+                force=True,
+                position=self.audio_service.playback_position
             )
         
-        # Stop audio playback and disconnect from voice channel
-        # This ensures clean shutdown of the audio service
+        # Drop queued playback commands, then stop audio playback and
+        # disconnect from voice channel for a clean shutdown of the audio service
+        self.audio_service.commands.shutdown()
         self.audio_service.stop()
         await self.audio_service.disconnect()
         
+        # Flush any journal records still waiting for group commit, now that
+        # the player has stopped and can't append anything else
+        self.persistence.journal.close()
+        
         # Close the Discord bot connection
         # This terminates the bot's connection to Discord servers
         await self.close()
@@ -11,6 +11,7 @@ Components:
 - Config: Configuration management with environment variable support
 - get_config: Configuration factory function with validation
 - logger: Structured logging system with tree-style output and EST timezone
+- tracer: Interaction-to-audio latency tracing with per-phase histograms
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
@@ -19,9 +20,13 @@ Version: v1.0.0
 
 from .config import Config, get_config
 from .logger import logger
+from .tracing import Trace, Tracer, tracer
 
 __all__ = [
     "Config",
     "get_config",
     "logger",
+    "Trace",
+    "Tracer",
+    "tracer",
 ]
\ No newline at end of file
@@ -0,0 +1,415 @@
+"""
+QuranBot - Playback Journal
+===========================
+
+Append-only binary journal of playback events for crash forensics and
+exact resume. Every track start, end, skip, reciter change, pause, resume
+and reconnect is appended as a small fixed-header record instead of
+rewriting the whole state file.
+
+Record Layout (little-endian):
+- Header: event type (B), unix timestamp (d), surah (H), payload length (H), CRC32 (I)
+- Payload: optional UTF-8 bytes (reciter name for reciter changes and snapshots)
+
+Durability:
+- Records are buffered and fsync'd in groups (group commit)
+- A commit happens every N records or after a maximum delay
+- Commits run on a background writer thread, never on the caller's thread
+- Replay stops at the first torn or corrupted record
+
+Compaction:
+- When the journal grows past its size limit it is rewritten as a single
+  snapshot record describing the current state
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Any, Optional, BinaryIO, Iterator, Tuple
+
+from src.core.logger import logger
+
+
+# EVENT TYPES
+# ===========
+# One byte per event type keeps records compact
+EVENT_SNAPSHOT: int = 0
+EVENT_TRACK_START: int = 1
+EVENT_TRACK_END: int = 2
+EVENT_SKIP: int = 3
+EVENT_RECITER_CHANGE: int = 4
+EVENT_PAUSE: int = 5
+EVENT_RESUME: int = 6
+EVENT_RECONNECT: int = 7
+
+# Human-readable event names for logging and forensics
+EVENT_NAMES: Dict[int, str] = {
+    EVENT_SNAPSHOT: "snapshot",
+    EVENT_TRACK_START: "track_start",
+    EVENT_TRACK_END: "track_end",
+    EVENT_SKIP: "skip",
+    EVENT_RECITER_CHANGE: "reciter_change",
+    EVENT_PAUSE: "pause",
+    EVENT_RESUME: "resume",
+    EVENT_RECONNECT: "reconnect",
+}
+
+# Fixed record header: type, timestamp, surah, payload length, crc32
+_HEADER: struct.Struct = struct.Struct("<BdHHI")
+
+
+class PlaybackJournal:
+    """
+    Append-only playback event journal with group commit and compaction.
+
+    Appends are cheap buffered writes; fsync is batched so a burst of events
+    costs a single disk flush, and it happens on a writer thread so the
+    event loop never waits for the disk. The journal is safe to append to
+    from the voice player thread (playback-finished callbacks) and the
+    event loop.
+
+    Attributes:
+        journal_file: Path to the binary journal file
+        commit_every: Number of records that triggers a group commit
+        commit_delay: Maximum seconds a record may stay uncommitted
+        max_bytes: Journal size that triggers compaction
+    """
+
+    def __init__(
+        self,
+        journal_file: str = "playback.journal",
+        commit_every: int = 16,
+        commit_delay: float = 5.0,
+        max_bytes: int = 256 * 1024
+    ) -> None:
+        """
+        Initialize the playback journal.
+
+        Args:
+            journal_file: Name of the journal file in the project root
+            commit_every: Records per group commit
+            commit_delay: Maximum seconds between commits while records are pending
+            max_bytes: Size in bytes after which the journal is compacted
+        """
+        # Store journal next to the state file in the project root
+        # Navigate from src/core/ to project root
+        self.journal_file: Path = Path(__file__).parent.parent.parent / journal_file
+
+        # Group commit policy
+        self.commit_every: int = commit_every
+        self.commit_delay: float = commit_delay
+
+        # Compaction threshold keeps the file bounded on 24/7 deployments
+        self.max_bytes: int = max_bytes
+
+        # Appends may come from the voice player thread, so guard the handle
+        self._lock: threading.Lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        
+        # Held for a whole commit, compaction or close; taken before _lock.
+        # The fsync itself runs outside _lock so appends never wait for it.
+        self._commit_lock: threading.Lock = threading.Lock()
+        
+        # Writer thread that group-commits pending records, started on first append
+        self._wakeup: threading.Condition = threading.Condition(self._lock)
+        self._writer: Optional[threading.Thread] = None
+
+        # Records written but not yet fsync'd, and when the oldest was written
+        self._pending: int = 0
+        self._oldest_pending: float = 0.0
+
+        # State rebuilt from replay and kept current by every append
+        # This is what gets written as a snapshot during compaction
+        self.state: Dict[str, Any] = {}
+
+    def replay(self) -> Dict[str, Any]:
+        """
+        Rebuild playback state from the last snapshot and the events after it.
+
+        Returns:
+            Dictionary with 'current_surah', 'reciter' and 'last_event' keys,
+            or an empty dict if the journal is missing or empty
+        """
+        state: Dict[str, Any] = {}
+        events: int = 0
+
+        try:
+            if not self.journal_file.exists():
+                logger.tree("ℹ️ No Playback Journal Found", [
+                    ("File", str(self.journal_file)),
+                    ("Action", "Starting fresh journal")
+                ])
+                return {}
+
+            for event, timestamp, surah, payload in self._read_records():
+                # A snapshot resets state; everything before it is irrelevant
+                if event == EVENT_SNAPSHOT:
+                    state = {}
+                    events = 0
+                self._apply(state, event, timestamp, surah, payload)
+                events += 1
+
+            self.state = dict(state)
+
+            if state:
+                logger.tree("📂 Playback Journal Replayed", [
+                    ("File", str(self.journal_file)),
+                    ("Events Since Snapshot", str(events)),
+                    ("Resume Surah", str(state.get("current_surah", "Unknown"))),
+                    ("Reciter", state.get("reciter", "Unknown")),
+                    ("Last Event", EVENT_NAMES.get(state.get("last_event", -1), "unknown"))
+                ])
+            return state
+
+        except Exception as e:
+            logger.error_tree("Failed to replay playback journal", e, [
+                ("File", str(self.journal_file)),
+                ("Events Read", str(events)),
+                ("Action", "Using state replayed so far")
+            ])
+            self.state = dict(state)
+            return state
+
+    def record(self, event: int, surah: int = 0, reciter: Optional[str] = None) -> None:
+        """
+        Append a playback event to the journal.
+
+        Args:
+            event: One of the EVENT_* constants
+            surah: Surah number the event refers to (0 if not applicable)
+            reciter: Reciter name for reciter changes and snapshots
+        """
+        timestamp: float = time.time()
+        payload: bytes = reciter.encode("utf-8") if reciter else b""
+
+        try:
+            with self._lock:
+                self._apply(self.state, event, timestamp, surah, payload)
+                handle = self._open()
+                handle.write(self._encode(event, timestamp, surah, payload))
+
+                if self._pending == 0:
+                    self._oldest_pending = timestamp
+                self._pending += 1
+
+                # Group commit happens on the writer thread: once per batch,
+                # or once the oldest record is commit_delay old
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._writer_loop, name="journal-writer", daemon=True)
+                    self._writer.start()
+                if self._pending == 1 or self._pending >= self.commit_every:
+                    self._wakeup.notify()
+
+        except Exception as e:
+            logger.error_tree("Failed to append journal record", e, [
+                ("Event", EVENT_NAMES.get(event, str(event))),
+                ("Surah", str(surah)),
+                ("File", str(self.journal_file))
+            ])
+
+    def commit(self) -> None:
+        """Flush and fsync any pending records (blocks on disk I/O)."""
+        try:
+            with self._commit_lock:
+                self._commit()
+        except Exception as e:
+            logger.error_tree("Failed to commit playback journal", e, [
+                ("Pending Records", str(self._pending)),
+                ("File", str(self.journal_file))
+            ])
+
+    def maybe_compact(self) -> bool:
+        """
+        Compact the journal into a single snapshot if it exceeds its size limit.
+
+        Blocks on disk I/O, so async callers should run it in a thread.
+
+        Returns:
+            True if the journal was compacted, False otherwise
+        """
+        try:
+            if not self.journal_file.exists() or self.journal_file.stat().st_size < self.max_bytes:
+                return False
+            return self.compact()
+        except Exception as e:
+            logger.error_tree("Failed to check journal size", e, [
+                ("File", str(self.journal_file))
+            ])
+            return False
+
+    def compact(self) -> bool:
+        """
+        Rewrite the journal as a single snapshot of the current state.
+
+        The snapshot is written to a temporary file, fsync'd and atomically
+        renamed over the journal so a crash mid-compaction never loses state.
+
+        Returns:
+            True if compaction succeeded, False otherwise
+        """
+        temp_file: Path = self.journal_file.with_suffix(".journal.tmp")
+
+        try:
+            with self._commit_lock, self._lock:
+                self._commit_locked()
+                old_size: int = self.journal_file.stat().st_size if self.journal_file.exists() else 0
+
+                snapshot: bytes = self._encode(
+                    EVENT_SNAPSHOT,
+                    time.time(),
+                    int(self.state.get("current_surah", 0)),
+                    str(self.state.get("reciter", "")).encode("utf-8")
+                )
+                with open(temp_file, "wb") as f:
+                    f.write(snapshot)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                # Close the live handle before swapping files underneath it
+                if self._file:
+                    self._file.close()
+                    self._file = None
+                os.replace(temp_file, self.journal_file)
+
+            logger.tree("🧹 Playback Journal Compacted", [
+                ("File", str(self.journal_file)),
+                ("Size Before", f"{old_size} bytes"),
+                ("Size After", f"{len(snapshot)} bytes")
+            ])
+            return True
+
+        except Exception as e:
+            logger.error_tree("Failed to compact playback journal", e, [
+                ("File", str(self.journal_file)),
+                ("Temp File", str(temp_file))
+            ])
+            return False
+
+    def close(self) -> None:
+        """Commit pending records and close the journal file."""
+        try:
+            with self._commit_lock, self._lock:
+                self._commit_locked()
+                if self._file:
+                    self._file.close()
+                    self._file = None
+        except Exception as e:
+            logger.error_tree("Failed to close playback journal", e, [
+                ("File", str(self.journal_file))
+            ])
+
+    def _open(self) -> BinaryIO:
+        """Open the journal for appending if it isn't already open."""
+        if self._file is None:
+            self._file = open(self.journal_file, "ab")
+        return self._file
+
+    def _writer_loop(self) -> None:
+        """Group-commit pending records until the process exits."""
+        while True:
+            with self._lock:
+                # Sleep until there is something to commit and it is due
+                while True:
+                    if self._pending >= self.commit_every:
+                        break
+                    if self._pending:
+                        remaining: float = self._oldest_pending + self.commit_delay - time.time()
+                        if remaining <= 0:
+                            break
+                        self._wakeup.wait(remaining)
+                    else:
+                        self._wakeup.wait()
+
+            try:
+                with self._commit_lock:
+                    self._commit()
+            except Exception as e:
+                logger.error_tree("Failed to commit playback journal", e, [
+                    ("Pending Records", str(self._pending)),
+                    ("File", str(self.journal_file))
+                ], throttle=True)
+                # Don't spin on a failing disk; retry after the next delay
+                time.sleep(self.commit_delay)
+
+    def _commit(self) -> None:
+        """
+        Flush pending records and fsync them without holding the append lock.
+
+        Caller must hold the commit lock, which keeps compaction and close
+        from swapping the file out from under the fsync.
+        """
+        with self._lock:
+            handle: Optional[BinaryIO] = self._file if self._pending else None
+            if handle:
+                handle.flush()
+            self._pending = 0
+        if handle:
+            os.fsync(handle.fileno())
+
+    def _commit_locked(self) -> None:
+        """Flush and fsync pending records. Caller must hold both locks."""
+        if self._file and self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def _encode(self, event: int, timestamp: float, surah: int, payload: bytes) -> bytes:
+        """Encode a single record with its CRC32 over header fields and payload."""
+        crc: int = zlib.crc32(struct.pack("<BdHH", event, timestamp, surah, len(payload)) + payload)
+        return _HEADER.pack(event, timestamp, surah, len(payload), crc) + payload
+
+    def _read_records(self) -> Iterator[Tuple[int, float, int, bytes]]:
+        """
+        Yield decoded records, stopping at the first torn or corrupted one.
+
+        Yields:
+            Tuples of (event, timestamp, surah, payload)
+        """
+        data: bytes = self.journal_file.read_bytes()
+        offset: int = 0
+
+        while offset + _HEADER.size <= len(data):
+            event, timestamp, surah, length, crc = _HEADER.unpack_from(data, offset)
+            end: int = offset + _HEADER.size + length
+            if end > len(data):
+                break
+
+            payload: bytes = data[offset + _HEADER.size:end]
+            if zlib.crc32(struct.pack("<BdHH", event, timestamp, surah, length) + payload) != crc:
+                logger.tree("⚠️ Corrupted Journal Record", [
+                    ("Offset", str(offset)),
+                    ("Action", "Stopping replay at last good record")
+                ])
+                break
+
+            yield event, timestamp, surah, payload
+            offset = end
+
+    def _apply(self, state: Dict[str, Any], event: int, timestamp: float, surah: int, payload: bytes) -> None:
+        """
+        Apply a single event to a state dictionary.
+
+        The resulting 'current_surah' is always the surah to resume with:
+        an interrupted track is replayed, a finished one advances.
+        """
+        if event == EVENT_SNAPSHOT:
+            if surah:
+                state["current_surah"] = surah
+            if payload:
+                state["reciter"] = payload.decode("utf-8", errors="replace")
+        elif event in (EVENT_TRACK_START, EVENT_SKIP):
+            state["current_surah"] = surah
+        elif event == EVENT_TRACK_END:
+            state["current_surah"] = (surah % 114) + 1
+        elif event == EVENT_RECITER_CHANGE and payload:
+            state["reciter"] = payload.decode("utf-8", errors="replace")
+
+        state["last_event"] = event
+        state["last_event_time"] = timestamp
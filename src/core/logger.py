@@ -12,17 +12,60 @@ Features:
 - Tree-style log formatting for structured data
 - Console and file output simultaneously
 - Emoji-enhanced log levels for visual clarity
+- Non-blocking: records are queued and written by a dedicated writer thread
+- Rotation at local midnight and per-file size cap, gzip in the background
+- Continuous 30-day retention for long-running instances
+- Log levels with separate console/file thresholds and lazily built trees
+- Optional JSON Lines sink and an in-memory ring buffer of recent records
+- Rate-limited error trees for retry loops, with periodic repeat summaries
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 Version: v1.0.0
 """
 
+import atexit
+import gzip
+import json
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+import unicodedata
 import uuid
 import os
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import List, Tuple, Optional
+from collections import deque
+from typing import List, Tuple, Optional, TextIO, Union, Callable, Dict, Any, Deque
+
+
+# LOG LEVELS
+# ==========
+# Same numeric values as the standard library so they compare naturally
+DEBUG: int = 10
+INFO: int = 20
+WARNING: int = 30
+ERROR: int = 40
+
+# Level names accepted in the LOG_CONSOLE_LEVEL / LOG_FILE_LEVEL environment variables
+LEVEL_NAMES: Dict[str, int] = {
+    "DEBUG": DEBUG,
+    "INFO": INFO,
+    "WARNING": WARNING,
+    "ERROR": ERROR,
+}
+
+# Tree items may be passed directly or as a callable that builds them on demand
+TreeItems = Union[List[Tuple[str, str]], Callable[[], List[Tuple[str, str]]]]
+
+# Leading emoji/punctuation stripped from titles to form JSON event names
+_EVENT_PREFIX = re.compile(r'^\W+')
+
+# Field values that look like integers are stored as numbers in JSON records
+_INT_VALUE = re.compile(r'^-?\d+$')
 
 
 class MiniTreeLogger:
@@ -36,39 +79,530 @@ class MiniTreeLogger:
     - Simultaneous console and file output
     - Emoji-enhanced log levels for visual clarity
     
-    Log files are stored in logs/ directory with daily rotation.
+    Log files are stored in logs/ directory with daily rotation. The active
+    file is logs/<date>.log; it rotates at local midnight or when it reaches
+    MAX_BYTES (size-rotated parts become logs/<date>.<n>.log). Rotated files
+    are gzip-compressed on a background thread and retention is enforced on
+    every rotation and hourly, so disk usage stays bounded on 24/7 runs.
+    
+    Logging calls never touch the console or disk directly: they format the
+    record and put it on a bounded queue. A dedicated writer thread drains
+    the queue into a single open, buffered file handle, so a slow disk can
+    never stall the asyncio event loop (and with it voice packet scheduling).
+    
+    Overflow policy: when the queue is full, new records are dropped and
+    counted; the writer reports how many were lost once it catches up.
+    
+    Levels: console and file each have a minimum level (LOG_CONSOLE_LEVEL and
+    LOG_FILE_LEVEL, default DEBUG). Records below both thresholds are rejected
+    before any formatting, and tree items can be passed as a callable so the
+    list of tuples is only built when the tree will actually be written.
+    
+    Structured records: every record is also kept as a small dict (run_id,
+    timestamp, level, event name, typed fields) in a fixed-size ring buffer
+    that can be dumped instantly with recent(). Setting LOG_JSON=1 also
+    writes those records to logs/<date>.jsonl alongside the text log.
     """
     
+    # Number of recent records kept in memory for instant triage
+    RING_SIZE: int = 1000
+    
+    # Throttled error trees: each call site + exception type gets a token
+    # bucket of ERROR_BURST trees refilled over ERROR_WINDOW seconds;
+    # anything beyond that is counted and summarized once per window
+    ERROR_BURST: int = 3
+    ERROR_WINDOW: float = 60.0
+    
+    # Level constants exposed on the instance for convenience (logger.DEBUG)
+    DEBUG: int = DEBUG
+    INFO: int = INFO
+    WARNING: int = WARNING
+    ERROR: int = ERROR
+    
+    # Maximum number of records waiting for the writer thread
+    QUEUE_SIZE: int = 10000
+    
+    # Seconds between periodic flushes of the buffered file handle
+    FLUSH_INTERVAL: float = 1.0
+    
+    # Maximum size of a single log file before it is rotated
+    MAX_BYTES: int = 50 * 1024 * 1024
+    
+    # Log files (plain or compressed) older than this many days are deleted
+    RETENTION_DAYS: int = 30
+    
+    # Seconds between retention sweeps on a long-running instance
+    RETENTION_INTERVAL: float = 3600.0
+    
     def __init__(self) -> None:
         """
         Initialize the logger with unique run ID and daily log file rotation.
         
         Creates logs directory if it doesn't exist and generates a unique
-        run ID for tracking this bot session. Also cleans up old log files.
+        run ID for tracking this bot session. Also cleans up old log files
+        and starts the background writer thread.
         """
         self.run_id: str = str(uuid.uuid4())[:8]  # Short unique ID for this run
-        self.log_file: Path = Path('logs') / f'{datetime.now().strftime("%Y-%m-%d")}.log'
-        self.log_file.parent.mkdir(exist_ok=True)
         
-        # Clean up old log files on startup
-        self._cleanup_old_logs()
+        # Per-sink minimum levels, configurable via environment variables
+        # e.g. LOG_CONSOLE_LEVEL=WARNING keeps the console quiet in production
+        self.console_level: int = self._parse_level(os.getenv("LOG_CONSOLE_LEVEL"), DEBUG)
+        self.file_level: int = self._parse_level(os.getenv("LOG_FILE_LEVEL"), DEBUG)
+        
+        # Optional JSON Lines sink for machine-readable logs (off by default)
+        self.json_enabled: bool = os.getenv("LOG_JSON", "").strip().lower() in ("1", "true", "yes", "on")
+        self.json_level: int = self._parse_level(os.getenv("LOG_JSON_LEVEL"), DEBUG)
+        
+        # Ring buffer of recent structured records; deque appends are thread-safe
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=self.RING_SIZE)
+        
+        # Token buckets for throttled error trees, keyed by (file, line, error type)
+        # Each entry is [tokens, last_refill, suppressed, window_start, title]
+        self._throttle: Dict[Tuple[str, int, str], List[Any]] = {}
+        self._throttle_lock: threading.Lock = threading.Lock()
+        
+        self.log_dir: Path = Path('logs')
+        self.log_dir.mkdir(exist_ok=True)
+        
+        # Date the active log file belongs to; checked on every write for midnight rotation
+        self._log_date: str = datetime.now().strftime("%Y-%m-%d")
+        self.log_file: Path = self.log_dir / f'{self._log_date}.log'
+        
+        # Bytes in the active log files, tracked to enforce MAX_BYTES without stat calls
+        self._file_bytes: int = 0
+        self._json_bytes: int = 0
+        
+        # Serializes background compression/retention runs
+        self._maintenance_lock: threading.Lock = threading.Lock()
+        
+        # Held while the active log paths change, so maintenance never mistakes
+        # a file that became active mid-sweep for a rotated one
+        self._rotation_lock: threading.Lock = threading.Lock()
+        
+        # WRITER THREAD SETUP
+        # ===================
+        # Records are (console_text, file_text, json_record) tuples; any part may be None
+        # A threading.Event is a flush marker and None tells the writer to stop
+        self._queue: "queue.Queue[Union[Tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]], threading.Event, None]]" = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._dropped: int = 0
+        self._dropped_lock: threading.Lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._json_file: Optional[TextIO] = None
+        self._closed: bool = False
+        self._writer: threading.Thread = threading.Thread(
+            target=self._writer_loop,
+            name="MiniTreeLogger-writer",
+            daemon=True
+        )
+        self._writer.start()
+        
+        # Make sure queued records reach the disk on interpreter exit
+        atexit.register(self.shutdown)
+        
+        # Compress files left over from previous days and enforce retention
+        # in the background so startup never waits on disk I/O
+        self._last_retention: float = time.monotonic()
+        self._start_maintenance()
         
         # Write session start header with run ID
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(f"\n{'='*60}\n")
-            f.write(f"NEW SESSION STARTED - RUN ID: {self.run_id}\n")
-            f.write(f"{self._get_timestamp()}\n")
-            f.write(f"{'='*60}\n\n")
+        self._enqueue(None, (
+            f"\n{'='*60}\n"
+            f"NEW SESSION STARTED - RUN ID: {self.run_id}\n"
+            f"{self._get_timestamp()}\n"
+            f"{'='*60}\n\n"
+        ))
+    
+    @staticmethod
+    def _parse_level(value: Optional[str], default: int) -> int:
+        """
+        Parse a level name (or number) from configuration.
+        
+        Args:
+            value: Level name like "WARNING", a number, or None
+            default: Level to use when value is missing or invalid
+            
+        Returns:
+            int: The numeric level
+        """
+        if not value:
+            return default
+        value = value.strip().upper()
+        if value.isdigit():
+            return int(value)
+        return LEVEL_NAMES.get(value, default)
+    
+    def set_levels(self, console: Optional[int] = None, file: Optional[int] = None) -> None:
+        """
+        Change the minimum level of the console and/or file sink at runtime.
+        
+        Args:
+            console: New console level (None to leave unchanged)
+            file: New file level (None to leave unchanged)
+        """
+        if console is not None:
+            self.console_level = console
+        if file is not None:
+            self.file_level = file
+    
+    def enabled_for(self, level: int) -> bool:
+        """
+        Cheap check whether a record at this level would reach any sink.
+        
+        Use it to guard expensive log preparation on hot paths.
+        
+        Args:
+            level: Level of the record
+            
+        Returns:
+            bool: True if the console, the file or the JSON sink would receive the record
+        """
+        return (
+            level >= self.console_level
+            or level >= self.file_level
+            or (self.json_enabled and level >= self.json_level)
+        )
+    
+    def recent(self, limit: Optional[int] = None, min_level: int = DEBUG) -> List[Dict[str, Any]]:
+        """
+        Return the most recent structured records from the ring buffer.
+        
+        Args:
+            limit: Maximum number of records (newest last); None for all
+            min_level: Only include records at or above this level
+            
+        Returns:
+            List[Dict[str, Any]]: Copies of the matching records
+        """
+        records: List[Dict[str, Any]] = [r for r in list(self._recent) if r["level_no"] >= min_level]
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return [dict(r) for r in records]
+    
+    def _structured(self, level: int, title: str, items: Optional[List[Tuple[str, Any]]]) -> Dict[str, Any]:
+        """
+        Build the structured form of a record and remember it in the ring buffer.
+        
+        Args:
+            level: Level of the record
+            title: Tree title or log message
+            items: Tree items as (key, value) tuples, if any
+            
+        Returns:
+            Dict[str, Any]: The structured record
+        """
+        fields: Dict[str, Any] = {}
+        for key, value in items or ():
+            if isinstance(value, str) and _INT_VALUE.match(value):
+                value = int(value)
+            elif not isinstance(value, (str, int, float, bool, type(None))):
+                value = str(value)
+            fields[str(key)] = value
+        
+        record: Dict[str, Any] = {
+            "ts": time.time(),
+            "run_id": self.run_id,
+            "level": logging_level_name(level),
+            "level_no": level,
+            "event": _EVENT_PREFIX.sub('', title) or title,
+            "fields": fields,
+        }
+        self._recent.append(record)
+        return record
+    
+    def _enqueue(
+        self,
+        console_text: Optional[str],
+        file_text: Optional[str],
+        json_record: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Hand a preformatted record to the writer thread without blocking.
+        
+        Args:
+            console_text: Text to print to the console (None to skip)
+            file_text: Text to append to the log file, including newlines (None to skip)
+            json_record: Structured record for the JSON sink (None to skip)
+        """
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait((console_text, file_text, json_record))
+        except queue.Full:
+            # Overflow policy: drop the newest record and count it
+            with self._dropped_lock:
+                self._dropped += 1
+    
+    def _writer_loop(self) -> None:
+        """
+        Drain the queue into the console and a single open log file.
+        
+        Runs on the dedicated writer thread until a stop sentinel arrives.
+        """
+        last_flush: float = time.monotonic()
+        
+        while True:
+            try:
+                record = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                record = False
+            
+            try:
+                if record is None:
+                    # Stop sentinel: flush everything and close the files
+                    self._flush_file()
+                    self._close_files()
+                    return
+                
+                if isinstance(record, threading.Event):
+                    # Flush marker: everything queued before it has been written
+                    self._flush_file()
+                    record.set()
+                    continue
+                
+                if record:
+                    self._report_dropped()
+                    console_text, file_text, json_record = record
+                    if console_text is not None:
+                        print(console_text)
+                    if file_text is not None:
+                        self._write_file(file_text)
+                    if json_record is not None:
+                        self._write_json(json_record)
+                
+                # Periodic flush keeps the file at most FLUSH_INTERVAL behind
+                if time.monotonic() - last_flush >= self.FLUSH_INTERVAL:
+                    self._summarize_throttled()
+                    self._flush_file()
+                    last_flush = time.monotonic()
+                
+                # Hourly retention sweep so a process running for weeks
+                # still deletes files that age past RETENTION_DAYS
+                if time.monotonic() - self._last_retention >= self.RETENTION_INTERVAL:
+                    self._last_retention = time.monotonic()
+                    self._start_maintenance()
+                    
+            except Exception as e:
+                # Never let a logging failure kill the writer thread
+                print(f"[LOG WRITER ERROR] {e}")
+    
+    def _open_file(self) -> TextIO:
+        """Open the log file once and keep the buffered handle."""
+        if self._file is None:
+            self._file = open(self.log_file, 'a', encoding='utf-8')
+            self._file_bytes = self.log_file.stat().st_size
+        return self._file
+    
+    def _open_json_file(self) -> TextIO:
+        """Open the JSON Lines file for the active log date once and keep the handle."""
+        if self._json_file is None:
+            json_path: Path = self.log_file.with_suffix('.jsonl')
+            self._json_file = open(json_path, 'a', encoding='utf-8')
+            self._json_bytes = json_path.stat().st_size
+        return self._json_file
+    
+    def _close_files(self) -> None:
+        """Close the text and JSON log handles if open."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._json_file:
+            self._json_file.close()
+            self._json_file = None
+    
+    def _check_rotation(self) -> None:
+        """Rotate when the local date changed or a log file hit MAX_BYTES."""
+        today: str = datetime.now().strftime("%Y-%m-%d")
+        if today != self._log_date:
+            self._rotate(today)
+        elif self._file_bytes >= self.MAX_BYTES or self._json_bytes >= self.MAX_BYTES:
+            self._rotate(today)
+    
+    def _write_file(self, text: str) -> None:
+        """
+        Append text to the active log file, rotating first if needed.
+        
+        Runs on the writer thread only.
+        
+        Args:
+            text: Text to append, including newlines
+        """
+        self._check_rotation()
+        self._open_file().write(text)
+        self._file_bytes += len(text.encode('utf-8'))
+    
+    def _write_json(self, record: Dict[str, Any]) -> None:
+        """
+        Append a structured record to the JSON Lines file, rotating first if needed.
+        
+        Runs on the writer thread only.
+        
+        Args:
+            record: The structured record
+        """
+        self._check_rotation()
+        line: str = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        self._open_json_file().write(line)
+        self._json_bytes += len(line.encode('utf-8'))
+    
+    def _rotate(self, today: str) -> None:
+        """
+        Close the active log file and switch to a new one.
+        
+        On a date change the previous day's file is left as-is; on a size
+        rotation within the same day it is renamed to the next free
+        <date>.<n>.log part. Either way the closed file is compressed in
+        the background.
+        
+        Args:
+            today: Current local date (YYYY-MM-DD)
+        """
+        self._close_files()
+        
+        with self._rotation_lock:
+            if today == self._log_date:
+                part: int = 1
+                while any((self.log_dir / f'{self._log_date}.{part}{ext}').exists()
+                          for ext in ('.log', '.log.gz', '.jsonl', '.jsonl.gz')):
+                    part += 1
+                for ext in ('.log', '.jsonl'):
+                    current: Path = self.log_dir / f'{self._log_date}{ext}'
+                    if current.exists():
+                        current.rename(self.log_dir / f'{self._log_date}.{part}{ext}')
+            
+            self._log_date = today
+            self.log_file = self.log_dir / f'{today}.log'
+            self._file_bytes = 0
+            self._json_bytes = 0
+        
+        self._start_maintenance()
+    
+    def _start_maintenance(self) -> None:
+        """Compress rotated logs and enforce retention on a background thread."""
+        threading.Thread(
+            target=self._maintain_logs,
+            name="MiniTreeLogger-maintenance",
+            daemon=True
+        ).start()
+    
+    def _maintain_logs(self) -> None:
+        """
+        Gzip every inactive .log file and delete files past retention.
+        
+        Runs on a short-lived background thread; the active file is never touched.
+        A rotation can happen mid-sweep, so each file is checked against the
+        active paths right before it is compressed or deleted.
+        """
+        try:
+            with self._maintenance_lock:
+                for pattern in ('*.log', '*.jsonl'):
+                    for log_file in sorted(self.log_dir.glob(pattern)):
+                        if self._is_active(log_file):
+                            continue
+                        self._compress(log_file)
+                self._cleanup_old_logs()
+        except Exception as e:
+            print(f"[LOG MAINTENANCE ERROR] {e}")
+    
+    def _is_active(self, log_file: Path) -> bool:
+        """
+        Check whether a file is one the writer thread is currently writing.
+        
+        Args:
+            log_file: Path found in the log directory
+            
+        Returns:
+            True for the active .log or .jsonl file
+        """
+        # An inactive file never becomes active again, so once this returns
+        # False the file is safe to compress or delete
+        with self._rotation_lock:
+            return log_file in (self.log_file, self.log_file.with_suffix('.jsonl'))
+    
+    def _compress(self, log_file: Path) -> None:
+        """
+        Gzip a rotated log file and remove the original.
+        
+        Writes to a temporary file first so an interrupted compression
+        never leaves a truncated .gz next to a deleted original.
+        
+        Args:
+            log_file: Path of the rotated .log file
+        """
+        target: Path = log_file.with_name(log_file.name + '.gz')
+        temp: Path = log_file.with_name(log_file.name + '.gz.tmp')
+        with open(log_file, 'rb') as src, gzip.open(temp, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        
+        # Preserve the original modification time so retention still applies correctly
+        stat = log_file.stat()
+        os.utime(temp, (stat.st_atime, stat.st_mtime))
+        os.replace(temp, target)
+        log_file.unlink()
+    
+    def _flush_file(self) -> None:
+        """Flush the buffered file handles if they are open."""
+        if self._file:
+            self._file.flush()
+        if self._json_file:
+            self._json_file.flush()
+    
+    def _report_dropped(self) -> None:
+        """Write a notice for records dropped due to queue overflow."""
+        if not self._dropped:
+            return
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        notice: str = f"{self._get_timestamp()} ⚠️ [LOG OVERFLOW] Dropped {dropped} log records (queue full)"
+        print(notice)
+        self._open_file().write(f"{notice}\n")
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Block until every record queued so far has been written and flushed.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the writer caught up within the timeout, False otherwise
+        """
+        if self._closed or not self._writer.is_alive():
+            return False
+        marker: threading.Event = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+    
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Flush all queued records, close the log file and stop the writer thread.
+        
+        Safe to call more than once; also registered with atexit.
+        
+        Args:
+            timeout: Maximum seconds to wait for the writer to finish
+        """
+        if self._closed:
+            return
+        self._summarize_throttled(force=True)
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+            self._writer.join(timeout)
+        except queue.Full:
+            pass
     
     def _cleanup_old_logs(self) -> None:
         """
-        Clean up log files older than 30 days.
+        Clean up log files older than RETENTION_DAYS.
         
-        Automatically removes old log files to prevent disk space issues.
-        Runs on bot startup to keep logs directory clean.
+        Automatically removes old log files (plain and compressed) to prevent
+        disk space issues. Runs at startup, on every rotation and hourly.
         """
         try:
-            logs_dir = Path('logs')
+            logs_dir = self.log_dir
             if not logs_dir.exists():
                 return
             
@@ -77,18 +611,23 @@ class MiniTreeLogger:
             
             # Check each log file
             deleted_count = 0
-            for log_file in logs_dir.glob('*.log'):
-                # Get file modification time
-                file_time = datetime.fromtimestamp(os.path.getmtime(log_file))
-                
-                # If file is older than 30 days, delete it
-                if (now - file_time).days > 30:
-                    log_file.unlink()
-                    deleted_count += 1
+            for pattern in ('*.log', '*.log.gz', '*.jsonl', '*.jsonl.gz'):
+                for log_file in logs_dir.glob(pattern):
+                    # Never delete the files currently being written
+                    if self._is_active(log_file):
+                        continue
+                    
+                    # Get file modification time
+                    file_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+                    
+                    # If file is older than the retention window, delete it
+                    if (now - file_time).days > self.RETENTION_DAYS:
+                        log_file.unlink()
+                        deleted_count += 1
             
-            # Log cleanup results (but don't use self._write since it's not initialized yet)
+            # Log cleanup results through the queue like any other record
             if deleted_count > 0:
-                print(f"[LOG CLEANUP] Deleted {deleted_count} old log files (>30 days)")
+                self.info(f"[LOG CLEANUP] Deleted {deleted_count} old log files (>{self.RETENTION_DAYS} days)")
                 
         except Exception as e:
             print(f"[LOG CLEANUP ERROR] Failed to clean old logs: {e}")
@@ -107,7 +646,7 @@ class MiniTreeLogger:
         tz_name = "EDT" if current_time.month >= 3 and current_time.month <= 11 else "EST"
         return current_time.strftime(f'[%I:%M:%S %p {tz_name}]')
     
-    def _write(self, message: str, emoji: str = "", include_timestamp: bool = True) -> None:
+    def _write(self, message: str, emoji: str = "", include_timestamp: bool = True, level: int = INFO) -> None:
         """
         Write log message to both console and file.
         
@@ -115,21 +654,39 @@ class MiniTreeLogger:
             message (str): The log message to write
             emoji (str): Optional emoji to prefix the message
             include_timestamp (bool): Whether to include timestamp
+            level (int): Level of the message
         """
-        if include_timestamp:
-            timestamp: str = self._get_timestamp()
-            full_message: str = f"{timestamp} {emoji} {message}" if emoji else f"{timestamp} {message}"
-        else:
-            full_message: str = f"{emoji} {message}" if emoji else message
+        if not self.enabled_for(level):
+            return
+        
+        full_message: str = self._format(message, emoji, include_timestamp)
+        record: Dict[str, Any] = self._structured(level, message, None)
         
-        # Output to console
-        print(full_message)
+        # Queue for console and log file (without RUN ID on every line)
+        self._enqueue(
+            full_message if level >= self.console_level else None,
+            f"{full_message}\n" if level >= self.file_level else None,
+            record if self.json_enabled and level >= self.json_level else None
+        )
+    
+    def _format(self, message: str, emoji: str = "", include_timestamp: bool = True) -> str:
+        """
+        Format a single log line.
         
-        # Write to log file (without RUN ID on every line)
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(f"{full_message}\n")
+        Args:
+            message (str): The log message
+            emoji (str): Optional emoji to prefix the message
+            include_timestamp (bool): Whether to include timestamp
+            
+        Returns:
+            str: The formatted line
+        """
+        if include_timestamp:
+            timestamp: str = self._get_timestamp()
+            return f"{timestamp} {emoji} {message}" if emoji else f"{timestamp} {message}"
+        return f"{emoji} {message}" if emoji else message
     
-    def tree(self, title: str, items: List[Tuple[str, str]], emoji: str = "📦") -> None:
+    def tree(self, title: str, items: TreeItems, emoji: str = "📦", level: int = INFO) -> None:
         """
         Log structured data in tree format.
         
@@ -138,25 +695,55 @@ class MiniTreeLogger:
         
         Args:
             title (str): Main title for the tree
-            items (List[Tuple[str, str]]): List of (key, value) tuples to display
+            items (TreeItems): List of (key, value) tuples to display, or a
+                callable returning that list (only called if the level is enabled)
             emoji (str): Emoji to prefix the title
+            level (int): Level of the tree
         """
-        # Add line break before tree for better readability
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write("\n")
+        # Reject disabled levels before building anything
+        if not self.enabled_for(level):
+            return
+        if callable(items):
+            items = items()
         
-        # Only use emoji parameter if title doesn't already contain one
-        if emoji and not any(char in title for char in "🎵🔌✅❌⚠️🎙️🎛️⏸️▶️⏹️⏭️🔍📖🔄✋🌐🤖🕌🧹💾📂ℹ️🗑️🛑🔀🔁⏮️🎯🚫"):
-            self._write(f"{title}", emoji=emoji)
+        # Only use emoji parameter if title doesn't already start with one
+        if emoji and not self._starts_with_emoji(title):
+            lines: List[str] = [self._format(f"{title}", emoji=emoji)]
         else:
-            self._write(f"{title}")
+            lines: List[str] = [self._format(f"{title}")]
         for i, (key, value) in enumerate(items):
             prefix: str = "└─" if i == len(items) - 1 else "├─"
-            self._write(f"  {prefix} {key}: {value}", include_timestamp=False)
+            lines.append(f"  {prefix} {key}: {value}")
         
-        # Add line break after tree
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write("\n")
+        # Queue the whole tree as one record so it is never interleaved
+        # The file copy gets a line break before and after for readability
+        text: str = "\n".join(lines)
+        record: Dict[str, Any] = self._structured(level, title, items)
+        self._enqueue(
+            text if level >= self.console_level else None,
+            f"\n{text}\n\n" if level >= self.file_level else None,
+            record if self.json_enabled and level >= self.json_level else None
+        )
+    
+    @staticmethod
+    def _starts_with_emoji(title: str) -> bool:
+        """
+        Check whether a title already begins with an emoji.
+        
+        Emoji are "other symbol" characters (🎵, ⚠, ⏱); the few that aren't,
+        like ℹ, are written with the emoji variation selector (U+FE0F) after them.
+        
+        Args:
+            title: Tree title
+            
+        Returns:
+            True if the first character is an emoji
+        """
+        return bool(title) and (unicodedata.category(title[0]) == "So" or title[1:2] == "\ufe0f")
+    
+    def debug(self, msg: str) -> None:
+        """Log a debug message."""
+        self._write(msg, "🔧", level=DEBUG)
     
     def info(self, msg: str) -> None:
         """Log an informational message."""
@@ -168,21 +755,46 @@ class MiniTreeLogger:
     
     def error(self, msg: str) -> None:
         """Log an error message."""
-        self._write(msg, "❌")
+        self._write(msg, "❌", level=ERROR)
     
     def warning(self, msg: str) -> None:
         """Log a warning message."""
-        self._write(msg, "⚠️")
+        self._write(msg, "⚠️", level=WARNING)
     
-    def error_tree(self, title: str, error: Exception, context: Optional[List[Tuple[str, str]]] = None) -> None:
+    def error_tree(
+        self,
+        title: str,
+        error: Exception,
+        context: Optional[TreeItems] = None,
+        level: int = ERROR,
+        throttle: bool = False
+    ) -> None:
         """
         Log an error in tree format with context.
         
         Args:
             title (str): Error title
             error (Exception): The exception that occurred
-            context (Optional[List[Tuple[str, str]]]): Additional context as (key, value) tuples
+            context (Optional[TreeItems]): Additional context as (key, value) tuples,
+                or a callable returning them (only called if the level is enabled)
+            level (int): Level of the tree
+            throttle (bool): Rate-limit repeats from the same call site and error
+                type; use in retry loops that can fail every few seconds
         """
+        if not self.enabled_for(level):
+            return
+        
+        suppressed: int = 0
+        if throttle:
+            caller = sys._getframe(1)
+            key: Tuple[str, int, str] = (caller.f_code.co_filename, caller.f_lineno, type(error).__name__)
+            allowed, suppressed = self._take_token(key, title)
+            if not allowed:
+                return
+        
+        if callable(context):
+            context = context()
+        
         items = []
         items.append(("Error Type", type(error).__name__))
         items.append(("Message", str(error)))
@@ -191,7 +803,88 @@ class MiniTreeLogger:
             for key, value in context:
                 items.append((key, str(value)))
         
-        self.tree(title, items)
+        if suppressed:
+            items.append(("Suppressed Repeats", str(suppressed)))
+        
+        self.tree(title, items, level=level)
+    
+    def _take_token(self, key: Tuple[str, int, str], title: str) -> Tuple[bool, int]:
+        """
+        Consume a token from the bucket for a throttled error key.
+        
+        Args:
+            key: (file, line, error type) identifying the call site
+            title: Error title, remembered for repeat summaries
+            
+        Returns:
+            Tuple[bool, int]: Whether the tree may be logged, and how many
+            repeats were suppressed since the last tree or summary for this key
+        """
+        now: float = time.monotonic()
+        refill_rate: float = self.ERROR_BURST / self.ERROR_WINDOW
+        
+        with self._throttle_lock:
+            bucket = self._throttle.get(key)
+            if bucket is None:
+                bucket = [float(self.ERROR_BURST), now, 0, now, title]
+                self._throttle[key] = bucket
+            
+            bucket[0] = min(float(self.ERROR_BURST), bucket[0] + (now - bucket[1]) * refill_rate)
+            bucket[1] = now
+            
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                suppressed: int = bucket[2]
+                bucket[2] = 0
+                bucket[3] = now
+                return True, suppressed
+            
+            if bucket[2] == 0:
+                bucket[3] = now
+            bucket[2] += 1
+            return False, 0
+    
+    def _summarize_throttled(self, force: bool = False) -> None:
+        """
+        Log one summary per throttled key whose suppressed repeats have aged a window.
+        
+        Called periodically from the writer thread and once at shutdown.
+        
+        Args:
+            force: Summarize every key with suppressed repeats regardless of age
+        """
+        now: float = time.monotonic()
+        summaries: List[Tuple[str, int, Tuple[str, int, str]]] = []
+        
+        with self._throttle_lock:
+            for key, bucket in self._throttle.items():
+                if bucket[2] and (force or now - bucket[3] >= self.ERROR_WINDOW):
+                    summaries.append((bucket[4], bucket[2], key))
+                    bucket[2] = 0
+                    bucket[3] = now
+        
+        for title, count, (filename, line, error_type) in summaries:
+            self.tree(f"🔁 {title} (Repeated)", [
+                ("Error Type", error_type),
+                ("Occurrences", f"{count} in last {int(self.ERROR_WINDOW)}s"),
+                ("Call Site", f"{Path(filename).name}:{line}")
+            ], level=ERROR)
+
+
+def logging_level_name(level: int) -> str:
+    """
+    Get the name of a numeric level.
+    
+    Args:
+        level: Numeric level
+        
+    Returns:
+        str: Level name, or "LEVEL <n>" for custom values
+    """
+    for name, value in LEVEL_NAMES.items():
+        if value == level:
+            return name
+    return f"LEVEL {level}"
 
 
 # Global logger instance for use throughout the bot
@@ -13,10 +13,11 @@ Version: v1.0.0
 import json
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from src.core.logger import logger
+from src.core.journal import PlaybackJournal
 
 
 class PersistenceManager:
@@ -26,6 +27,9 @@ class PersistenceManager:
     Saves and loads bot state including:
     - Current surah number
     - Current reciter
+    - Control panel message reference (for editing it in place on restart)
+    - Seconds played of the current surah, for resuming mid-surah
+    - Stale messages the bot sent and still needs to delete
     - Last save timestamp
     """
     
@@ -43,12 +47,34 @@ class PersistenceManager:
         # Auto-save interval in seconds (30 seconds provides good balance)
         self.save_interval: int = 30
         
+        # Playback progress that alone justifies rewriting the state file
+        # Smaller than save_interval, so every auto-save while playing keeps the resume point fresh
+        self.position_step: float = 15.0
+        
         # Background task reference for auto-save functionality
         self.save_task: Optional[asyncio.Task] = None
         
+        # Append-only playback journal for exact resume and crash forensics
+        # Events are appended cheaply; the JSON file is only rewritten when state changes
+        self.journal: PlaybackJournal = PlaybackJournal()
+        
+        # Last state written to disk, used to skip redundant full rewrites
+        self._last_saved: Optional[tuple] = None
+        self._last_position: float = 0.0
+        
+        # Control panel message reference so restarts can edit it instead of re-sending
+        self.panel_channel_id: Optional[int] = None
+        self.panel_message_id: Optional[int] = None
+        
+        # Messages the bot itself sent that are no longer needed (e.g. replaced panels),
+        # as (channel_id, message_id) pairs since they may live in another channel
+        # Only these are ever deleted; the channel is never purged blindly
+        self.stale_messages: List[Tuple[int, int]] = []
+        
         logger.tree("💾 Persistence Manager Initialized", [
             ("State File", str(self.state_file)),
             ("Save Interval", f"{self.save_interval} seconds"),
+            ("Journal File", str(self.journal.journal_file)),
             ("Auto-save", "Enabled")
         ])
     
@@ -65,10 +91,19 @@ class PersistenceManager:
                 with open(self.state_file, 'r', encoding='utf-8') as f:
                     state = json.load(f)
                 
+                # Restore control panel tracking
+                self.panel_channel_id = state.get('panel_channel_id')
+                self.panel_message_id = state.get('panel_message_id')
+                self.stale_messages = [
+                    (int(channel_id), int(message_id))
+                    for channel_id, message_id in state.get('stale_messages', [])
+                ]
+                
                 logger.tree("📂 State Loaded Successfully", [
                     ("File", str(self.state_file)),
                     ("Surah", str(state.get('current_surah', 1))),
                     ("Reciter", state.get('reciter', 'Unknown')),
+                    ("Panel Message", str(self.panel_message_id or "None")),
                     ("Last Saved", state.get('last_saved', 'Unknown'))
                 ])
                 
@@ -99,22 +134,69 @@ class PersistenceManager:
             ])
             return {}
     
-    def save_state(self, current_surah: int, reciter: str) -> bool:
+    def load_resume_state(self) -> Dict[str, Any]:
+        """
+        Load the state to resume from, preferring the playback journal.
+        
+        The journal records every playback event, so it knows whether the last
+        surah was interrupted or finished. The JSON state file is only used for
+        fields the journal doesn't have (e.g. after the journal was deleted).
+        
+        The saved position only applies to the surah and reciter it was saved
+        with, so it is dropped when the journal resumes with anything else.
+        
+        Returns:
+            Dictionary with 'current_surah', 'reciter' and 'position' keys where known
+        """
+        state: Dict[str, Any] = self.load_state()
+        journal_state: Dict[str, Any] = self.journal.replay()
+        saved_track: tuple = (state.get("current_surah"), state.get("reciter"))
+        
+        for key in ("current_surah", "reciter"):
+            if journal_state.get(key):
+                state[key] = journal_state[key]
+        
+        position: Any = state.get("position")
+        if (state.get("current_surah"), state.get("reciter")) != saved_track or not isinstance(position, (int, float)) or position < 0:
+            state["position"] = 0.0
+        
+        # Seed the journal so a compaction before the first event still snapshots the right state
+        self.journal.state.setdefault("current_surah", state.get("current_surah", 1))
+        self.journal.state.setdefault("reciter", state.get("reciter", "Saad Al Ghamdi"))
+        
+        return state
+    
+    def save_state(self, current_surah: int, reciter: str, force: bool = False, position: float = 0.0) -> bool:
         """
         Save the current state to file.
         
         Args:
-            current_surah: Current surah number (1-114)
+            current_surah: Surah to resume with (1-114)
             reciter: Current reciter name
+            force: Rewrite the file even if the state hasn't changed
+            position: Seconds played of current_surah (rewritten once it moved position_step)
             
         Returns:
-            True if save successful, False otherwise
+            True if save successful (or nothing changed), False otherwise
         """
         try:
+            # The journal already holds every event, so skip the full rewrite
+            # when nothing a restart would need has changed (meaningfully)
+            if (
+                not force
+                and self._last_saved == (current_surah, reciter)
+                and abs(position - self._last_position) < self.position_step
+            ):
+                return True
+            
             # Create state dictionary with current bot information
             state = {
                 "current_surah": current_surah,
+                "position": round(position, 2),
                 "reciter": reciter,
+                "panel_channel_id": self.panel_channel_id,
+                "panel_message_id": self.panel_message_id,
+                "stale_messages": [list(pair) for pair in self.stale_messages],
                 "last_saved": datetime.now().isoformat(),
                 "version": "1.0.0"
             }
@@ -124,11 +206,14 @@ class PersistenceManager:
             with open(self.state_file, 'w', encoding='utf-8') as f:
                 json.dump(state, f, indent=4, ensure_ascii=False)
             
-            logger.tree("💾 State Saved", [
+            self._last_saved = (current_surah, reciter)
+            self._last_position = position
+            
+            logger.tree("💾 State Saved", lambda: [
                 ("Surah", str(current_surah)),
                 ("Reciter", reciter),
                 ("Time", datetime.now().strftime("%H:%M:%S"))
-            ])
+            ], level=logger.DEBUG)
             
             return True
             
@@ -137,9 +222,51 @@ class PersistenceManager:
                 ("File", str(self.state_file)),
                 ("Surah", str(current_surah)),
                 ("Reciter", reciter)
-            ])
+            ], throttle=True)
             return False
     
+    def set_panel_message(self, channel_id: int, message_id: int) -> None:
+        """
+        Track the control panel message so it can be edited on restart.
+        
+        If a different panel message was tracked before, it is marked stale
+        so it gets deleted on the next cleanup.
+        
+        Args:
+            channel_id: Channel the panel lives in
+            message_id: ID of the panel message
+        """
+        if self.panel_message_id and self.panel_channel_id and self.panel_message_id != message_id:
+            self.mark_stale(self.panel_channel_id, self.panel_message_id)
+        
+        self.panel_channel_id = channel_id
+        self.panel_message_id = message_id
+        
+        # Force the next save to write the new reference
+        self._last_saved = None
+    
+    def mark_stale(self, channel_id: int, message_id: int) -> None:
+        """
+        Remember a bot-sent message that should be deleted later.
+        
+        Args:
+            channel_id: Channel the stale message was sent to
+            message_id: ID of the stale message
+        """
+        if (channel_id, message_id) not in self.stale_messages:
+            self.stale_messages.append((channel_id, message_id))
+            self._last_saved = None
+    
+    def clear_stale(self, messages: List[Tuple[int, int]]) -> None:
+        """
+        Forget stale messages that have been deleted.
+        
+        Args:
+            messages: (channel_id, message_id) pairs that no longer need deleting
+        """
+        self.stale_messages = [m for m in self.stale_messages if m not in messages]
+        self._last_saved = None
+    
     async def start_auto_save(self, audio_service) -> None:
         """
         Start the automatic save task that saves state every 30 seconds.
@@ -156,11 +283,16 @@ class PersistenceManager:
                     
                     # Get current state from audio service if it's connected
                     if audio_service and audio_service.is_connected:
-                        current_surah = audio_service.current_surah
+                        current_surah = audio_service.resume_surah
                         reciter = audio_service.default_reciter
                         
                         # Save the current state to maintain continuity
-                        self.save_state(current_surah, reciter)
+                        self.save_state(current_surah, reciter, position=audio_service.playback_position)
+                    
+                    # Keep the journal bounded on long-running instances
+                    # (its writer thread already group-commits pending records)
+                    # Compaction fsyncs a snapshot, so keep it off the event loop
+                    await asyncio.to_thread(self.journal.maybe_compact)
                         
                 except asyncio.CancelledError:
                     # Task was cancelled (shutdown), exit gracefully
@@ -174,7 +306,7 @@ class PersistenceManager:
                     logger.error_tree("Error in auto-save loop", e, [
                         ("Action", "Continuing auto-save"),
                         ("Next Save", f"In {self.save_interval} seconds")
-                    ])
+                    ], throttle=True)
                     # Continue the loop even if there's an error
                     # This ensures auto-save doesn't stop due to temporary issues
                     continue
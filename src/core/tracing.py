@@ -0,0 +1,228 @@
+"""
+QuranBot - Interaction Latency Tracing
+======================================
+
+Lightweight trace spans from a user's click to the audio they hear.
+
+A trace is started when an interaction arrives and is marked as it passes
+through each phase of the path to audio. Every mark is folded into a
+fixed-bucket histogram for that phase, so memory stays constant no matter
+how many interactions are traced. The histograms are shown by !stats.
+
+Phases (milliseconds since the interaction reached the bot, except
+"received", which is the delay from Discord creating the interaction):
+- received: Discord's interaction timestamp to the callback starting
+- permission: Stage permission check done
+- responded: Interaction acknowledged
+- source_resolved: Audio file of the target surah found
+- decoder_spawned: FFmpeg started for the new track
+- first_packet: The voice player read the first frame of the new track
+- panel_edited: The control panel shows the change
+
+Tracing is disabled by default. Enable it with TRACE_INTERACTIONS=1 or
+the !trace command. While disabled, start() returns None and every
+instrumentation point is a single falsy check.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+from src.core.logger import logger
+
+
+# Phases in the order an interaction passes through them
+PHASES: Tuple[str, ...] = (
+    "received",
+    "permission",
+    "responded",
+    "source_resolved",
+    "decoder_spawned",
+    "first_packet",
+    "panel_edited",
+)
+
+# Upper bounds of the histogram buckets in milliseconds (last bucket is open)
+BUCKET_BOUNDS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Attributes:
+        counts: Samples per bucket of BUCKET_BOUNDS
+        count: Total samples
+        total: Sum of all samples in milliseconds
+        max: Largest sample in milliseconds
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts: List[int] = [0] * len(BUCKET_BOUNDS)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, ms: float) -> None:
+        """
+        Add a sample.
+
+        Args:
+            ms: Latency in milliseconds
+        """
+        self.counts[bisect_left(BUCKET_BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get the bucket bound below which a fraction of the samples fall.
+
+        Args:
+            fraction: Fraction of samples, e.g. 0.95
+
+        Returns:
+            float: Upper bound of the bucket in milliseconds (the maximum for the open bucket)
+        """
+        needed: float = fraction * self.count
+        seen: int = 0
+        for bound, bucket in zip(BUCKET_BOUNDS, self.counts):
+            seen += bucket
+            if seen >= needed and seen:
+                return bound if bound != float("inf") else self.max
+        return 0.0
+
+
+class Trace:
+    """
+    Span of one interaction through the phases to audio.
+
+    Attributes:
+        name: What the interaction does, e.g. "surah select"
+        started: perf_counter() when the interaction reached the bot
+        phases: Milliseconds at which each phase was reached
+    """
+
+    __slots__ = ("tracer", "name", "started", "phases")
+
+    def __init__(self, tracer: "Tracer", name: str) -> None:
+        """
+        Start a trace.
+
+        Args:
+            tracer: Tracer collecting the phases
+            name: What the interaction does
+        """
+        self.tracer: Tracer = tracer
+        self.name: str = name
+        self.started: float = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        """
+        Record that a phase was reached; only the first mark of a phase counts.
+
+        Args:
+            phase: One of PHASES
+        """
+        if phase in self.phases:
+            return
+        self.record(phase, (time.perf_counter() - self.started) * 1000)
+        if phase == PHASES[-1]:
+            self.tracer.finish(self)
+
+    def record(self, phase: str, ms: float) -> None:
+        """
+        Record a phase with an explicit latency.
+
+        Args:
+            phase: One of PHASES
+            ms: Latency in milliseconds
+        """
+        self.phases[phase] = ms
+        self.tracer.histograms[phase].observe(ms)
+
+
+class Tracer:
+    """
+    Collects traces into per-phase histograms.
+
+    Attributes:
+        enabled: Whether new traces are started
+        histograms: Histogram per phase
+        traces: Traces started since the histograms were reset
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Whether to trace from the start
+        """
+        self.enabled: bool = enabled
+        self.histograms: Dict[str, Histogram] = {phase: Histogram() for phase in PHASES}
+        self.traces: int = 0
+
+    def start(self, name: str, interaction: Optional[discord.Interaction] = None) -> Optional[Trace]:
+        """
+        Start a trace for an interaction.
+
+        Args:
+            name: What the interaction does
+            interaction: Interaction whose creation time gives the "received" phase
+
+        Returns:
+            Optional[Trace]: The trace, or None while tracing is disabled
+        """
+        if not self.enabled:
+            return None
+
+        trace: Trace = Trace(self, name)
+        self.traces += 1
+        if interaction is not None:
+            delay: float = (discord.utils.utcnow() - interaction.created_at).total_seconds() * 1000
+            trace.record("received", max(delay, 0.0))
+        return trace
+
+    def finish(self, trace: Trace) -> None:
+        """
+        Log a completed trace.
+
+        Args:
+            trace: Trace that reached its last phase
+        """
+        logger.tree("⏱️ Interaction Traced", lambda: [
+            ("Interaction", trace.name),
+            *((phase, f"{trace.phases[phase]:.1f} ms") for phase in PHASES if phase in trace.phases)
+        ], level=logger.DEBUG)
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        self.histograms = {phase: Histogram() for phase in PHASES}
+        self.traces = 0
+
+    def summary(self) -> List[Tuple[str, Histogram]]:
+        """
+        Get the phases that have samples.
+
+        Returns:
+            List of (phase, histogram) in phase order
+        """
+        return [(phase, self.histograms[phase]) for phase in PHASES if self.histograms[phase].count]
+
+
+# Process-wide tracer shared by the UI and the audio service
+tracer: Tracer = Tracer(enabled=os.getenv("TRACE_INTERACTIONS", "").strip().lower() in ("1", "true", "yes", "on"))
@@ -8,14 +8,17 @@ This module provides data structures and mappings that contain
 authoritative information about Quranic Surahs and related data.
 
 Data Components:
-- SURAH_NAMES: Comprehensive mapping of all 114 Surahs with Arabic and English names
-- surah_mapper.json: Extended Surah data with translations and metadata
+- Surah: Immutable metadata record for one surah (names, ayahs, revelation, juz)
+- SURAHS: Canonical table of all 114 Surahs, indexed by surah number
+- get_surah: Look up a surah by number
+- juz_of: Find the juz containing an ayah
+- surah_mapper.json: Surah names, translations and emoji read by SURAHS
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 Version: v1.0.0
 """
 
-from .surahs import SURAH_NAMES
+from .surahs import Surah, SURAHS, JUZ_STARTS, TOTAL_AYAHS, get_surah, juz_of
 
-__all__ = ["SURAH_NAMES"]
+__all__ = ["Surah", "SURAHS", "JUZ_STARTS", "TOTAL_AYAHS", "get_surah", "juz_of"]
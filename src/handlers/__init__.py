@@ -9,6 +9,8 @@ including rich presence updates and other specialized features.
 
 Handlers:
 - PresenceHandler: Discord rich presence management with surah and reciter display
+- AdminCommands: Owner-only commands for production triage
+- PlaybackCommands: /play and /reciter slash commands with autocomplete
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
@@ -16,5 +18,7 @@ Version: v1.0.0
 """
 
 from .presence_handler import PresenceHandler
+from .admin_commands import AdminCommands
+from .playback_commands import PlaybackCommands
 
-__all__ = ["PresenceHandler"]
+__all__ = ["PresenceHandler", "AdminCommands", "PlaybackCommands"]
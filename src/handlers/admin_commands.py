@@ -0,0 +1,241 @@
+"""
+QuranBot - Admin Commands
+=========================
+
+Owner-only text commands for operating the bot without shell access.
+
+Commands:
+- !logs [count] [level]: Dump the most recent structured log records as a
+  JSON Lines attachment straight from the logger's in-memory ring buffer
+- !stats: Show runtime metrics such as the search result cache hit rate and
+  how many control panel edits were skipped
+- !trace [on|off|reset]: Toggle interaction latency tracing or clear its histograms
+- !reciters: Rescan the audio directory after reciter folders were added or removed
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import asyncio
+import io
+import json
+from typing import List, Dict, Any, Optional
+
+import discord
+from discord.ext import commands
+
+from src.core.logger import logger, LEVEL_NAMES
+from src.core.tracing import tracer
+from src.ui.control_panel import get_stage_gate
+from src.utils.search import get_surah_search
+
+
+class AdminCommands(commands.Cog):
+    """
+    Owner-only commands for production triage.
+
+    Every command is restricted to the application owner so the bot's
+    internals are never exposed to regular members of the server.
+    """
+
+    # Upper bound on records per dump; the ring buffer never holds more
+    MAX_RECORDS: int = 1000
+
+    def __init__(self, bot: commands.Bot) -> None:
+        """
+        Initialize the admin commands cog.
+
+        Args:
+            bot: The bot instance the cog is attached to
+        """
+        self.bot: commands.Bot = bot
+
+    async def cog_check(self, ctx: commands.Context) -> bool:
+        """Restrict every command in this cog to the application owner."""
+        return await self.bot.is_owner(ctx.author)
+
+    @commands.command(name="logs")
+    async def logs(self, ctx: commands.Context, count: int = 100, level: Optional[str] = None) -> None:
+        """
+        Send the most recent log records as a JSON Lines file.
+
+        Args:
+            ctx: Command context
+            count: Number of records to include (newest last)
+            level: Optional minimum level name (DEBUG, INFO, WARNING, ERROR)
+        """
+        try:
+            count = max(1, min(count, self.MAX_RECORDS))
+            min_level: int = LEVEL_NAMES.get((level or "DEBUG").upper(), logger.DEBUG)
+            records: List[Dict[str, Any]] = logger.recent(count, min_level)
+
+            if not records:
+                await ctx.reply("No log records in memory.", mention_author=False)
+                return
+
+            payload: str = "\n".join(json.dumps(r, ensure_ascii=False, default=str) for r in records) + "\n"
+            log_file: discord.File = discord.File(
+                io.BytesIO(payload.encode("utf-8")),
+                filename=f"logs-{logger.run_id}.jsonl"
+            )
+            await ctx.reply(
+                f"Last {len(records)} records (run `{logger.run_id}`)",
+                file=log_file,
+                mention_author=False
+            )
+
+            logger.tree("📤 Recent Logs Exported", [
+                ("Requested By", f"{ctx.author} ({ctx.author.id})"),
+                ("Records", str(len(records))),
+                ("Minimum Level", level.upper() if level else "DEBUG")
+            ])
+
+        except Exception as e:
+            logger.error_tree("Failed to export recent logs", e, [
+                ("Requested By", f"{ctx.author} ({ctx.author.id})"),
+                ("Count", str(count))
+            ])
+
+    @commands.command(name="stats")
+    async def stats(self, ctx: commands.Context) -> None:
+        """
+        Show runtime metrics.
+
+        Args:
+            ctx: Command context
+        """
+        try:
+            cache = get_surah_search().cache_stats()
+            embed = discord.Embed(title="📊 Runtime Stats", color=discord.Color.blurple())
+            embed.add_field(
+                name="Search Cache",
+                value=(
+                    f"Hits: **{cache['hits']}** • Misses: **{cache['misses']}**\n"
+                    f"Hit Rate: **{cache['hit_rate']:.1%}** • Size: **{cache['size']}/{cache['capacity']}**"
+                ),
+                inline=False
+            )
+            panel = getattr(self.bot, "control_panel", None)
+            if panel:
+                renders: int = panel.edits_sent + panel.edits_skipped
+                embed.add_field(
+                    name="Control Panel",
+                    value=(
+                        f"Edits Sent: **{panel.edits_sent}** • Skipped: **{panel.edits_skipped}** • "
+                        f"Coalesced: **{panel.updates_coalesced}**\n"
+                        f"Skip Rate: **{panel.edits_skipped / renders if renders else 0.0:.1%}** • "
+                        f"Progress Step: **{panel.progress_step():g}s**\n"
+                        f"Navigation Clicks: **{panel.navigation_clicks}** • Jumps: **{panel.navigation_jumps}**"
+                    ),
+                    inline=False
+                )
+            audio_service = getattr(self.bot, "audio_service", None)
+            if audio_service:
+                queue = audio_service.commands
+                embed.add_field(
+                    name="Playback Commands",
+                    value=(
+                        f"Executed: **{queue.executed}** • Failed: **{queue.failed}** • "
+                        f"Rejected: **{queue.rejected}** • Pending: **{queue.pending}**"
+                    ),
+                    inline=False
+                )
+            gate = get_stage_gate()
+            embed.add_field(
+                name="Stage Gate",
+                value=(
+                    f"Allowed: **{gate.allowed}** • Denied: **{gate.denied}** • "
+                    f"Throttled: **{gate.throttled}** • Cooldown: **{gate.cooldown:g}s**"
+                ),
+                inline=False
+            )
+            phases = tracer.summary()
+            if phases:
+                embed.add_field(
+                    name=f"Interaction Latency ({tracer.traces} traced)",
+                    value="\n".join(
+                        f"`{phase}` p50 ≤ **{histogram.percentile(0.5):.0f} ms** • "
+                        f"p95 ≤ **{histogram.percentile(0.95):.0f} ms** • max **{histogram.max:.0f} ms** "
+                        f"({histogram.count})"
+                        for phase, histogram in phases
+                    ),
+                    inline=False
+                )
+            await ctx.reply(embed=embed, mention_author=False)
+
+        except Exception as e:
+            logger.error_tree("Failed to show stats", e, [
+                ("Requested By", f"{ctx.author} ({ctx.author.id})")
+            ])
+
+    @commands.command(name="trace")
+    async def trace(self, ctx: commands.Context, mode: Optional[str] = None) -> None:
+        """
+        Toggle interaction latency tracing.
+
+        Args:
+            ctx: Command context
+            mode: "on", "off" or "reset"; shows the current state when omitted
+        """
+        mode = (mode or "").lower()
+        if mode in ("on", "off"):
+            tracer.enabled = mode == "on"
+        elif mode == "reset":
+            tracer.reset()
+
+        await ctx.reply(
+            f"Interaction tracing is **{'on' if tracer.enabled else 'off'}** ({tracer.traces} traced)",
+            mention_author=False
+        )
+        logger.tree("⏱️ Interaction Tracing", [
+            ("Requested By", f"{ctx.author} ({ctx.author.id})"),
+            ("Mode", mode or "status"),
+            ("Enabled", str(tracer.enabled))
+        ])
+
+    @commands.command(name="reciters")
+    async def reciters(self, ctx: commands.Context) -> None:
+        """
+        Rescan the reciter library and refresh the control panel's picker.
+
+        Args:
+            ctx: Command context
+        """
+        audio_service = getattr(self.bot, "audio_service", None)
+        if not audio_service:
+            return
+
+        try:
+            before: int = len(audio_service.library)
+            # The scan reads every reciter folder and manifest; keep it off the event loop
+            await asyncio.to_thread(audio_service.library.reload)
+
+            panel = getattr(self.bot, "control_panel", None)
+            if panel:
+                panel.build_items()
+                panel.request_update()
+
+            await ctx.reply(
+                f"Reciter library reloaded: **{len(audio_service.library)}** reciters (was {before})",
+                mention_author=False
+            )
+            logger.tree("🎙️ Reciter Library Reloaded", [
+                ("Requested By", f"{ctx.author} ({ctx.author.id})"),
+                ("Before", str(before)),
+                ("After", str(len(audio_service.library)))
+            ])
+
+        except Exception as e:
+            logger.error_tree("Failed to reload reciter library", e, [
+                ("Requested By", f"{ctx.author} ({ctx.author.id})")
+            ])
+
+    async def cog_command_error(self, ctx: commands.Context, error: commands.CommandError) -> None:
+        """Silently ignore non-owners; log anything else."""
+        if isinstance(error, commands.CheckFailure):
+            return
+        logger.error_tree("Admin command failed", error, [
+            ("Command", ctx.command.qualified_name if ctx.command else "Unknown"),
+            ("User", f"{ctx.author} ({ctx.author.id})")
+        ])
@@ -0,0 +1,191 @@
+"""
+QuranBot - Playback Slash Commands
+==================================
+
+Slash commands for jumping straight to a surah or reciter.
+
+The control panel needs a modal, a submit and a button press to play a
+searched surah. These commands do it in one step, with autocomplete that
+answers from in-memory prefix tries so suggestions arrive well within
+Discord's 3-second autocomplete window.
+
+Commands:
+- /play <surah>: Play a surah by number or name (English, Arabic or translation)
+- /reciter <name>: Switch to another reciter from the audio library
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+from typing import List, Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from src.core.logger import logger
+from src.core.tracing import Trace, tracer
+from src.services.audio.audio_service import AudioService
+from src.services.audio.reciter_library import ReciterLibrary
+from src.ui.control_panel import get_stage_gate, run_playback_command, switch_reciter
+from src.data.surahs import Surah, get_surah
+from src.utils.search import SurahSearch, get_surah_search
+
+
+class PlaybackCommands(commands.Cog):
+    """
+    /play and /reciter with trie-backed autocomplete.
+
+    Attributes:
+        bot: The bot instance
+        audio_service: Audio service that plays the selected surah
+        search: Shared surah search engine (also provides the surah trie)
+        library: Reciter library of the audio service (also provides the reciter trie)
+    """
+
+    def __init__(self, bot: commands.Bot, audio_service: AudioService) -> None:
+        """
+        Initialize the playback commands cog.
+
+        Args:
+            bot: The bot instance
+            audio_service: Audio service used for playback
+        """
+        self.bot: commands.Bot = bot
+        self.audio_service: AudioService = audio_service
+        self.search: SurahSearch = get_surah_search()
+        self.library: ReciterLibrary = audio_service.library
+
+        logger.tree("🔤 Autocomplete Ready", lambda: [
+            ("Surahs", str(len(self.search))),
+            ("Reciters", str(len(self.library)))
+        ], level=logger.DEBUG)
+
+    def _resolve_surah(self, value: str) -> Optional[Surah]:
+        """
+        Resolve a command argument to a surah.
+
+        Autocomplete choices submit the surah number; free text falls back to search.
+
+        Args:
+            value: Surah number or name as submitted
+
+        Returns:
+            Optional[Surah]: The surah, or None if nothing matches
+        """
+        value = value.strip()
+        if value.isdigit():
+            return get_surah(int(value))
+        results = self.search.search(value, limit=1)
+        return results[0].surah if results else None
+
+    async def surah_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """Suggest surahs whose number or name starts with the typed text."""
+        return [
+            app_commands.Choice(name=f"{record.number}. {record.display}", value=str(record.number))
+            for record in self.search.autocomplete(current)
+        ]
+
+    async def reciter_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """Suggest reciters whose name, or any word of it, starts with the typed text."""
+        return [app_commands.Choice(name=reciter, value=reciter) for reciter in self.library.search(current)]
+
+    @app_commands.command(name="play", description="Play a surah by number or name")
+    @app_commands.describe(surah="Surah number or name (English or Arabic)")
+    @app_commands.autocomplete(surah=surah_autocomplete)
+    async def play(self, interaction: discord.Interaction, surah: str) -> None:
+        """Jump to the requested surah."""
+        trace: Optional[Trace] = tracer.start("/play", interaction)
+        if not await get_stage_gate().allow(interaction, self.audio_service, "/play"):
+            return
+        if trace:
+            trace.mark("permission")
+
+        record: Optional[Surah] = self._resolve_surah(surah)
+        if record is None:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="❌ No Results Found",
+                    description=f"No Surahs found matching **'{surah}'**",
+                    color=discord.Color.red()
+                ),
+                ephemeral=True
+            )
+            return
+
+        try:
+            embed = discord.Embed(
+                title="✅ Surah Selected",
+                description=f"**{record.label}**",
+                color=discord.Color.green()
+            )
+            embed.add_field(name="Arabic Name", value=record.arabic, inline=True)
+            embed.add_field(name="Translation", value=record.translation, inline=False)
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            if trace:
+                trace.mark("responded")
+
+            logger.tree("✅ Surah Selected Successfully", lambda: [
+                ("User", str(interaction.user)),
+                ("Surah Number", str(record.number)),
+                ("Surah Name", record.english),
+                ("Source", "/play command")
+            ])
+
+            # Same path as the search result buttons on the control panel
+            panel = getattr(self.bot, "control_panel", None)
+            if panel:
+                panel.last_interaction_user = f"<@{interaction.user.id}>"
+                panel.last_interaction_action = f"selected Surah {record.number}"
+            number: int = record.number
+            await run_playback_command(
+                interaction, self.audio_service, f"play surah {number}",
+                lambda: self.audio_service.jump(number, trace=trace),
+                f"Could not start Surah {number}."
+            )
+            if panel:
+                panel.request_update(trace)
+
+        except Exception as e:
+            logger.error_tree("/play command failed", e, [
+                ("User", str(interaction.user)),
+                ("Surah", str(record.number))
+            ])
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "❌ An error occurred while selecting the surah.",
+                    ephemeral=True
+                )
+
+    @app_commands.command(name="reciter", description="Switch to another reciter")
+    @app_commands.describe(name="Reciter name")
+    @app_commands.autocomplete(name=reciter_autocomplete)
+    async def reciter(self, interaction: discord.Interaction, name: str) -> None:
+        """Switch the active reciter."""
+        trace: Optional[Trace] = tracer.start("/reciter", interaction)
+        if not await get_stage_gate().allow(interaction, self.audio_service, "/reciter"):
+            return
+        if trace:
+            trace.mark("permission")
+
+        # Accept any casing or a unique prefix typed without picking a suggestion
+        matches = self.library.search(name, 2)
+        selected: Optional[str] = name if self.library.get(name) else (matches[0] if len(matches) == 1 else None)
+
+        if not selected:
+            await interaction.response.send_message(
+                f"❌ Reciter **{name}** not found",
+                ephemeral=True
+            )
+            return
+
+        # Acknowledge first; restarting the surah runs on the command queue
+        await interaction.response.send_message(f"🎙️ Changing reciter to **{selected}**...", ephemeral=True)
+        if trace:
+            trace.mark("responded")
+
+        await switch_reciter(
+            interaction, self.audio_service, getattr(self.bot, "control_panel", None),
+            selected, "/reciter command", trace
+        )
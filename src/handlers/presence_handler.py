@@ -13,6 +13,7 @@ Version: v1.0.0
 import discord
 from typing import Optional, Dict, Any
 from src.core.logger import logger
+from src.data.surahs import Surah, get_surah
 
 
 class PresenceHandler:
@@ -35,127 +36,6 @@ class PresenceHandler:
     providing transparency about the current recitation being played.
     """
     
-    # Comprehensive mapping of all 114 Quranic surahs
-    # Uses Arabic transliteration (not translation) for authentic naming
-    # This dictionary maps surah numbers (1-114) to their proper Arabic names
-    # Used for rich presence updates to show which surah is currently playing
-    SURAH_NAMES: Dict[int, str] = {
-        1: "Al-Fatiha",
-        2: "Al-Baqarah", 
-        3: "Ali 'Imran",
-        4: "An-Nisa",
-        5: "Al-Ma'idah",
-        6: "Al-An'am",
-        7: "Al-A'raf",
-        8: "Al-Anfal",
-        9: "At-Tawbah",
-        10: "Yunus",
-        11: "Hud",
-        12: "Yusuf",
-        13: "Ar-Ra'd",
-        14: "Ibrahim",
-        15: "Al-Hijr",
-        16: "An-Nahl",
-        17: "Al-Isra",
-        18: "Al-Kahf",
-        19: "Maryam",
-        20: "Ta-Ha",
-        21: "Al-Anbiya",
-        22: "Al-Hajj",
-        23: "Al-Mu'minun",
-        24: "An-Nur",
-        25: "Al-Furqan",
-        26: "Ash-Shu'ara",
-        27: "An-Naml",
-        28: "Al-Qasas",
-        29: "Al-'Ankabut",
-        30: "Ar-Rum",
-        31: "Luqman",
-        32: "As-Sajdah",
-        33: "Al-Ahzab",
-        34: "Saba",
-        35: "Fatir",
-        36: "Ya-Sin",
-        37: "As-Saffat",
-        38: "Sad",
-        39: "Az-Zumar",
-        40: "Ghafir",
-        41: "Fussilat",
-        42: "Ash-Shura",
-        43: "Az-Zukhruf",
-        44: "Ad-Dukhan",
-        45: "Al-Jathiyah",
-        46: "Al-Ahqaf",
-        47: "Muhammad",
-        48: "Al-Fath",
-        49: "Al-Hujurat",
-        50: "Qaf",
-        51: "Adh-Dhariyat",
-        52: "At-Tur",
-        53: "An-Najm",
-        54: "Al-Qamar",
-        55: "Ar-Rahman",
-        56: "Al-Waqi'ah",
-        57: "Al-Hadid",
-        58: "Al-Mujadila",
-        59: "Al-Hashr",
-        60: "Al-Mumtahanah",
-        61: "As-Saff",
-        62: "Al-Jumu'ah",
-        63: "Al-Munafiqun",
-        64: "At-Taghabun",
-        65: "At-Talaq",
-        66: "At-Tahrim",
-        67: "Al-Mulk",
-        68: "Al-Qalam",
-        69: "Al-Haqqah",
-        70: "Al-Ma'arij",
-        71: "Nuh",
-        72: "Al-Jinn",
-        73: "Al-Muzzammil",
-        74: "Al-Muddaththir",
-        75: "Al-Qiyamah",
-        76: "Al-Insan",
-        77: "Al-Mursalat",
-        78: "An-Naba",
-        79: "An-Nazi'at",
-        80: "'Abasa",
-        81: "At-Takwir",
-        82: "Al-Infitar",
-        83: "Al-Mutaffifin",
-        84: "Al-Inshiqaq",
-        85: "Al-Buruj",
-        86: "At-Tariq",
-        87: "Al-A'la",
-        88: "Al-Ghashiyah",
-        89: "Al-Fajr",
-        90: "Al-Balad",
-        91: "Ash-Shams",
-        92: "Al-Layl",
-        93: "Ad-Duha",
-        94: "Ash-Sharh",
-        95: "At-Tin",
-        96: "Al-'Alaq",
-        97: "Al-Qadr",
-        98: "Al-Bayyinah",
-        99: "Az-Zalzalah",
-        100: "Al-'Adiyat",
-        101: "Al-Qari'ah",
-        102: "At-Takathur",
-        103: "Al-'Asr",
-        104: "Al-Humazah",
-        105: "Al-Fil",
-        106: "Quraysh",
-        107: "Al-Ma'un",
-        108: "Al-Kawthar",
-        109: "Al-Kafirun",
-        110: "An-Nasr",
-        111: "Al-Masad",
-        112: "Al-Ikhlas",
-        113: "Al-Falaq",
-        114: "An-Nas"
-    }
-    
     def __init__(self, bot: discord.Client) -> None:
         """
         Initialize the presence handler.
@@ -199,9 +79,10 @@ class PresenceHandler:
             # Update the tracked current surah for future comparison
             self.current_surah = surah_number
             
-            # Get the Arabic transliteration name for the surah
-            # Fallback to generic "Surah X" if not found in the mapping
-            surah_name = self.SURAH_NAMES.get(surah_number, f"Surah {surah_number}")
+            # Transliterated name from the shared surah table
+            # Fallback to generic "Surah X" if the number is out of range
+            surah: Optional[Surah] = get_surah(surah_number)
+            surah_name = surah.english if surah else f"Surah {surah_number}"
             
             # Create Discord activity with listening type and surah name
             # Using "listening" type shows "Listening to: 📖 Surah Name" in Discord
@@ -223,16 +104,18 @@ class PresenceHandler:
             # This will be visible to all users who can see the bot
             await self.bot.change_presence(activity=activity)
             
-            presence_info = [
-                ("Surah", f"{surah_number} - {surah_name}"),
-                ("Status", f"Listening to 📖 {surah_name}"),
-                ("Type", "Activity.listening")
-            ]
-            
-            if reciter:
-                presence_info.append(("Reciter", reciter))
-            
-            logger.tree("🎵 Rich Presence Updated", presence_info)
+            # Presence changes every surah; only build the tree when debug logging is on
+            if logger.enabled_for(logger.DEBUG):
+                presence_info = [
+                    ("Surah", f"{surah_number} - {surah_name}"),
+                    ("Status", f"Listening to 📖 {surah_name}"),
+                    ("Type", "Activity.listening")
+                ]
+                
+                if reciter:
+                    presence_info.append(("Reciter", reciter))
+                
+                logger.tree("🎵 Rich Presence Updated", presence_info, level=logger.DEBUG)
             
         except Exception as e:
             logger.error_tree("Failed to update rich presence", e, [
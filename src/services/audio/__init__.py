@@ -10,6 +10,9 @@ and seamless playback management.
 
 Components:
 - AudioService: Main audio streaming service with 24/7 operation
+- FrameCountingSource: Audio source wrapper that measures playback position in frames
+- PlaybackCommandQueue: Serialized executor for user-initiated playback changes
+- ReciterLibrary: Reciter metadata from per-reciter manifests, with indexed lookup and search
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
@@ -17,5 +20,8 @@ Version: v1.0.0
 """
 
 from .audio_service import AudioService
+from .command_queue import PlaybackCommandQueue
+from .frame_source import FrameCountingSource
+from .reciter_library import Reciter, ReciterLibrary
 
-__all__ = ["AudioService"]
\ No newline at end of file
+__all__ = ["AudioService", "FrameCountingSource", "PlaybackCommandQueue", "Reciter", "ReciterLibrary"]
\ No newline at end of file
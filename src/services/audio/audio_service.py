@@ -13,6 +13,8 @@ Features:
 - Comprehensive error handling and recovery
 - Real-time playback status monitoring
 - Reciter switching without interruption
+- Frame-accurate playback position and track change notifications
+- Atomic jumps to any surah, reciter and offset without stopping the player
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
@@ -23,9 +25,17 @@ import asyncio
 import discord
 import time
 from pathlib import Path
-from typing import Optional, Union, Dict, List, Any
+from typing import Optional, Union, Dict, List, Any, Callable
 
 from src.core.logger import logger
+from src.core.tracing import Trace
+from src.core.journal import (
+    EVENT_TRACK_START, EVENT_TRACK_END, EVENT_SKIP, EVENT_RECITER_CHANGE,
+    EVENT_PAUSE, EVENT_RESUME, EVENT_RECONNECT
+)
+from src.services.audio.command_queue import PlaybackCommandQueue
+from src.services.audio.frame_source import FrameCountingSource
+from src.services.audio.reciter_library import ReciterLibrary
 
 
 class AudioService:
@@ -38,25 +48,44 @@ class AudioService:
     
     Attributes:
         audio_dir: Path to the audio files directory
+        library: Reciters of the audio directory with their metadata, loaded once
         default_reciter: Currently selected reciter
-        current_surah: Current surah number being played
+        current_surah: Next surah to play (pre-advanced when a track starts)
+        playing_surah: Surah of the track currently loaded, None before the first track
+        source: Frame-counting source of the current track
+        commands: Serialized queue that runs user-initiated playback changes
         is_playing: Boolean indicating active playback state
         voice_client: Discord voice client instance
         channel: Connected voice/stage channel reference
     """
     
-    def __init__(self, saved_surah: Optional[int] = None, saved_reciter: Optional[str] = None) -> None:
+    # Longest wait for FFmpeg to deliver the first frame after a jump
+    FIRST_FRAME_TIMEOUT: float = 5.0
+    
+    # Seconds to keep a replaced source alive before terminating its FFmpeg
+    SOURCE_CLEANUP_DELAY: float = 0.2
+    
+    def __init__(
+        self,
+        saved_surah: Optional[int] = None,
+        saved_reciter: Optional[str] = None,
+        saved_position: float = 0.0
+    ) -> None:
         """
         Initialize the audio service.
         
         Args:
             saved_surah: Saved surah number from previous session
             saved_reciter: Saved reciter from previous session
+            saved_position: Seconds already played of saved_surah
         """
         # Set up audio directory path relative to project root
         # Navigate from src/services/audio/ to project root, then to audio/
         self.audio_dir: Path = Path(__file__).parent.parent.parent.parent / "audio"
         
+        # Reciter folders and manifests are read once, not per interaction
+        self.library: ReciterLibrary = ReciterLibrary(self.audio_dir)
+        
         # Use saved reciter if available, otherwise default to Saad Al Ghamdi
         # Saad Al Ghamdi has the most complete audio collection
         self.default_reciter: str = saved_reciter or "Saad Al Ghamdi"
@@ -64,9 +93,28 @@ class AudioService:
         # Use saved surah if available, otherwise start from Al-Fatiha (Surah 1)
         self.current_surah: int = saved_surah or 1
         
+        # The first track continues where the previous session left off
+        self.resume_position: float = saved_position or 0.0
+        
         # Track playback state for UI updates and status monitoring
         self.is_playing: bool = False
         
+        # The track actually loaded into the player, and its source
+        # current_surah is pre-advanced, so it never says what is playing
+        self.playing_surah: Optional[int] = None
+        self.source: Optional[FrameCountingSource] = None
+        
+        # Called with the surah number whenever a new track starts
+        self._track_listeners: List[Callable[[int], None]] = []
+        
+        # User-initiated playback changes run here one at a time, so
+        # interaction callbacks can acknowledge before any audio work
+        self.commands: PlaybackCommandQueue = PlaybackCommandQueue()
+        
+        # Held while a track is being loaded, so a jump and the playback
+        # loop can never both start a track at the same time
+        self._track_lock: asyncio.Lock = asyncio.Lock()
+        
         # Discord voice client instance for audio streaming
         self.voice_client: Optional[discord.VoiceClient] = None
         
@@ -80,10 +128,15 @@ class AudioService:
         # Presence handler will be set by the bot after initialization
         self.presence_handler = None
         
+        # Playback journal will be set by the bot after initialization
+        # Every playback event is appended to it for crash forensics and exact resume
+        self.journal = None
+        
         logger.tree("🎵 Audio Service Initialized", [
             ("Audio Directory", str(self.audio_dir)),
             ("Default Reciter", self.default_reciter),
-            ("Starting Surah", str(self.current_surah))
+            ("Starting Surah", str(self.current_surah)),
+            ("Resume Position", f"{self.resume_position:.2f}s")
         ])
     
     async def connect(self, channel: Union[discord.VoiceChannel, discord.StageChannel]) -> bool:
@@ -144,14 +197,14 @@ class AudioService:
                 ("Channel", channel.name),
                 ("Channel Type", type(channel).__name__),
                 ("Guild", channel.guild.name if channel.guild else "Unknown")
-            ])
+            ], throttle=True)
             return False
         except Exception as e:
             logger.error_tree("Failed to connect to voice channel", e, [
                 ("Channel", channel.name),
                 ("Channel Type", type(channel).__name__),
                 ("Guild", channel.guild.name if channel.guild else "Unknown")
-            ])
+            ], throttle=True)
             return False
     
     async def disconnect(self) -> None:
@@ -164,11 +217,12 @@ class AudioService:
                 ("Status", "Success")
             ])
     
-    def get_audio_file(self, surah_number: int) -> Optional[str]:
-        """Get the audio file path for a surah."""
-        # Try the currently selected default reciter first
+    def get_audio_file(self, surah_number: int, reciter: Optional[str] = None) -> Optional[str]:
+        """Get the audio file path for a surah, for the given reciter or the default one."""
+        # Try the requested (or currently selected default) reciter first
         # This provides the best user experience by maintaining consistency
-        reciter_dir: Path = self.audio_dir / self.default_reciter
+        reciter = reciter or self.default_reciter
+        reciter_dir: Path = self.audio_dir / reciter
         
         # Format surah number as 3-digit string (001, 002, etc.) for consistent file naming
         surah_file: Path = reciter_dir / f"{surah_number:03d}.mp3"
@@ -185,7 +239,7 @@ class AudioService:
                 if test_file.exists():
                     # Log which reciter we're using as fallback for transparency
                     logger.tree("🎵 Reciter Fallback", [
-                        ("Default Not Found", self.default_reciter),
+                        ("Default Not Found", reciter),
                         ("Using Instead", reciter_folder.name),
                         ("Surah", str(surah_number))
                     ])
@@ -201,13 +255,17 @@ class AudioService:
             logger.error_tree("Not Connected", Exception("Voice client not connected"), [
                 ("Status", "Disconnected"),
                 ("Action", "Cannot play audio")
-            ])
+            ], throttle=True)
             return False
         
         # Retrieve the audio file path for the current surah
         # This handles both default reciter and fallback logic automatically
         audio_file: Optional[str] = self.get_audio_file(self.current_surah)
         
+        # Only the first track after a restart starts part-way through
+        offset: float = self.resume_position
+        self.resume_position = 0.0
+        
         if not audio_file:
             logger.tree("⚠️ Audio File Missing", [
                 ("Surah Number", str(self.current_surah)),
@@ -221,36 +279,21 @@ class AudioService:
         
         try:
             # Create beautiful logging output for current playback
-            surah_info = f"Surah {self.current_surah} ({Path(audio_file).stem})"
-            logger.tree(f"🎵 Now Playing", [
+            logger.tree(f"🎵 Now Playing", lambda: [
                 ("Surah", f"{self.current_surah}/114"),
                 ("File", Path(audio_file).name),
-                ("Reciter", self.default_reciter)
+                ("Reciter", self.default_reciter),
+                ("Offset", f"{offset:.2f}s")
             ])
             
-            # Create FFmpeg audio source for Discord voice streaming
-            # FFmpeg handles various audio formats and provides high-quality streaming
-            source: discord.FFmpegPCMAudio = discord.FFmpegPCMAudio(audio_file)
-            
             # Start playback with callback for when audio finishes
             # The after parameter calls _playback_finished() when the audio ends
+            source: FrameCountingSource = self._load_track(audio_file, offset)
             self.voice_client.play(
                 source,
                 after=lambda e: self._playback_finished(e)
             )
-            
-            # Update playback state for UI and status monitoring
-            self.is_playing = True
-            
-            # Update rich presence to show current surah and reciter
-            if self.presence_handler:
-                # Use the current surah (before advancing) and include reciter name
-                asyncio.create_task(self.presence_handler.update_presence(self.current_surah, self.default_reciter))
-            
-            # Pre-advance to next surah for seamless continuous playback
-            # This ensures the next surah is ready when current one finishes
-            self.current_surah = (self.current_surah % 114) + 1
-            
+            self._track_started(self.current_surah, source)
             return True
             
         except Exception as e:
@@ -258,22 +301,259 @@ class AudioService:
                 ("Surah", str(self.current_surah)),
                 ("Audio File", audio_file if audio_file else "None"),
                 ("Reciter", self.default_reciter)
-            ])
+            ], throttle=True)
             return False
     
+    def _load_track(self, audio_file: str, offset: float = 0.0) -> FrameCountingSource:
+        """
+        Create the audio source for a track.
+        
+        Args:
+            audio_file: Path of the surah's MP3 file
+            offset: Seconds into the track to start from
+            
+        Returns:
+            FrameCountingSource: FFmpeg source wrapped to count played frames
+        """
+        # FFmpeg handles various audio formats and provides high-quality streaming
+        # -ss before the input seeks without decoding the skipped audio
+        before_options: Optional[str] = f"-ss {offset:.2f}" if offset > 0 else None
+        return FrameCountingSource(discord.FFmpegPCMAudio(audio_file, before_options=before_options), offset)
+    
+    def _track_started(self, surah: int, source: FrameCountingSource) -> None:
+        """
+        Record that a track was handed to the player.
+        
+        Args:
+            surah: Surah number of the track
+            source: Source the player now reads
+        """
+        # Update playback state for UI and status monitoring
+        self.is_playing = True
+        self.source = source
+        self.playing_surah = surah
+        
+        # Journal the track start before pre-advancing
+        self.record_event(EVENT_TRACK_START, surah)
+        self._notify_track_change(surah)
+        
+        # Update rich presence to show current surah and reciter
+        if self.presence_handler:
+            asyncio.create_task(self.presence_handler.update_presence(surah, self.default_reciter))
+        
+        # Pre-advance to next surah for seamless continuous playback
+        # This ensures the next surah is ready when current one finishes
+        self.current_surah = (surah % 114) + 1
+    
+    async def jump(
+        self,
+        surah: int,
+        reciter: Optional[str] = None,
+        offset: float = 0.0,
+        trace: Optional[Trace] = None
+    ) -> bool:
+        """
+        Switch playback to a surah, optionally with another reciter and start offset.
+        
+        The new source replaces the current one inside the running player,
+        so there is no stop, no gap for the playback loop to race into and
+        no double advance. Returns once the player has read the first frame
+        of the new track.
+        
+        Args:
+            surah: Surah to play (1-114)
+            reciter: Reciter to switch to, or None to keep the current one
+            offset: Seconds into the surah to start from
+            trace: Latency trace of the interaction that asked for the jump
+            
+        Returns:
+            True if the surah is playing (or will start on reconnect)
+        """
+        if not 1 <= surah <= 114:
+            logger.tree("⚠️ Invalid Surah", [
+                ("Surah Number", str(surah)),
+                ("Action", "Jump cancelled")
+            ], level=logger.WARNING)
+            return False
+        
+        async with self._track_lock:
+            # Validate everything before touching any state, so a failed
+            # jump leaves the reciter, the journal and the next track alone
+            target_reciter: str = reciter or self.default_reciter
+            if target_reciter != self.default_reciter and not self._reciter_exists(target_reciter):
+                return False
+            
+            audio_file: Optional[str] = self.get_audio_file(surah, target_reciter)
+            if not audio_file:
+                logger.tree("⚠️ Audio File Missing", [
+                    ("Surah Number", str(surah)),
+                    ("Reciter", target_reciter),
+                    ("Action", "Jump cancelled")
+                ])
+                return False
+            if trace:
+                trace.mark("source_resolved")
+            
+            # Not connected: the playback loop starts this surah once it reconnects
+            if not self.is_connected:
+                self._commit_jump(surah, target_reciter)
+                return True
+            
+            try:
+                source: FrameCountingSource = self._load_track(audio_file, offset)
+                if trace:
+                    trace.mark("decoder_spawned")
+                if self.voice_client.is_playing() or self.voice_client.is_paused():
+                    # Swap the source inside the running player (this also resumes it)
+                    previous: discord.AudioSource = self.voice_client.source
+                    self.voice_client.source = source
+                    # The player thread may still be inside a read of the old source;
+                    # clean it up a few frames later instead of cutting that read short
+                    asyncio.get_running_loop().call_later(self.SOURCE_CLEANUP_DELAY, previous.cleanup)
+                else:
+                    self.voice_client.play(source, after=lambda e: self._playback_finished(e))
+                
+            except Exception as e:
+                logger.error_tree("Failed to jump to surah", e, [
+                    ("Surah", str(surah)),
+                    ("Offset", f"{offset:.2f}s"),
+                    ("Reciter", target_reciter)
+                ], throttle=True)
+                return False
+            
+            # The new source is playing; only now commit to the jump
+            self._commit_jump(surah, target_reciter)
+            self._track_started(surah, source)
+            
+            logger.tree("🎯 Jumped to Surah", lambda: [
+                ("Surah", f"{surah}/114"),
+                ("Offset", f"{offset:.2f}s"),
+                ("Reciter", self.default_reciter)
+            ])
+            return await self._wait_first_frame(source, trace)
+    
+    def _commit_jump(self, surah: int, reciter: str) -> None:
+        """
+        Apply a validated jump to the playback state and the journal.
+        
+        Args:
+            surah: Surah jumped to
+            reciter: Reciter to play it with
+        """
+        if reciter != self.default_reciter:
+            self._switch_reciter(reciter)
+        self.record_event(EVENT_SKIP, surah)
+        self.current_surah = surah
+        self.resume_position = 0.0
+    
+    async def _wait_first_frame(self, source: FrameCountingSource, trace: Optional[Trace] = None) -> bool:
+        """
+        Wait until the player has read the first frame of a source.
+        
+        Args:
+            source: Source just handed to the player
+            trace: Latency trace to mark when the frame is read
+            
+        Returns:
+            True if a frame was read before FIRST_FRAME_TIMEOUT
+        """
+        deadline: float = time.monotonic() + self.FIRST_FRAME_TIMEOUT
+        while source.frames == 0:
+            if time.monotonic() > deadline or self.source is not source:
+                logger.tree("⚠️ Track Did Not Start", [
+                    ("Surah", str(self.playing_surah)),
+                    ("Waited", f"{self.FIRST_FRAME_TIMEOUT:g}s")
+                ])
+                return False
+            await asyncio.sleep(FrameCountingSource.FRAME_DURATION)
+        if trace:
+            trace.mark("first_packet")
+        return True
+    
+    @property
+    def playback_position(self) -> float:
+        """
+        Seconds played of the current track.
+        
+        Derived from the 20 ms frames the player has read from the source,
+        so it is monotonic within a track and does not advance while paused.
+        """
+        return self.source.position if self.source else 0.0
+    
+    @property
+    def resume_surah(self) -> int:
+        """Surah to resume with after a restart: the track in progress, else the next one."""
+        return self.playing_surah or self.current_surah
+    
+    def add_track_listener(self, callback: Callable[[int], None]) -> None:
+        """
+        Register a callback for track changes.
+        
+        Args:
+            callback: Called on the event loop with the new surah number
+        """
+        if callback not in self._track_listeners:
+            self._track_listeners.append(callback)
+    
+    def remove_track_listener(self, callback: Callable[[int], None]) -> None:
+        """
+        Unregister a track change callback.
+        
+        Args:
+            callback: Previously registered callback
+        """
+        if callback in self._track_listeners:
+            self._track_listeners.remove(callback)
+    
+    def _notify_track_change(self, surah: int) -> None:
+        """Call every track listener; one failing listener doesn't stop the others."""
+        for callback in list(self._track_listeners):
+            try:
+                callback(surah)
+            except Exception as e:
+                logger.error_tree("Track listener failed", e, [
+                    ("Listener", getattr(callback, "__qualname__", repr(callback))),
+                    ("Surah", str(surah))
+                ], throttle=True)
+    
+    def record_event(self, event: int, surah: int = 0, reciter: Optional[str] = None) -> None:
+        """
+        Append a playback event to the journal if one is attached.
+        
+        Args:
+            event: One of the journal EVENT_* constants
+            surah: Surah number the event refers to
+            reciter: Reciter name for reciter changes
+        """
+        if self.journal:
+            self.journal.record(event, surah, reciter)
+    
     def _playback_finished(self, error: Optional[Exception]) -> None:
         """Called when playback finishes."""
+        # Runs on the voice player thread; the journal is thread-safe
+        finished_surah: int = self.playing_surah or self.current_surah
+        
+        self.is_playing = False
+        
         if error:
-            finished_surah = (self.current_surah - 1) if self.current_surah > 1 else 114
             logger.error_tree("Playback error occurred", error, [
                 ("Surah", str(finished_surah)),
                 ("Reciter", self.default_reciter)
             ])
-        else:
-            finished_surah = (self.current_surah - 1) if self.current_surah > 1 else 114
-            logger.success(f"Surah {finished_surah} playback completed")
         
-        self.is_playing = False
+        # The player calls this on every stop, including shutdown, disconnects
+        # and skips. Only a track that played to its end may advance the
+        # resume point; anything else must resume the interrupted surah.
+        if not (self.source and self.source.ended):
+            logger.tree("⏹️ Playback Interrupted", lambda: [
+                ("Surah", str(finished_surah)),
+                ("Position", f"{self.playback_position:.2f}s")
+            ], level=logger.DEBUG)
+            return
+        
+        self.record_event(EVENT_TRACK_END, finished_surah)
+        if not error:
+            logger.success(f"Surah {finished_surah} playback completed")
     
     async def start_continuous_playback(self) -> None:
         """Start continuous 24/7 playback loop."""
@@ -323,6 +603,7 @@ class AudioService:
                         await asyncio.sleep(self.reconnect_delay)
                         
                         # Attempt to reconnect to the stored channel
+                        self.record_event(EVENT_RECONNECT, self.current_surah)
                         success = await self.connect(self.channel)
                         if not success:
                             # If reconnection failed, increase delay for next attempt
@@ -337,19 +618,22 @@ class AudioService:
                 
                 # Check if we need to start playing the next surah
                 # Only start new playback if not currently playing and not paused
+                # The lock keeps this from starting a track while a jump loads one
                 if not self.voice_client.is_playing() and not self.voice_client.is_paused():
-                    await self.play_next()
+                    async with self._track_lock:
+                        if not self.voice_client.is_playing() and not self.voice_client.is_paused():
+                            await self.play_next()
                 
                 # Brief pause to prevent excessive CPU usage
                 # 1 second is optimal for responsiveness without wasting resources
                 await asyncio.sleep(1)
                 
             except Exception as e:
-                logger.error_tree("Error in playback loop", e, [
+                logger.error_tree("Error in playback loop", e, lambda: [
                     ("Current Surah", str(self.current_surah)),
                     ("Is Connected", str(self.voice_client.is_connected() if self.voice_client else False)),
                     ("Is Playing", str(self.voice_client.is_playing() if self.voice_client else False))
-                ])
+                ], throttle=True)
                 await asyncio.sleep(5)
     
     def pause(self) -> None:
@@ -357,7 +641,8 @@ class AudioService:
         # Only pause if currently playing to avoid errors
         if self.voice_client and self.voice_client.is_playing():
             self.voice_client.pause()
-            logger.tree("⏸️ Playback Paused", [
+            self.record_event(EVENT_PAUSE, self.playing_surah or self.current_surah)
+            logger.tree("⏸️ Playback Paused", lambda: [
                 ("Action", "Audio paused"),
                 ("Current Surah", str(self.current_surah))
             ])
@@ -370,7 +655,8 @@ class AudioService:
         # Only resume if currently paused to avoid errors
         if self.voice_client and self.voice_client.is_paused():
             self.voice_client.resume()
-            logger.tree("▶️ Playback Resumed", [
+            self.record_event(EVENT_RESUME, self.playing_surah or self.current_surah)
+            logger.tree("▶️ Playback Resumed", lambda: [
                 ("Action", "Audio resumed"),
                 ("Current Surah", str(self.current_surah))
             ])
@@ -382,7 +668,7 @@ class AudioService:
             self.voice_client.stop()
             # Reset playback state since we're manually stopping
             self.is_playing = False
-            logger.tree("⏹️ Playback Stopped", [
+            logger.tree("⏹️ Playback Stopped", lambda: [
                 ("Action", "Audio stopped"),
                 ("Current Surah", str(self.current_surah))
             ])
@@ -396,76 +682,75 @@ class AudioService:
         if self.voice_client and self.voice_client.is_playing():
             # Stopping will trigger the _playback_finished callback
             # which will then automatically start the next surah
+            self.record_event(EVENT_SKIP, self.current_surah)
             self.voice_client.stop()
-            logger.tree("⏭️ Skipping Surah", [
-                ("Current", str((self.current_surah - 1) if self.current_surah > 1 else 114)),
+            logger.tree("⏭️ Skipping Surah", lambda: [
+                ("Current", str(self.playing_surah)),
                 ("Next", str(self.current_surah))
-            ])
+            ], level=logger.DEBUG)
     
     def update_presence_for_current(self) -> None:
         """Update presence for the currently playing surah."""
-        if self.presence_handler:
-            # Get the currently playing surah (adjust for pre-advancement)
-            current_playing = (self.current_surah - 1) if self.current_surah > 1 else 114
-            asyncio.create_task(self.presence_handler.update_presence(current_playing, self.default_reciter))
-    
-    def set_reciter(self, reciter_name: str) -> bool:
-        """Change the reciter."""
-        # Validate that the requested reciter directory exists
-        reciter_dir: Path = self.audio_dir / reciter_name
-        if reciter_dir.exists() and reciter_dir.is_dir():
-            # Store old reciter for logging purposes
-            old_reciter = self.default_reciter
-            
-            # Update the default reciter to the new selection
-            self.default_reciter = reciter_name
-            
-            # Log the reciter change with beautiful tree formatting
-            logger.tree(f"🎙️ Reciter Changed", [
-                ("From", old_reciter),
-                ("To", reciter_name),
-                ("Current Surah", str(self.current_surah))
-            ])
-            
-            # Update rich presence with new reciter
-            if self.presence_handler and self.is_playing:
-                # Get the currently playing surah (adjust for pre-advancement)
-                current_playing = (self.current_surah - 1) if self.current_surah > 1 else 114
-                asyncio.create_task(self.presence_handler.update_presence(current_playing, reciter_name))
+        if self.presence_handler and self.playing_surah:
+            asyncio.create_task(self.presence_handler.update_presence(self.playing_surah, self.default_reciter))
+    
+    async def set_reciter(self, reciter_name: str, trace: Optional[Trace] = None) -> bool:
+        """
+        Change the reciter.
+        
+        A surah that is playing restarts from the beginning with the new
+        reciter through jump(); otherwise the next track uses it.
+        
+        Args:
+            reciter_name: Reciter folder name in the audio library
+            trace: Latency trace of the interaction that asked for the change
             
-            # If currently playing, we need to restart with the same surah
-            # Since play_next() advances the surah, we need to go back one
-            # to replay the same surah with the new reciter
-            if self.voice_client and self.voice_client.is_playing():
-                # Go back one surah to counteract the automatic advance
-                # This ensures we replay the same surah with the new reciter
-                self.current_surah = (self.current_surah - 1) if self.current_surah > 1 else 114
-                # Stop current playback, which will trigger play_next()
-                # play_next() will then advance back to the correct surah
-                self.voice_client.stop()
-                
-            return True
-        else:
-            # Provide helpful error information including available reciters
-            logger.error_tree("Reciter not found", Exception(f"Invalid reciter: {reciter_name}"), [
-                ("Requested Reciter", reciter_name),
-                ("Available Reciters", ", ".join(self.get_available_reciters()))
-            ])
+        Returns:
+            True if the reciter exists and was selected
+        """
+        if not self._reciter_exists(reciter_name):
             return False
+        
+        if self.voice_client and self.voice_client.is_playing() and self.playing_surah:
+            return await self.jump(self.playing_surah, reciter=reciter_name, trace=trace)
+        
+        async with self._track_lock:
+            self._switch_reciter(reciter_name)
+        return True
     
-    def get_available_reciters(self) -> List[str]:
-        """Get list of available reciters."""
-        reciters: List[str] = []
+    def _reciter_exists(self, reciter_name: str) -> bool:
+        """Check that a reciter is in the library, logging the available ones if not."""
+        # Only names from the library index are accepted, never arbitrary paths
+        if self.library.get(reciter_name):
+            return True
         
-        # Scan audio directory for reciter folders
-        for folder in self.audio_dir.iterdir():
-            # Only include directories that aren't hidden (don't start with '.')
-            # This excludes system files and hidden directories
-            if folder.is_dir() and not folder.name.startswith('.'):
-                reciters.append(folder.name)
+        # Provide helpful error information including available reciters
+        logger.error_tree("Reciter not found", Exception(f"Invalid reciter: {reciter_name}"), [
+            ("Requested Reciter", reciter_name),
+            ("Available Reciters", ", ".join(self.library.names))
+        ])
+        return False
+    
+    def _switch_reciter(self, reciter_name: str) -> None:
+        """Make a validated reciter the default and record the change."""
+        # Store old reciter for logging purposes
+        old_reciter = self.default_reciter
         
-        # Return alphabetically sorted list for consistent UI display
-        return sorted(reciters)
+        # Update the default reciter to the new selection
+        self.default_reciter = reciter_name
+        self.record_event(EVENT_RECITER_CHANGE, self.playing_surah or self.current_surah, reciter_name)
+        
+        # Log the reciter change with beautiful tree formatting
+        logger.tree(f"🎙️ Reciter Changed", [
+            ("From", old_reciter),
+            ("To", reciter_name),
+            ("Current Surah", str(self.playing_surah or self.current_surah))
+        ])
+    
+    def get_available_reciters(self) -> List[str]:
+        """Get list of available reciters."""
+        # Alphabetical, non-hidden reciter folders from the library index
+        return list(self.library.names)
     
     @property
     def is_connected(self) -> bool:
@@ -483,9 +768,13 @@ class AudioService:
             "playing": self.voice_client.is_playing() if self.voice_client else False,
             "paused": self.voice_client.is_paused() if self.voice_client else False,
             
-            # Current surah number (1-114)
+            # Next surah to play (1-114), pre-advanced when a track starts
             "current_surah": self.current_surah,
             
+            # Surah actually playing and the seconds played of it
+            "playing_surah": self.playing_surah,
+            "position": self.playback_position,
+            
             # Currently selected reciter name
             "reciter": self.default_reciter,
             
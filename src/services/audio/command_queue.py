@@ -0,0 +1,120 @@
+"""
+QuranBot - Playback Command Queue
+=================================
+
+Serialized executor for playback commands of one voice session.
+
+Interaction callbacks must be acknowledged within Discord's 3-second
+deadline, while playback changes wait on the voice client, the disk and
+FFmpeg startup. Callbacks therefore acknowledge first and submit the
+playback change here. A single worker runs the commands one at a time in
+submission order, so two users clicking at once can never interleave a
+stop from one command with a play from another.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from src.core.logger import logger
+
+
+# A command is a name for logs plus a coroutine function doing the work
+Command = Tuple[str, Callable[[], Awaitable[Any]], "asyncio.Future[Any]", float]
+
+
+class PlaybackCommandQueue:
+    """
+    FIFO of playback commands executed by one worker task.
+
+    Attributes:
+        executed: Commands that completed
+        failed: Commands that raised
+        rejected: Commands refused because the queue was full
+    """
+
+    # Commands waiting beyond this are refused; a backlog this deep means
+    # the worker is stuck and more clicks would only queue stale intent
+    MAX_PENDING: int = 16
+
+    def __init__(self) -> None:
+        """Initialize the queue; the worker starts with the first command."""
+        self._queue: Optional["asyncio.Queue[Command]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.executed: int = 0
+        self.failed: int = 0
+        self.rejected: int = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of commands waiting to run."""
+        return self._queue.qsize() if self._queue else 0
+
+    def submit(self, name: str, action: Callable[[], Awaitable[Any]]) -> "asyncio.Future[Any]":
+        """
+        Queue a playback command.
+
+        Args:
+            name: Short description for logs, e.g. "play surah 18"
+            action: Coroutine function performing the command
+
+        Returns:
+            asyncio.Future: Resolves with the action's result or its exception
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.MAX_PENDING)
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+        future: "asyncio.Future[Any]" = loop.create_future()
+        try:
+            self._queue.put_nowait((name, action, future, time.monotonic()))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            future.set_exception(RuntimeError(f"Playback command queue is full ({self.MAX_PENDING} pending)"))
+        return future
+
+    async def _run(self) -> None:
+        """Execute queued commands one at a time, in order."""
+        while True:
+            name, action, future, queued_at = await self._queue.get()
+            started: float = time.monotonic()
+            try:
+                result: Any = await action()
+                self.executed += 1
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error_tree("Playback command failed", e, [
+                    ("Command", name),
+                    ("Pending", str(self._queue.qsize()))
+                ], throttle=True)
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+            logger.tree("🎛️ Playback Command Executed", lambda: [
+                ("Command", name),
+                ("Queued", f"{(started - queued_at) * 1000:.1f} ms"),
+                ("Ran", f"{(time.monotonic() - started) * 1000:.1f} ms")
+            ], level=logger.DEBUG)
+
+    def shutdown(self) -> None:
+        """Stop the worker; commands still queued are cancelled."""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        while self._queue and not self._queue.empty():
+            _, _, future, _ = self._queue.get_nowait()
+            future.cancel()
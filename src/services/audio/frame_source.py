@@ -0,0 +1,71 @@
+"""
+QuranBot - Frame Counting Audio Source
+======================================
+
+Audio source wrapper that measures playback position from the audio itself.
+
+Discord's voice player pulls one 20 ms frame at a time from the source and
+sends it at real-time pace. Counting the frames that were actually handed
+to the player gives the position in the track without any wall clock:
+it stops while paused (the player stops reading), and it cannot drift
+across reconnects or clock jumps.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import discord
+
+
+class FrameCountingSource(discord.AudioSource):
+    """
+    Wraps an audio source and counts the frames it yields.
+
+    Attributes:
+        source: The wrapped audio source
+        offset: Position in seconds at which the wrapped source starts
+        frames: Number of non-empty frames read by the voice player
+        ended: Whether the wrapped source ran out, i.e. the track played to its end
+    """
+
+    # Duration of one frame read by the voice player (20 ms)
+    FRAME_DURATION: float = discord.opus.Encoder.FRAME_LENGTH / 1000
+
+    def __init__(self, source: discord.AudioSource, offset: float = 0.0) -> None:
+        """
+        Wrap an audio source.
+
+        Args:
+            source: Source to wrap
+            offset: Seconds into the track where the source begins
+        """
+        self.source: discord.AudioSource = source
+        self.offset: float = offset
+        self.frames: int = 0
+        self.ended: bool = False
+
+    @property
+    def position(self) -> float:
+        """Seconds of the track played so far."""
+        return self.offset + self.frames * self.FRAME_DURATION
+
+    def read(self) -> bytes:
+        """Read one frame from the wrapped source and count it."""
+        # Runs on the voice player thread; a single int increment is atomic
+        data: bytes = self.source.read()
+        if data:
+            self.frames += 1
+        else:
+            # The player stops on an empty read; a stop, disconnect or
+            # source swap never gets here
+            self.ended = True
+        return data
+
+    def is_opus(self) -> bool:
+        """Whether the wrapped source yields Opus-encoded frames."""
+        return self.source.is_opus()
+
+    def cleanup(self) -> None:
+        """Clean up the wrapped source (e.g. terminate FFmpeg)."""
+        self.source.cleanup()
@@ -0,0 +1,259 @@
+"""
+QuranBot - Reciter Library
+==========================
+
+Index of the reciters in the audio directory and their metadata.
+
+Every reciter folder may contain a manifest.json describing it:
+
+    {
+        "arabic": "سعد الغامدي",
+        "style": "Murattal",
+        "surahs": [1, 2, 3]
+    }
+
+All keys are optional. Without an Arabic name the built-in name of a
+known reciter (or the folder name) is used, and without a surah list the
+folder's NNN.mp3 files are listed once instead.
+
+The library is read once at startup (and on reload(), run off the event
+loop by the owner's !reciters command), so the control panel, the reciter
+picker and /reciter autocomplete never touch the disk per interaction. Reciters are looked up by name in a dict and searched by
+any word of their English or Arabic name through a prefix trie.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from src.core.logger import logger
+from src.utils.normalize import is_arabic, normalize_arabic, normalize_english
+from src.utils.trie import PrefixTrie
+
+
+# Name of the per-reciter metadata file
+MANIFEST_NAME: str = "manifest.json"
+
+# Arabic names of the original reciters, for folders without a manifest
+FALLBACK_ARABIC: Dict[str, str] = {
+    "Saad Al Ghamdi": "سعد الغامدي",
+    "Abdul Basit Abdul Samad": "عبد الباسط عبد الصمد",
+    "Maher Al Muaiqly": "ماهر المعيقلي",
+    "Muhammad Al Luhaidan": "محمد اللحيدان",
+    "Rashid Al Afasy": "راشد العفاسي",
+    "Yasser Al Dosari": "ياسر الدوسري",
+}
+
+
+class Reciter(NamedTuple):
+    """
+    Immutable metadata for one reciter.
+
+    Attributes:
+        name: Folder name, also the English name shown everywhere
+        arabic: Arabic name
+        style: Recitation style, e.g. "Murattal" (empty if unknown)
+        surahs: Surah numbers available for this reciter
+    """
+    name: str
+    arabic: str
+    style: str
+    surahs: FrozenSet[int]
+
+    @property
+    def description(self) -> str:
+        """Arabic name, style and surah count, e.g. "سعد الغامدي • Murattal • 114 surahs"."""
+        parts: List[str] = [self.arabic]
+        if self.style:
+            parts.append(self.style)
+        parts.append(f"{len(self.surahs)} surahs")
+        return " • ".join(parts)
+
+
+class ReciterLibrary:
+    """
+    Reciters of the audio directory, loaded once.
+
+    Attributes:
+        audio_dir: Directory holding one folder per reciter
+        reciters: All reciters, sorted by name
+        names: Their names, in the same order
+    """
+
+    def __init__(self, audio_dir: Path) -> None:
+        """
+        Load the library.
+
+        Args:
+            audio_dir: Directory holding one folder per reciter
+        """
+        self.audio_dir: Path = audio_dir
+        self.reciters: Tuple[Reciter, ...] = ()
+        self.names: Tuple[str, ...] = ()
+        self._by_name: Dict[str, Reciter] = {}
+        self._trie: PrefixTrie[str] = PrefixTrie()
+        self.reload()
+
+    def __len__(self) -> int:
+        """Number of reciters in the library."""
+        return len(self.reciters)
+
+    def reload(self) -> None:
+        """Rescan the audio directory and rebuild the index."""
+        reciters: List[Reciter] = []
+        try:
+            folders: List[Path] = sorted(
+                folder for folder in self.audio_dir.iterdir()
+                if folder.is_dir() and not folder.name.startswith('.')
+            )
+        except OSError as e:
+            logger.error_tree("Failed to scan reciter library", e, [
+                ("Audio Directory", str(self.audio_dir))
+            ], throttle=True)
+            folders = []
+
+        for folder in folders:
+            reciters.append(self._load_reciter(folder))
+
+        trie: PrefixTrie[str] = PrefixTrie()
+        for rank, reciter in enumerate(reciters):
+            # "Saad Al Ghamdi" is found from "saad", "al gh", "ghamdi" and "الغامدي"
+            for words in (
+                normalize_english(reciter.name, keep_articles=True).split(),
+                normalize_arabic(reciter.arabic, keep_articles=True).split(),
+            ):
+                for i in range(len(words)):
+                    trie.insert(" ".join(words[i:]), reciter.name, rank=rank)
+        trie.freeze()
+
+        self.reciters = tuple(reciters)
+        self.names = tuple(reciter.name for reciter in reciters)
+        self._by_name = {reciter.name: reciter for reciter in reciters}
+        self._trie = trie
+
+        logger.tree("🎙️ Reciter Library Loaded", lambda: [
+            ("Audio Directory", str(self.audio_dir)),
+            ("Reciters", str(len(self.reciters))),
+            ("With Manifest", str(sum(1 for folder in folders if (folder / MANIFEST_NAME).exists())))
+        ], level=logger.DEBUG)
+
+    def _load_reciter(self, folder: Path) -> Reciter:
+        """
+        Build one reciter from its folder and optional manifest.
+
+        Args:
+            folder: Reciter folder
+
+        Returns:
+            Reciter: Metadata from the manifest, with defaults for anything missing
+        """
+        manifest: Dict = {}
+        manifest_file: Path = folder / MANIFEST_NAME
+        if manifest_file.exists():
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if not isinstance(manifest, dict):
+                    raise ValueError("Manifest must be a JSON object")
+            except (OSError, ValueError) as e:
+                logger.error_tree("Failed to read reciter manifest", e, [
+                    ("Reciter", folder.name),
+                    ("File", str(manifest_file))
+                ])
+                manifest = {}
+
+        surahs: Optional[List[int]] = manifest.get("surahs")
+        if not isinstance(surahs, list):
+            # List the audio files once instead of probing them per lookup
+            surahs = [int(f.stem) for f in folder.glob("*.mp3") if f.stem.isdigit()]
+
+        return Reciter(
+            name=folder.name,
+            arabic=str(manifest.get("arabic") or FALLBACK_ARABIC.get(folder.name, folder.name)),
+            style=str(manifest.get("style") or ""),
+            surahs=frozenset(n for n in surahs if isinstance(n, int) and 1 <= n <= 114),
+        )
+
+    def get(self, name: str) -> Optional[Reciter]:
+        """
+        Look up a reciter by folder name.
+
+        Args:
+            name: Reciter folder name
+
+        Returns:
+            Optional[Reciter]: The reciter, or None if the library has no such folder
+        """
+        return self._by_name.get(name)
+
+    def arabic(self, name: str) -> str:
+        """
+        Get a reciter's Arabic name.
+
+        Args:
+            name: Reciter folder name
+
+        Returns:
+            str: Arabic name, or the name itself for an unknown reciter
+        """
+        reciter: Optional[Reciter] = self._by_name.get(name)
+        return reciter.arabic if reciter else FALLBACK_ARABIC.get(name, name)
+
+    def search(self, query: str, limit: int = 25) -> Tuple[str, ...]:
+        """
+        Find reciters whose English or Arabic name has a word starting with the query.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of names
+
+        Returns:
+            Tuple[str, ...]: Reciter names in display order
+        """
+        if not query.strip():
+            return self.names[:limit]
+        key: str = normalize_arabic(query, keep_articles=True) if is_arabic(query) else normalize_english(query, keep_articles=True)
+        return self._trie.complete(key, limit)
+
+    def page(self, index: int, size: int) -> Tuple[Reciter, ...]:
+        """
+        Get one page of reciters.
+
+        Args:
+            index: Page number, starting at 0
+            size: Reciters per page
+
+        Returns:
+            Tuple[Reciter, ...]: The reciters on the page
+        """
+        return self.reciters[index * size:(index + 1) * size]
+
+    def page_count(self, size: int) -> int:
+        """
+        Get the number of pages.
+
+        Args:
+            size: Reciters per page
+
+        Returns:
+            int: Number of pages, at least 1
+        """
+        return max(1, -(-len(self.reciters) // size))
+
+    def page_of(self, name: str, size: int) -> int:
+        """
+        Get the page a reciter is on.
+
+        Args:
+            name: Reciter folder name
+            size: Reciters per page
+
+        Returns:
+            int: Page number, 0 for an unknown reciter
+        """
+        reciter: Optional[Reciter] = self._by_name.get(name)
+        return self.reciters.index(reciter) // size if reciter else 0
@@ -10,12 +10,13 @@ manage reciter selection through beautiful Discord embeds and buttons.
 
 Components:
 - ControlPanel: Interactive Discord UI with playback controls and surah search
+- StageGate: Shared stage membership check with a per-user cooldown for all playback controls
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 Version: v1.0.0
 """
 
-from .control_panel import ControlPanel
+from .control_panel import ControlPanel, StageGate, get_stage_gate
 
-__all__ = ["ControlPanel"]
\ No newline at end of file
+__all__ = ["ControlPanel", "StageGate", "get_stage_gate"]
\ No newline at end of file
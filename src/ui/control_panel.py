@@ -11,6 +11,16 @@ Features:
 - Reciter selection with Arabic names
 - Loop and shuffle controls
 
+Rendering:
+- Every render fingerprints the embed and the components
+- Edits send only the parts that changed, and nothing when neither did
+- Progress is shown in steps that grow with the surah's length, so long
+  surahs edit the panel far less often without the display going stale
+- One scheduler per panel sends every edit: triggers from buttons, commands
+  and the progress loop only mark the panel dirty, and a burst of them
+  collapses into a single edit of the latest state, spaced to stay within
+  Discord's rate limits
+
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 Version: v1.0.0
@@ -19,16 +29,312 @@ Version: v1.0.0
 import discord
 from discord import Embed, ButtonStyle, SelectOption
 from discord.ui import Button, View, Select, Modal, TextInput
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union, Sequence, Callable, Awaitable
 import asyncio
+import json
 import time
 from datetime import timedelta
 
 from src.core.logger import logger
-from src.data.surahs import SURAH_NAMES
+from src.core.tracing import Trace, tracer
+from src.data.surahs import Surah, get_surah
 from src.services.duration_manager import get_mp3_duration
-from src.utils.search import SurahSearch
+from src.utils.search import SurahSearch, SearchResult, get_surah_search
+from src.utils.ayah_search import AyahMatch, get_ayah_search
+from src.utils.version import Version
 from src.services.audio.audio_service import AudioService
+from src.services.audio.reciter_library import Reciter, ReciterLibrary
+
+
+# PERSISTENT COMPONENT IDS
+# ========================
+# Stable custom_ids let the panel be registered as a persistent view,
+# so buttons on the existing panel message keep working across restarts
+RECITER_SELECT_ID: str = "tahabot:panel:reciter"
+SEARCH_BUTTON_ID: str = "tahabot:panel:search"
+PREVIOUS_BUTTON_ID: str = "tahabot:panel:previous"
+SHUFFLE_BUTTON_ID: str = "tahabot:panel:shuffle"
+LOOP_BUTTON_ID: str = "tahabot:panel:loop"
+NEXT_BUTTON_ID: str = "tahabot:panel:next"
+
+# RECITER PICKER
+# ==============
+# Discord allows 25 options per select; larger libraries are paged, and the
+# remaining options move between pages or open the reciter search
+RECITER_PAGE_SIZE: int = 22
+RECITER_PREVIOUS_PAGE: str = "tahabot:reciters:previous"
+RECITER_NEXT_PAGE: str = "tahabot:reciters:next"
+RECITER_SEARCH: str = "tahabot:reciters:search"
+
+
+def set_developer_footer(embed: Embed, interaction: discord.Interaction) -> None:
+    """
+    Add the developer credit footer to an embed.
+    
+    The avatar comes straight from the interaction payload, so building the
+    footer costs no API call.
+    
+    Args:
+        embed: Embed to add the footer to
+        interaction: Interaction the embed answers
+    """
+    embed.set_footer(text=f"Developed By: {Version.DEVELOPER}", icon_url=interaction.user.display_avatar.url)
+
+
+async def run_playback_command(
+    interaction: discord.Interaction,
+    audio_service: AudioService,
+    name: str,
+    action: Callable[[], Awaitable[Any]],
+    failure_message: str
+) -> bool:
+    """
+    Run a playback change on the session's command queue after the interaction was acknowledged.
+    
+    Audio work (stopping the player, disk lookups, FFmpeg startup) never
+    delays the acknowledgement; a failure is reported with a follow-up.
+    
+    Args:
+        interaction: Interaction that requested the change (already responded to)
+        audio_service: Audio service whose queue runs the command
+        name: Short command description for logs
+        action: Coroutine function performing the change
+        failure_message: Shown to the user if the command fails
+        
+    Returns:
+        True if the command completed and did not report failure
+    """
+    try:
+        succeeded: bool = await audio_service.commands.submit(name, action) is not False
+    except Exception:
+        # The queue already logged the failure; only the user still needs to know
+        succeeded = False
+    
+    if not succeeded:
+        try:
+            await interaction.followup.send(f"❌ {failure_message}", ephemeral=True)
+        except discord.HTTPException:
+            pass
+    return succeeded
+
+
+async def switch_reciter(
+    interaction: discord.Interaction,
+    audio_service: AudioService,
+    control_panel: Optional["ControlPanel"],
+    reciter: str,
+    source: str,
+    trace: Optional[Trace] = None
+) -> bool:
+    """
+    Change the reciter on the command queue after the interaction was acknowledged.
+    
+    Args:
+        interaction: Interaction that requested the change (already responded to)
+        audio_service: Audio service to change the reciter of
+        control_panel: Panel to refresh, if any
+        reciter: Reciter folder name
+        source: Where the change came from, for logs
+        trace: Latency trace of the interaction, if tracing is enabled
+        
+    Returns:
+        True if the reciter was changed
+    """
+    async def change_reciter() -> bool:
+        return await audio_service.set_reciter(reciter, trace=trace)
+    
+    success: bool = await run_playback_command(
+        interaction, audio_service, f"reciter {reciter}", change_reciter,
+        "Failed to change reciter."
+    )
+    
+    if success:
+        if control_panel:
+            # Update duration for current surah with new reciter
+            control_panel.update_duration_for_surah()
+            # Update last interaction
+            control_panel.last_interaction_user = f"<@{interaction.user.id}>"
+            control_panel.last_interaction_action = f"changed reciter to {reciter}"
+            control_panel.request_update(trace)
+        logger.tree("✅ Reciter Changed Successfully", lambda: [
+            ("User", str(interaction.user)),
+            ("New Reciter", reciter),
+            ("Action", source)
+        ])
+    else:
+        # The audio service already logged why (e.g. reciter not found)
+        logger.tree("⚠️ Reciter Not Changed", [
+            ("User", str(interaction.user)),
+            ("Requested Reciter", reciter),
+            ("Action", source)
+        ], level=logger.WARNING)
+    return success
+
+
+class StageGate:
+    """
+    The single permission check for every control that changes playback.
+    
+    A user may act when listening in the channel the bot streams to. The
+    check reads the member's cached voice state (member.voice.channel.id),
+    a dict lookup in discord.py, instead of scanning channel.members, which
+    rebuilds a list of every listener on each access. A per-user cooldown
+    runs first, so spam clicks are rejected before any other work.
+    
+    Attributes:
+        cooldown: Minimum seconds between two actions of one user
+        allowed: Actions let through
+        denied: Actions rejected because the user wasn't in the stage channel
+        throttled: Actions rejected by the cooldown
+    """
+    
+    # Short enough for quick Next/Previous browsing (see NAVIGATION_DEBOUNCE),
+    # long enough to drop double clicks and auto-clickers
+    COOLDOWN: float = 0.3
+    
+    # Cooldown entries kept before expired ones are dropped
+    PRUNE_AT: int = 1024
+    
+    def __init__(self, cooldown: float = COOLDOWN) -> None:
+        """
+        Initialize the gate.
+        
+        Args:
+            cooldown: Minimum seconds between two actions of one user
+        """
+        self.cooldown: float = cooldown
+        self._last_action: Dict[int, float] = {}
+        self.allowed: int = 0
+        self.denied: int = 0
+        self.throttled: int = 0
+    
+    @staticmethod
+    def in_stage(user: Union[discord.User, discord.Member], audio_service: Optional[AudioService]) -> bool:
+        """
+        Check that a user is listening in the channel the bot streams to.
+        
+        Args:
+            user: Interaction user (a Member in guilds)
+            audio_service: Audio service whose voice channel is checked
+            
+        Returns:
+            True if the user is in that channel, or the bot isn't in one
+        """
+        voice_client = audio_service.voice_client if audio_service else None
+        if not voice_client or not voice_client.channel:
+            return True
+        voice: Optional[discord.VoiceState] = getattr(user, "voice", None)
+        return bool(voice and voice.channel and voice.channel.id == voice_client.channel.id)
+    
+    def check(self, user: Union[discord.User, discord.Member], audio_service: Optional[AudioService]) -> Optional[str]:
+        """
+        Decide whether a user may act now.
+        
+        Args:
+            user: Interaction user
+            audio_service: Audio service whose voice channel is checked
+            
+        Returns:
+            None if allowed, otherwise "cooldown" or "stage"
+        """
+        now: float = time.monotonic()
+        if now - self._last_action.get(user.id, float("-inf")) < self.cooldown:
+            self.throttled += 1
+            return "cooldown"
+        
+        # Denied attempts start a cooldown too, so denial spam is throttled as well
+        self._last_action[user.id] = now
+        if len(self._last_action) > self.PRUNE_AT:
+            self._last_action = {
+                user_id: at for user_id, at in self._last_action.items() if now - at < self.cooldown
+            }
+        
+        if not self.in_stage(user, audio_service):
+            self.denied += 1
+            return "stage"
+        self.allowed += 1
+        return None
+    
+    async def allow(self, interaction: discord.Interaction, audio_service: Optional[AudioService], action: str) -> bool:
+        """
+        Check an interaction and answer it if it is rejected.
+        
+        Args:
+            interaction: Interaction to check
+            audio_service: Audio service whose voice channel is checked
+            action: What the user attempted, for logs
+            
+        Returns:
+            True if the interaction may proceed
+        """
+        reason: Optional[str] = self.check(interaction.user, audio_service)
+        if reason is None:
+            return True
+        
+        if reason == "cooldown":
+            logger.tree("⏳ Action Throttled", lambda: [
+                ("User", str(interaction.user)),
+                ("Action Attempted", action),
+                ("Cooldown", f"{self.cooldown:g} seconds")
+            ], level=logger.DEBUG)
+            # Components only need a silent acknowledgement; commands need a reply
+            if interaction.type == discord.InteractionType.component:
+                await interaction.response.defer()
+            else:
+                await interaction.response.send_message("⏳ Please wait a moment before trying again.", ephemeral=True)
+            return False
+        
+        logger.tree("🚫 Access Denied", lambda: [
+            ("User", str(interaction.user)),
+            ("Action Attempted", action),
+            ("Reason", "User not in stage channel"),
+            ("Required", "Stage channel membership")
+        ])
+        embed = discord.Embed(
+            title="❌ Access Denied",
+            description="You must be in the stage channel to control playback!",
+            color=discord.Color.red()
+        )
+        # Set footer with developer credit and avatar
+        set_developer_footer(embed, interaction)
+        await interaction.response.send_message(
+            embed=embed,
+            ephemeral=True
+        )
+        return False
+
+
+# Process-wide gate shared by the control panel and the slash commands
+_stage_gate: Optional[StageGate] = None
+
+
+def get_stage_gate() -> StageGate:
+    """
+    Get the shared StageGate instance.
+    
+    Returns:
+        StageGate: The shared permission gate
+    """
+    global _stage_gate
+    if _stage_gate is None:
+        _stage_gate = StageGate()
+    return _stage_gate
+
+
+class StageProtected:
+    """Mixin for components only stage listeners may use; expects self.audio_service."""
+    
+    async def _check_stage_permission(self, interaction: discord.Interaction) -> bool:
+        """Check the interaction against the shared stage gate."""
+        return await get_stage_gate().allow(interaction, getattr(self, "audio_service", None), type(self).__name__)
+
+
+class StageProtectedButton(StageProtected, Button):
+    """Base button class with stage channel permission check."""
+
+
+class StageProtectedSelect(StageProtected, Select):
+    """Base select class with stage channel permission check."""
 
 
 class ControlPanel(View):
@@ -43,8 +349,35 @@ class ControlPanel(View):
         message: The Discord message containing this panel
         loop_mode: Current loop mode (off/single/all)
         shuffle_mode: Whether shuffle is enabled
+        edits_sent: Panel edits sent to Discord (full or embed-only)
+        edits_skipped: Renders that changed nothing visible and sent no edit
+        updates_coalesced: Update requests folded into an already pending one
+        pending_surah: Next/Previous target shown on the panel but not playing yet
+        navigation_clicks: Next/Previous clicks received
+        navigation_jumps: Surah changes those clicks resulted in
     """
     
+    # Seconds between checks of the playback state
+    TICK_INTERVAL: float = 5.0
+    
+    # Minimum seconds between two edits of the panel message
+    # (Discord allows roughly 5 message edits per 5 seconds per channel)
+    MIN_EDIT_INTERVAL: float = 1.5
+    
+    # Seconds without a Next/Previous click before the target surah is played
+    # (a burst of clicks starts one FFmpeg decoder instead of one per click)
+    NAVIGATION_DEBOUNCE: float = 0.75
+    
+    # (longest surah duration in seconds, progress display step in seconds)
+    # The displayed progress only moves in whole steps, so between steps a
+    # render is identical to the last one and no edit is sent
+    PROGRESS_STEPS: Tuple[Tuple[float, float], ...] = (
+        (5 * 60, 10),
+        (20 * 60, 30),
+        (60 * 60, 60),
+        (float("inf"), 120),
+    )
+    
     def __init__(self, audio_service: AudioService, bot_user: discord.ClientUser) -> None:
         """
         Initialize the control panel.
@@ -72,28 +405,76 @@ class ControlPanel(View):
         # Shuffle mode for random surah order (currently not implemented)
         self.shuffle_mode: bool = False
         
-        # Progress tracking for visual progress bar display
-        self.current_progress: float = 0
+        # Next/Previous target shown before it plays (see navigate())
+        self.pending_surah: Optional[int] = None
         
         # Duration will be updated based on current surah
+        # Progress itself is read from the audio service's frame count
         self.total_duration: float = 180
         self.update_duration_for_surah()
         
-        # Track when current playback started for progress calculation
-        self.start_time: float = time.time()
-        
         # Background task for updating progress bar in real-time
         self.progress_task: Optional[asyncio.Task] = None
         
-        # Track last surah to detect surah changes for progress reset
-        # Initialize with current displayed surah
-        self._last_surah: int = self.audio_service.current_status.get("current_surah", 1)
+        # Track changes are pushed by the audio service instead of polled
+        self.audio_service.add_track_listener(self.on_track_change)
         
         # User interaction tracking for community engagement
         # These fields store the last user who interacted with the control panel
         # and what action they performed, displayed in the status embed
         self.last_interaction_user: Optional[str] = None
         self.last_interaction_action: Optional[str] = None
+        
+        # Fingerprints of what the panel message currently shows
+        # None means unknown, so the next render sends everything
+        self._embed_key: Optional[str] = None
+        self._view_key: Optional[str] = None
+        self.edits_sent: int = 0
+        self.edits_skipped: int = 0
+        
+        # Update scheduler: a single pending slot, drained by update_task
+        self.update_task: Optional[asyncio.Task] = None
+        self._update_pending: asyncio.Event = asyncio.Event()
+        self._next_edit_at: float = 0.0
+        self.updates_coalesced: int = 0
+        
+        # Traces waiting for the panel to show their change
+        self._traces: List[Trace] = []
+        
+        # Debounced Next/Previous navigation, played by navigation_task
+        self.navigation_task: Optional[asyncio.Task] = None
+        self._navigation_deadline: float = 0.0
+        self._navigation_interaction: Optional[discord.Interaction] = None
+        self._navigation_trace: Optional[Trace] = None
+        self.navigation_clicks: int = 0
+        self.navigation_jumps: int = 0
+        
+        # Page of the reciter picker, starting at the current reciter
+        self.reciter_page: int = audio_service.library.page_of(audio_service.default_reciter, RECITER_PAGE_SIZE)
+        
+        # Build components up front so the view can be registered with
+        # bot.add_view() before the panel message is edited or sent
+        self.build_items()
+    
+    def build_items(self) -> None:
+        """
+        (Re)build the panel components with their stable custom_ids.
+        """
+        # Clear existing items and rebuild
+        self.clear_items()
+        
+        # Add Reciter selector (Row 0)
+        if len(self.audio_service.library):
+            self.add_item(ReciterSelect(self))
+        
+        # Add Search button (Row 1)
+        self.add_item(SearchButton(self.audio_service, self))
+        
+        # Add control buttons (Row 2)
+        self.add_item(PreviousButton(self.audio_service))
+        self.add_item(ShuffleButton(self))
+        self.add_item(LoopButton(self))
+        self.add_item(NextButton(self.audio_service))
     
     def get_reciter_arabic(self, reciter: str) -> str:
         """
@@ -105,29 +486,90 @@ class ControlPanel(View):
         Returns:
             Arabic reciter name
         """
-        try:
-            reciter_arabic_names: Dict[str, str] = {
-                "Saad Al Ghamdi": "سعد الغامدي",
-                "Abdul Basit Abdul Samad": "عبد الباسط عبد الصمد",
-                "Maher Al Muaiqly": "ماهر المعيقلي",
-                "Muhammad Al Luhaidan": "محمد اللحيدان",
-                "Rashid Al Afasy": "راشد العفاسي",
-                "Yasser Al Dosari": "ياسر الدوسري"
-            }
-            return reciter_arabic_names.get(reciter, reciter)
-        except Exception as e:
-            logger.error_tree("Failed to get Arabic reciter name", e, [
-                ("Reciter", reciter)
-            ])
-            return reciter
+        return self.audio_service.library.arabic(reciter)
+    
+    @property
+    def displayed_surah(self) -> int:
+        """The surah shown on the panel: a pending navigation target, the one playing, or the next one."""
+        return self.pending_surah or self.audio_service.playing_surah or self.audio_service.current_surah
+    
+    def on_track_change(self, surah_number: int) -> None:
+        """
+        Refresh the duration and the panel when the audio service starts a new track.
+        
+        Args:
+            surah_number: Surah that just started
+        """
+        self.update_duration_for_surah(surah_number)
+        logger.tree("🔄 Control Panel Track Changed", lambda: [
+            ("Surah", str(surah_number)),
+            ("Duration", f"{self.total_duration} seconds")
+        ], level=logger.DEBUG)
+        if self.message:
+            self.request_update()
+    
+    async def navigate(self, interaction: discord.Interaction, step: int, trace: Optional[Trace] = None) -> None:
+        """
+        Move the navigation target by a number of surahs and preview it.
+        
+        The panel shows the target right away, but the surah is only played
+        once no Next/Previous click arrived for NAVIGATION_DEBOUNCE seconds,
+        so a burst of clicks becomes a single jump.
+        
+        Args:
+            interaction: Next/Previous interaction (acknowledged here)
+            step: Surahs to move, negative for backward
+            trace: Latency trace of the click, if tracing is enabled
+        """
+        self.pending_surah = (self.displayed_surah - 1 + step) % 114 + 1
+        self.navigation_clicks += 1
+        self._navigation_deadline = time.monotonic() + self.NAVIGATION_DEBOUNCE
+        self._navigation_interaction = interaction
+        self._navigation_trace = trace
+        self.update_duration_for_surah(self.pending_surah)
+        await self.respond(interaction, trace)
+        
+        if self.navigation_task is None or self.navigation_task.done():
+            self.navigation_task = asyncio.create_task(self.navigation_loop())
+    
+    async def navigation_loop(self) -> None:
+        """
+        Play the navigation target once the clicks have stopped.
+        
+        Clicks arriving while a jump runs move the target again, and the loop
+        waits out a new debounce window before playing that one.
+        """
+        while self.pending_surah is not None:
+            delay: float = self._navigation_deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            
+            target: int = self.pending_surah
+            trace: Optional[Trace] = self._navigation_trace
+            self.navigation_jumps += 1
+            logger.tree("🧭 Navigation Target Played", lambda: [
+                ("Surah", str(target)),
+                ("Clicks", str(self.navigation_clicks)),
+                ("Jumps", str(self.navigation_jumps))
+            ], level=logger.DEBUG)
+            await run_playback_command(
+                self._navigation_interaction, self.audio_service, f"navigate to surah {target}",
+                lambda: self.audio_service.jump(target, trace=trace),
+                f"Could not start Surah {target}."
+            )
+            if self.pending_surah == target:
+                self.pending_surah = None
+        
+        # Show what actually plays (the jump may have failed)
+        self.update_duration_for_surah()
+        self.request_update()
     
     def update_duration_for_surah(self, surah_number: int = None) -> None:
         """Update the total duration based on the current surah and reciter."""
-        # Use provided surah number or get current
+        # Use provided surah number or the one the panel shows
         if surah_number is None:
-            # Get the displayed surah number (what the user sees in the control panel)
-            # The control panel shows current_surah, so use that for duration
-            surah_number = self.audio_service.current_surah
+            surah_number = self.displayed_surah
         
         # Get current reciter
         reciter = self.audio_service.current_status.get("reciter", self.audio_service.default_reciter)
@@ -135,6 +577,18 @@ class ControlPanel(View):
         # Get the actual MP3 duration or fall back to estimate
         self.total_duration = get_mp3_duration(surah_number, reciter)
     
+    def progress_step(self) -> float:
+        """
+        Get the progress display step for the current surah.
+        
+        Returns:
+            Step in seconds, coarser for longer surahs
+        """
+        for max_duration, step in self.PROGRESS_STEPS:
+            if self.total_duration <= max_duration:
+                return step
+        return self.PROGRESS_STEPS[-1][1]
+    
     def format_time(self, seconds: float) -> str:
         """
         Format seconds to MM:SS or HH:MM:SS format.
@@ -179,15 +633,11 @@ class ControlPanel(View):
         try:
             # Get current playback status from audio service
             status: Dict[str, Any] = self.audio_service.current_status
-            current_surah: int = status.get("current_surah", 1)
+            current_surah: int = self.displayed_surah
             
-            # Retrieve surah information including Arabic and English names
-            # Fallback to default values if surah not found in mapping
-            surah_info: Dict[str, str] = SURAH_NAMES.get(current_surah, {
-                "arabic": "سورة",
-                "english": f"Surah {current_surah}",
-                "translation": ""
-            })
+            # Shared entry of the surah table with its display string precomputed
+            surah: Optional[Surah] = get_surah(current_surah)
+            surah_display: str = surah.display if surah else f"Surah {current_surah} - سورة"
             
             # Create Discord embed with dark theme (Discord dark mode color)
             # RGB(47, 49, 54) matches Discord's dark theme background
@@ -201,7 +651,7 @@ class ControlPanel(View):
             # Surah field in black box
             embed.add_field(
                 name="Surah:",
-                value=f"```\n{surah_info['english']} - {surah_info['arabic']}\n```",
+                value=f"```\n{surah_display}\n```",
                 inline=False
             )
             
@@ -214,13 +664,16 @@ class ControlPanel(View):
                 inline=False
             )
             
-            # Calculate current progress based on start time
-            if self.start_time and self.audio_service.current_status.get("playing"):
-                elapsed: float = time.time() - self.start_time
-                self.current_progress = min(elapsed, self.total_duration)
+            # Position from the frames the player has actually sent
+            # (a navigation target that isn't playing yet is shown at its start)
+            position: float = 0.0 if self.pending_surah else status.get("position", 0.0)
+            progress: float = min(position, self.total_duration)
             
             # Progress field with time display in black box
-            time_display: str = self.format_time(self.current_progress) + " / " + self.format_time(self.total_duration)
+            # Shown in whole steps so ticks within a step render identically
+            step: float = self.progress_step()
+            shown: float = progress - progress % step
+            time_display: str = self.format_time(shown) + " / " + self.format_time(self.total_duration)
             embed.add_field(
                 name="Progress:",
                 value=f"```\n{time_display}\n```",
@@ -249,54 +702,64 @@ class ControlPanel(View):
                 color=discord.Color.red()
             )
     
-    async def send_panel(self, channel: discord.TextChannel) -> discord.Message:
+    async def send_panel(self, channel: discord.TextChannel, message_id: Optional[int] = None) -> discord.Message:
         """
-        Send the control panel to a Discord channel.
+        Show the control panel in a Discord channel.
+        
+        If the ID of a previous panel message is known, that message is edited
+        in place (a single API call). A new message is only sent when there is
+        no previous panel or it can no longer be edited.
         
         Args:
-            channel: The channel to send the panel to
+            channel: The channel to show the panel in
+            message_id: ID of an existing panel message to reuse
             
         Returns:
-            The sent message containing the panel
+            The message containing the panel
         """
         try:
-            # Clear existing items and rebuild
-            self.clear_items()
-            
-            # Add Reciter selector (Row 0)
-            reciters: List[str] = self.audio_service.get_available_reciters()
-            if reciters:
-                self.add_item(ReciterSelect(reciters, self.audio_service))
-            
-            # Add Search button (Row 1)
-            self.add_item(SearchButton(self.audio_service, self))
-            
-            # Add control buttons (Row 2)
-            self.add_item(PreviousButton(self.audio_service))
-            self.add_item(ShuffleButton(self))
-            self.add_item(LoopButton(self))
-            self.add_item(NextButton(self.audio_service))
+            # Update duration for the displayed surah
+            self.update_duration_for_surah()
             
-            # Update duration for current surah
-            current_surah = self.audio_service.current_status.get("current_surah", 1)
-            self.update_duration_for_surah(current_surah)
-            
-            # Send panel
             embed: Embed = self.create_status_embed()
-            self.message = await channel.send(embed=embed, view=self)
+            self.message = None
+            self.invalidate_render()
+            
+            # Reuse the existing panel message when possible
+            # A partial message avoids fetching it first, so this is one edit call
+            if message_id:
+                try:
+                    self.message = await channel.get_partial_message(message_id).edit(embed=embed, view=self)
+                except discord.NotFound:
+                    logger.tree("⚠️ Previous Control Panel Missing", [
+                        ("Message ID", str(message_id)),
+                        ("Action", "Sending a new panel")
+                    ])
+                except discord.HTTPException as e:
+                    logger.tree("⚠️ Control Panel Edit Failed", [
+                        ("Message ID", str(message_id)),
+                        ("Error", str(e)),
+                        ("Action", "Sending a new panel")
+                    ])
             
-            # Set start time for progress tracking
-            self.start_time = time.time()
+            # Send a fresh panel only if there was nothing to edit
+            if self.message is None:
+                self.message = await channel.send(embed=embed, view=self)
+            self.render(embed)
             
-            # Start progress update task
+            # Start progress update task and the update scheduler
             if not self.progress_task:
                 self.progress_task = asyncio.create_task(self.update_progress_loop())
+            if not self.update_task:
+                self.update_task = asyncio.create_task(self.update_scheduler_loop())
             
             logger.tree("🎛️ Control Panel Deployed", [
-            ("Channel", channel.name),
-            ("Channel ID", str(channel.id)),
-            ("Components", "Reciter selector, Search, Controls")
-        ])
+                ("Channel", channel.name),
+                ("Channel ID", str(channel.id)),
+                ("Message ID", str(self.message.id)),
+                ("Method", "Edited in place" if self.message.id == message_id else "Sent new message"),
+                ("Components", "Reciter selector, Search, Controls")
+            ])
             return self.message
             
         except Exception as e:
@@ -306,66 +769,224 @@ class ControlPanel(View):
             ])
             raise
     
+    def shutdown(self) -> None:
+        """
+        Stop the background tasks and stop listening for interactions.
+        
+        Called when the panel is replaced by a new instance (e.g. on reconnect)
+        so old panels don't keep editing the message in the background.
+        """
+        for task in (self.progress_task, self.update_task, self.navigation_task):
+            if task and not task.done():
+                task.cancel()
+        self.progress_task = None
+        self.update_task = None
+        self.navigation_task = None
+        self.audio_service.remove_track_listener(self.on_track_change)
+        self.stop()
+    
     async def update_progress_loop(self) -> None:
         """
-        Periodically update the progress display every 5 seconds.
+        Periodically refresh the progress display.
+        
+        The loop ticks every TICK_INTERVAL seconds, but an edit is only sent
+        when the rendered panel differs from what the message shows, which
+        for progress means once per progress_step().
         """
         while True:
             try:
-                # Wait 5 seconds between updates
-                await asyncio.sleep(5)
+                await asyncio.sleep(self.TICK_INTERVAL)
                 
                 # Update the panel with new progress
+                # (track changes arrive through on_track_change)
                 if self.message and self.audio_service.current_status.get("playing"):
-                    await self.update_panel()
-                    
-                # Reset progress and update duration when track changes
-                current_surah: int = self.audio_service.current_status.get("current_surah", 1)
-                
-                if self._last_surah and self._last_surah != current_surah:
-                    # Update duration for the displayed surah (current_surah)
-                    self.update_duration_for_surah(current_surah)
-                    # Reset progress timer
-                    self.start_time = time.time()
-                    self.current_progress = 0
-                    # Log the surah change
-                    logger.tree("🔄 Control Panel Detected Surah Change", [
-                        ("Previous Surah", str(self._last_surah)),
-                        ("New Surah", str(current_surah)),
-                        ("Duration", f"{self.total_duration} seconds")
-                    ])
-                self._last_surah = current_surah
+                    self.request_update()
                 
             except Exception as e:
                 logger.error_tree("Progress update error", e, [
-                    ("Update Interval", "5 seconds"),
+                    ("Update Interval", f"{self.TICK_INTERVAL:g} seconds"),
                     ("Panel Status", "Active" if self.message else "Inactive")
-                ])
-                await asyncio.sleep(5)
+                ], throttle=True)
+                await asyncio.sleep(self.TICK_INTERVAL)
+    
+    @staticmethod
+    def _fingerprint(payload: Any) -> str:
+        """Canonical serialization of an embed or component payload for comparison."""
+        return json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def invalidate_render(self) -> None:
+        """Forget what the message shows so the next render sends everything."""
+        self._embed_key = None
+        self._view_key = None
+    
+    def render(self, embed: Optional[Embed] = None) -> Dict[str, Any]:
+        """
+        Render the panel and keep only the parts that changed.
+        
+        The returned parts are recorded as shown; call invalidate_render()
+        if sending them fails.
+        
+        Args:
+            embed: Already built status embed (built here if omitted)
+            
+        Returns:
+            Edit arguments: "embed" and/or "view", empty if nothing changed
+        """
+        embed = embed or self.create_status_embed()
+        embed_key: str = self._fingerprint(embed.to_dict())
+        view_key: str = self._fingerprint(self.to_components())
+        
+        changes: Dict[str, Any] = {}
+        if embed_key != self._embed_key:
+            changes["embed"] = embed
+        if view_key != self._view_key:
+            changes["view"] = self
+        
+        self._embed_key = embed_key
+        self._view_key = view_key
+        return changes
+    
+    async def respond(self, interaction: discord.Interaction, trace: Optional[Trace] = None) -> None:
+        """
+        Acknowledge a panel component interaction and schedule the re-render.
+        
+        The acknowledgement is immediate; the panel itself is edited by the
+        scheduler, together with any other pending changes.
+        
+        Args:
+            interaction: Interaction from one of the panel's own components
+            trace: Latency trace of the interaction, if tracing is enabled
+        """
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        if trace:
+            trace.mark("responded")
+        self.request_update(trace)
+    
+    def request_update(self, trace: Optional[Trace] = None) -> None:
+        """
+        Mark the panel as needing a re-render.
+        
+        Never edits directly. While an update is already pending the request
+        is folded into it; the render happens when the edit is sent, so it
+        always shows the latest state.
+        
+        Args:
+            trace: Latency trace to mark once the panel shows the change
+        """
+        if trace:
+            self._traces.append(trace)
+        if self._update_pending.is_set():
+            self.updates_coalesced += 1
+        self._update_pending.set()
+        
+        # Panels updated before send_panel() started the scheduler
+        if self.update_task is None and self.message:
+            self.update_task = asyncio.create_task(self.update_scheduler_loop())
+    
+    async def update_scheduler_loop(self) -> None:
+        """
+        Send pending panel updates, at most one edit per MIN_EDIT_INTERVAL.
+        """
+        while True:
+            try:
+                await self._update_pending.wait()
+                
+                # Wait out the edit spacing (or a rate limit) before rendering;
+                # requests arriving meanwhile join this update
+                delay: float = self._next_edit_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                
+                self._update_pending.clear()
+                await self.update_panel()
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error_tree("Panel update scheduler error", e, [
+                    ("Panel Status", "Active" if self.message else "Inactive")
+                ], throttle=True)
+                await asyncio.sleep(self.MIN_EDIT_INTERVAL)
+    
+    def _retry_after(self, error: Union[discord.HTTPException, discord.RateLimited]) -> Optional[float]:
+        """
+        Get the wait Discord asked for if an edit was rate limited.
+        
+        Args:
+            error: Error raised by the edit
+            
+        Returns:
+            Seconds to wait, or None if the error was not a rate limit
+        """
+        if isinstance(error, discord.RateLimited):
+            return error.retry_after
+        if error.status == 429:
+            headers = getattr(error.response, "headers", {}) or {}
+            try:
+                return float(headers.get("Retry-After") or headers.get("X-RateLimit-Reset-After") or self.MIN_EDIT_INTERVAL)
+            except ValueError:
+                return self.MIN_EDIT_INTERVAL
+        return None
+    
+    def _requeue_after(self, error: Union[discord.HTTPException, discord.RateLimited]) -> None:
+        """Push the next edit past a rate limit and keep the update pending."""
+        retry_after: float = self._retry_after(error) or self.MIN_EDIT_INTERVAL
+        self._next_edit_at = time.monotonic() + retry_after
+        self.invalidate_render()
+        self._update_pending.set()
+        logger.tree("⏳ Control Panel Rate Limited", [
+            ("Retry After", f"{retry_after:.2f}s"),
+            ("Action", "Update kept pending")
+        ], level=logger.WARNING)
     
     async def update_panel(self) -> None:
         """
         Update the existing control panel message.
         
-        Updates the embed with current status information.
+        Called by the update scheduler; everything else uses request_update().
+        Sends only the embed when the components are unchanged, and skips
+        the edit entirely when nothing visible changed. A rate-limited edit
+        is re-queued after the wait Discord asked for.
         """
         if self.message:
+            traces: List[Trace] = self._traces
+            self._traces = []
             try:
-                await self.message.edit(
-                    embed=self.create_status_embed(),
-                    view=self
-                )
+                changes: Dict[str, Any] = self.render()
+                if changes:
+                    self._next_edit_at = time.monotonic() + self.MIN_EDIT_INTERVAL
+                    await self.message.edit(**changes)
+                    self.edits_sent += 1
+                else:
+                    self.edits_skipped += 1
+                for trace in traces:
+                    trace.mark("panel_edited")
+            except discord.RateLimited as e:
+                self._traces.extend(traces)
+                self._requeue_after(e)
             except discord.NotFound:
                 logger.tree("⚠️ Control Panel Message Not Found", [
                     ("Action", "Message reference cleared"),
                     ("Reason", "Discord message was deleted")
                 ])
                 self.message = None
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    self._traces.extend(traces)
+                    self._requeue_after(e)
+                    return
+                self.invalidate_render()
+                logger.error_tree("Failed to update control panel", e, [
+                    ("Panel Message", "Present" if self.message else "Missing"),
+                    ("Status", str(e.status))
+                ], throttle=True)
             except Exception as e:
+                self.invalidate_render()
                 logger.error_tree("Failed to update control panel", e, [
                     ("Panel Message", "Present" if self.message else "Missing"),
-                    ("Update Type", "Embed and View refresh")
-                ])
+                    ("Update Type", "Changed embed/view refresh")
+                ], throttle=True)
 
 
 # Search Modal
@@ -376,7 +997,8 @@ class SurahSearchModal(Modal):
         super().__init__(title="Search for a Surah")
         self.audio_service: AudioService = audio_service
         self.control_panel: ControlPanel = control_panel
-        self.searcher: SurahSearch = SurahSearch()
+        # Shared preloaded engine; building one per click re-parsed the mapper file
+        self.searcher: SurahSearch = get_surah_search()
         
         # Add search input field
         self.search_input: TextInput = TextInput(
@@ -391,18 +1013,31 @@ class SurahSearchModal(Modal):
     
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """Handle search submission."""
+        trace: Optional[Trace] = tracer.start("surah search", interaction)
         query: str = self.search_input.value.strip()
-        logger.tree("🔍 Search Request", [
+        logger.tree("🔍 Search Request", lambda: [
             ("User", str(interaction.user)),
             ("Query", query),
             ("Timestamp", interaction.created_at.strftime("%H:%M:%S") if hasattr(interaction, 'created_at') else "Now")
         ])
         
         # Search for Surahs
-        results: List[Dict[str, Any]] = self.searcher.search(query, limit=5)
+        results: Tuple[SearchResult, ...] = self.searcher.search(query, limit=5)
+        
+        # No surah name matched: the query may be a remembered phrase from an ayah
+        # The first ayah query loads (and may build) the index, which can outlast
+        # Discord's 3 second deadline, so acknowledge first and answer with a followup
+        deferred: bool = False
+        if not results and get_ayah_search().available:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            deferred = True
+            matches: List[AyahMatch] = await asyncio.to_thread(get_ayah_search().search, query, 5)
+            if matches:
+                await self.send_ayah_results(interaction, query, matches)
+                return
         
         if not results:
-            logger.tree("⚠️ Search Query Returned No Results", [
+            logger.tree("⚠️ Search Query Returned No Results", lambda: [
                 ("User", str(interaction.user)),
                 ("Query", query),
                 ("Search Engine", "SurahSearch"),
@@ -414,71 +1049,55 @@ class SurahSearchModal(Modal):
                 color=discord.Color.red()
             )
             # Set footer with developer credit and avatar
-            try:
-                developer = await interaction.client.fetch_user(interaction.user.id)  # Use interaction user for now
-                developer_avatar = developer.avatar.url if developer and developer.avatar else None
-            except:
-                developer_avatar = None
-            embed.set_footer(text="Developed By: حَـــــنَّـــــا", icon_url=developer_avatar)
-            await interaction.response.send_message(
-                embed=embed,
-                ephemeral=True
-            )
+            set_developer_footer(embed, interaction)
+            if deferred:
+                await interaction.followup.send(embed=embed, ephemeral=True)
+            else:
+                await interaction.response.send_message(
+                    embed=embed,
+                    ephemeral=True
+                )
             return
         
         # If single exact match, play it directly
-        if len(results) == 1 and results[0]['score'] >= 0.95:
-            surah: Dict[str, Any] = results[0]
-            # Update audio service to play this surah
-            self.audio_service.current_surah = surah['number']
-            
-            # Update presence for the new surah
-            self.audio_service.update_presence_for_current()
-            
-            # Stop current playback and immediately play the selected surah
-            if self.audio_service.voice_client:
-                if self.audio_service.voice_client.is_playing():
-                    self.audio_service.voice_client.stop()
-                # Small delay to ensure stop completes
-                await asyncio.sleep(0.1)
-                # Explicitly play the selected surah
-                await self.audio_service.play_next()
-            
-            # Reset progress timer
-            self.control_panel.start_time = time.time()
-            self.control_panel.current_progress = 0
-            
-            # Update control panel
-            if self.control_panel:
-                self.control_panel.last_interaction_user = f"<@{interaction.user.id}>"
-                self.control_panel.last_interaction_action = f"selected Surah {surah['number']}"
-                await self.control_panel.update_panel()
+        if len(results) == 1 and results[0].score >= 0.95:
+            surah: SearchResult = results[0]
             
+            # Acknowledge first; playback switches on the command queue below
             embed = discord.Embed(
                 title="✅ Now Playing",
-                description=f"**{surah['number']}. {surah['english']}**",
+                description=f"**{surah.number}. {surah.english}**",
                 color=discord.Color.green()
             )
-            embed.add_field(name="Arabic Name", value=surah['arabic'], inline=True)
-            embed.add_field(name="Translation", value=surah['translation'], inline=False)
+            embed.add_field(name="Arabic Name", value=surah.arabic, inline=True)
+            embed.add_field(name="Translation", value=surah.translation, inline=False)
             # Set footer with developer credit and avatar
-            try:
-                developer = await interaction.client.fetch_user(interaction.user.id)  # Use interaction user for now
-                developer_avatar = developer.avatar.url if developer and developer.avatar else None
-            except:
-                developer_avatar = None
-            embed.set_footer(text="Developed By: حَـــــنَّـــــا", icon_url=developer_avatar)
+            set_developer_footer(embed, interaction)
             await interaction.response.send_message(
                 embed=embed,
                 ephemeral=True
             )
-            logger.tree("✅ Search Result Selected", [
+            if trace:
+                trace.mark("responded")
+            logger.tree("✅ Search Result Selected", lambda: [
                 ("User", str(interaction.user)),
-                ("Surah Number", str(surah['number'])),
-                ("Surah Name", surah['english']),
+                ("Surah Number", str(surah.number)),
+                ("Surah Name", surah.english),
                 ("Action", "Direct play from search")
             ])
             
+            # Update control panel (duration and progress follow the new track)
+            if self.control_panel:
+                self.control_panel.last_interaction_user = f"<@{interaction.user.id}>"
+                self.control_panel.last_interaction_action = f"selected Surah {surah.number}"
+            await run_playback_command(
+                interaction, self.audio_service, f"play surah {surah.number}",
+                lambda: self.audio_service.jump(surah.number, trace=trace),
+                f"Could not start Surah {surah.number}."
+            )
+            if self.control_panel:
+                self.control_panel.request_update(trace)
+            
         else:
             # Show search results with selection buttons
             embed: Embed = Embed(
@@ -490,7 +1109,7 @@ class SurahSearchModal(Modal):
             for i, surah in enumerate(results[:5], 1):
                 embed.add_field(
                     name=f"{i}. {self.searcher.format_result(surah)}",
-                    value=f"*{surah['translation']}*",
+                    value=f"*{surah.translation}*",
                     inline=False
                 )
             
@@ -501,16 +1120,53 @@ class SurahSearchModal(Modal):
                 view=view,
                 ephemeral=True
             )
+    
+    async def send_ayah_results(self, interaction: discord.Interaction, query: str, matches: List[AyahMatch]) -> None:
+        """
+        Show ayahs containing the query with buttons for their surahs.
+        
+        Args:
+            interaction: The modal submit interaction, already deferred
+            query: The phrase that was searched
+            matches: Matching ayahs from the ayah index
+        """
+        embed: Embed = Embed(
+            title="📜 Ayah Results",
+            description=f"Found {len(matches)} ayah(s) containing '{query}':",
+            color=discord.Color.green()
+        )
+        surahs: List[Surah] = []
+        for match in matches:
+            surah: Optional[Surah] = get_surah(match.surah)
+            if not surah:
+                continue
+            text: str = match.translation or match.arabic
+            embed.add_field(
+                name=f"{surah.label} • Ayah {match.ayah}",
+                value=f"*{text[:200]}{'…' if len(text) > 200 else ''}*",
+                inline=False
+            )
+            if all(s.number != surah.number for s in surahs):
+                surahs.append(surah)
+        
+        view: SurahSelectionView = SurahSelectionView(surahs, self.audio_service, self.control_panel)
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+        
+        logger.tree("📜 Ayah Search Results Shown", lambda: [
+            ("User", str(interaction.user)),
+            ("Query", query),
+            ("Matches", ", ".join(f"{m.surah}:{m.ayah}" for m in matches))
+        ])
 
 
 # Custom button for surah selection
-class SurahSelectButton(Button):
+class SurahSelectButton(StageProtectedButton):
     """Button for selecting a specific surah."""
     
-    def __init__(self, surah: Dict[str, Any], audio_service: AudioService, control_panel: ControlPanel, number: int) -> None:
+    def __init__(self, surah: Union[SearchResult, Surah], audio_service: AudioService, control_panel: ControlPanel, number: int) -> None:
         super().__init__(
-            label=f"{number}. {surah['english']}",
-            emoji=surah['emoji'],
+            label=f"{number}. {surah.english}",
+            emoji=surah.emoji,
             style=ButtonStyle.primary
         )
         self.surah = surah
@@ -518,106 +1174,65 @@ class SurahSelectButton(Button):
         self.control_panel = control_panel
     
     async def callback(self, interaction: discord.Interaction) -> None:
-        try:
-            logger.tree("🎯 Surah Selection Initiated", [
-                ("User", str(interaction.user)),
-                ("Surah Number", str(self.surah['number'])),
-                ("Surah Name", self.surah.get('english', 'Unknown')),
-                ("Action", "Button callback triggered")
-            ])
-            
-            # Check if user is in stage channel
-            if self.audio_service and self.audio_service.voice_client and self.audio_service.voice_client.channel:
-                stage_channel = self.audio_service.voice_client.channel
-                # Check if user is in the members list
-                member = interaction.guild.get_member(interaction.user.id)
-                if member and member.voice and member.voice.channel != stage_channel:
-                    logger.tree("🚫 Access Denied - Surah Selection", [
-                        ("User", str(interaction.user)),
-                        ("Action Attempted", "Surah selection"),
-                        ("Reason", "User not in stage channel"),
-                        ("Required", "Stage channel membership")
-                    ])
-                    embed = discord.Embed(
-                        title="❌ Access Denied",
-                        description="You must be in the stage channel to select a surah!",
-                        color=discord.Color.red()
-                    )
-                    embed.set_footer(
-                        text="QuranBot • Join the stage to control playback",
-                        icon_url=interaction.client.user.avatar.url if interaction.client.user.avatar else None
-                    )
-                    await interaction.response.send_message(
-                        embed=embed,
-                        ephemeral=True
-                    )
-                    return
-        except Exception as e:
-            logger.error_tree("Permission check failed", e, [
-                ("Check Type", "Stage channel membership"),
-                ("User", str(interaction.user)),
-                ("Action", "Surah selection")
-            ])
+        trace: Optional[Trace] = tracer.start("surah select", interaction)
+        logger.tree("🎯 Surah Selection Initiated", lambda: [
+            ("User", str(interaction.user)),
+            ("Surah Number", str(self.surah.number)),
+            ("Surah Name", self.surah.english),
+            ("Action", "Button callback triggered")
+        ], level=logger.DEBUG)
+        
+        # Check stage permission
+        if not await self._check_stage_permission(interaction):
+            return
+        
+        if trace:
+            trace.mark("permission")
         
         try:
             # First respond to the interaction
             embed = discord.Embed(
                 title="✅ Surah Selected",
-                description=f"**{self.surah['number']}. {self.surah['english']}**",
+                description=f"**{self.surah.number}. {self.surah.english}**",
                 color=discord.Color.green()
             )
-            embed.add_field(name="Arabic Name", value=self.surah['arabic'], inline=True)
-            embed.add_field(name="Translation", value=self.surah['translation'], inline=False)
+            embed.add_field(name="Arabic Name", value=self.surah.arabic, inline=True)
+            embed.add_field(name="Translation", value=self.surah.translation, inline=False)
             # Set footer with developer credit and avatar
-            try:
-                developer = await interaction.client.fetch_user(interaction.user.id)  # Use interaction user for now
-                developer_avatar = developer.avatar.url if developer and developer.avatar else None
-            except:
-                developer_avatar = None
-            embed.set_footer(text="Developed By: حَـــــنَّـــــا", icon_url=developer_avatar)
+            set_developer_footer(embed, interaction)
             await interaction.response.send_message(
                 embed=embed,
                 ephemeral=True
             )
-            logger.tree("✅ Surah Selected Successfully", [
+            if trace:
+                trace.mark("responded")
+            logger.tree("✅ Surah Selected Successfully", lambda: [
                 ("User", str(interaction.user)),
-                ("Surah Number", str(self.surah['number'])),
-                ("Surah Name", self.surah['english']),
+                ("Surah Number", str(self.surah.number)),
+                ("Surah Name", self.surah.english),
                 ("Source", "Selection button")
             ])
             
-            # Update audio service to play this surah
-            self.audio_service.current_surah = self.surah['number']
-            
-            # Update presence for the new surah
-            self.audio_service.update_presence_for_current()
-            
-            # Stop current playback and immediately play the selected surah
-            if self.audio_service.voice_client:
-                if self.audio_service.voice_client.is_playing():
-                    self.audio_service.voice_client.stop()
-                # Small delay to ensure stop completes
-                await asyncio.sleep(0.1)
-                # Explicitly play the selected surah
-                await self.audio_service.play_next()
-            
-            # Update duration for the selected surah
-            self.control_panel.update_duration_for_surah(self.surah['number'])
-            # Reset progress timer
-            self.control_panel.start_time = time.time()
-            self.control_panel.current_progress = 0
+            # Play the surah on the command queue, after the interaction is answered
+            if self.control_panel:
+                self.control_panel.last_interaction_user = f"<@{interaction.user.id}>"
+                self.control_panel.last_interaction_action = f"selected Surah {self.surah.number}"
+            number: int = self.surah.number
+            await run_playback_command(
+                interaction, self.audio_service, f"play surah {number}",
+                lambda: self.audio_service.jump(number, trace=trace),
+                f"Could not start Surah {number}."
+            )
             
             # Update control panel separately (not part of interaction response)
             if self.control_panel:
-                self.control_panel.last_interaction_user = f"<@{interaction.user.id}>"
-                self.control_panel.last_interaction_action = f"selected Surah {self.surah['number']}"
-                await self.control_panel.update_panel()
+                self.control_panel.request_update(trace)
             
         except Exception as e:
             logger.error_tree("Surah selection callback failed", e, [
                 ("User", str(interaction.user)),
-                ("Surah Number", str(self.surah.get('number', 'Unknown'))),
-                ("Surah Name", self.surah.get('english', 'Unknown')),
+                ("Surah Number", str(self.surah.number)),
+                ("Surah Name", self.surah.english),
                 ("Callback Stage", "Post-permission check")
             ])
             # If we haven't responded yet, send an error response
@@ -632,7 +1247,7 @@ class SurahSelectButton(Button):
 class SurahSelectionView(View):
     """View for selecting from search results."""
     
-    def __init__(self, results: List[Dict[str, Any]], audio_service: AudioService, control_panel: ControlPanel) -> None:
+    def __init__(self, results: Sequence[Union[SearchResult, Surah]], audio_service: AudioService, control_panel: ControlPanel) -> None:
         super().__init__(timeout=60)
         self.audio_service: AudioService = audio_service
         self.control_panel: ControlPanel = control_panel
@@ -643,55 +1258,11 @@ class SurahSelectionView(View):
             self.add_item(button)
 
 
-# Base class for buttons with stage permission check
-class StageProtectedButton(Button):
-    """Base button class with stage channel permission check."""
-    
-    async def _check_stage_permission(self, interaction: discord.Interaction) -> bool:
-        """Check if user is in the stage channel."""
-        # Get audio service from the button
-        audio_service = None
-        if hasattr(self, 'audio_service'):
-            audio_service = self.audio_service
-        elif hasattr(self, 'panel') and hasattr(self.panel, 'audio_service'):
-            audio_service = self.panel.audio_service
-        elif hasattr(self, 'control_panel') and hasattr(self.control_panel, 'audio_service'):
-            audio_service = self.control_panel.audio_service
-        
-        if audio_service and audio_service.voice_client and audio_service.voice_client.channel:
-            stage_channel = audio_service.voice_client.channel
-            if interaction.user not in stage_channel.members:
-                logger.tree("🚫 Access Denied - Control Panel Button", [
-                    ("User", str(interaction.user)),
-                    ("Action Attempted", "Control panel button interaction"),
-                    ("Reason", "User not in stage channel"),
-                    ("Required", "Stage channel membership")
-                ])
-                embed = discord.Embed(
-                    title="❌ Access Denied",
-                    description="You must be in the stage channel to use the control panel!",
-                    color=discord.Color.red()
-                )
-                # Set footer with developer credit and avatar
-                try:
-                    developer = await interaction.client.fetch_user(interaction.user.id)  # Use interaction user for now
-                    developer_avatar = developer.avatar.url if developer and developer.avatar else None
-                except:
-                    developer_avatar = None
-                embed.set_footer(text="Developed By: حَـــــنَّـــــا", icon_url=developer_avatar)
-                await interaction.response.send_message(
-                    embed=embed,
-                    ephemeral=True
-                )
-                return False
-        return True
-
-
 # Control Buttons
 class SearchButton(StageProtectedButton):
     """Search button for finding surahs."""
     def __init__(self, audio_service: AudioService, control_panel: ControlPanel) -> None:
-        super().__init__(label="Search", emoji="🔍", style=ButtonStyle.secondary, row=1)
+        super().__init__(label="Search", emoji="🔍", style=ButtonStyle.secondary, row=1, custom_id=SEARCH_BUTTON_ID)
         self.audio_service: AudioService = audio_service
         self.control_panel: ControlPanel = control_panel
     
@@ -700,12 +1271,12 @@ class SearchButton(StageProtectedButton):
         if not await self._check_stage_permission(interaction):
             return
         
-        logger.tree("🔍 Search Button Activated", [
+        logger.tree("🔍 Search Button Activated", lambda: [
             ("User", str(interaction.user)),
             ("Action", "Search modal opening"),
             ("Component", "Search button"),
             ("Row", "1")
-        ])
+        ], level=logger.DEBUG)
         # Update last interaction
         if self.control_panel:
             self.control_panel.last_interaction_user = f"<@{interaction.user.id}>"
@@ -717,43 +1288,32 @@ class SearchButton(StageProtectedButton):
 class PreviousButton(StageProtectedButton):
     """Previous surah button."""
     def __init__(self, audio_service: AudioService) -> None:
-        super().__init__(label="Previous", emoji="⏮️", style=ButtonStyle.primary, row=2)
+        super().__init__(label="Previous", emoji="⏮️", style=ButtonStyle.primary, row=2, custom_id=PREVIOUS_BUTTON_ID)
         self.audio_service: AudioService = audio_service
     
     async def callback(self, interaction: discord.Interaction) -> None:
+        trace: Optional[Trace] = tracer.start("previous surah", interaction)
+        
         # Check stage permission
         if not await self._check_stage_permission(interaction):
             return
         
-        # Go to previous surah
-        current: int = self.audio_service.current_surah
-        new_surah: int = current - 1 if current > 1 else 114
-        self.audio_service.current_surah = new_surah
-        
-        # Update presence for the new surah
-        self.audio_service.update_presence_for_current()
-        logger.tree("⏮️ Previous Surah Navigation", [
-            ("User", str(interaction.user)),
-            ("Previous Surah", str(current)),
-            ("New Surah", str(new_surah)),
-            ("Direction", "Backward")
-        ])
-        self.audio_service.skip()
+        if trace:
+            trace.mark("permission")
         
+        # Move the panel's navigation target; the surah plays once the clicks stop
         view: Optional[View] = self.view
         if isinstance(view, ControlPanel):
-            # Update duration for the new surah
-            view.update_duration_for_surah(new_surah)
-            # Reset progress timer
-            view.start_time = time.time()
-            view.current_progress = 0
             # Update last interaction
             view.last_interaction_user = f"<@{interaction.user.id}>"
             view.last_interaction_action = "went to previous surah"
-            await interaction.response.edit_message(
-                embed=view.create_status_embed(),
-                view=view
-            )
+            await view.navigate(interaction, -1, trace)
+            logger.tree("⏮️ Previous Surah Navigation", lambda: [
+                ("User", str(interaction.user)),
+                ("Playing Surah", str(self.audio_service.playing_surah)),
+                ("Target Surah", str(view.pending_surah)),
+                ("Direction", "Backward")
+            ])
 
 
 class ShuffleButton(StageProtectedButton):
@@ -763,7 +1323,7 @@ class ShuffleButton(StageProtectedButton):
         self.audio_service = panel.audio_service  # For permission check
         emoji: str = "🔀"
         style: ButtonStyle = ButtonStyle.secondary if not panel.shuffle_mode else ButtonStyle.success
-        super().__init__(label="Shuffle", emoji=emoji, style=style, row=2)
+        super().__init__(label="Shuffle", emoji=emoji, style=style, row=2, custom_id=SHUFFLE_BUTTON_ID)
     
     async def callback(self, interaction: discord.Interaction) -> None:
         # Check stage permission
@@ -774,7 +1334,7 @@ class ShuffleButton(StageProtectedButton):
         self.panel.shuffle_mode = not self.panel.shuffle_mode
         self.style = ButtonStyle.success if self.panel.shuffle_mode else ButtonStyle.secondary
         status: str = "enabled" if self.panel.shuffle_mode else "disabled"
-        logger.tree(f"🔀 Shuffle Mode {status.title()}", [
+        logger.tree(f"🔀 Shuffle Mode {status.title()}", lambda: [
             ("User", str(interaction.user)),
             ("Previous State", "Disabled" if status == "enabled" else "Enabled"),
             ("New State", status.title()),
@@ -786,10 +1346,7 @@ class ShuffleButton(StageProtectedButton):
             # Update last interaction
             view.last_interaction_user = f"<@{interaction.user.id}>"
             view.last_interaction_action = f"{status} shuffle mode"
-            await interaction.response.edit_message(
-                embed=view.create_status_embed(),
-                view=view
-            )
+            await view.respond(interaction)
 
 
 class LoopButton(StageProtectedButton):
@@ -810,7 +1367,7 @@ class LoopButton(StageProtectedButton):
             emoji: str = "🔁"
             style: ButtonStyle = ButtonStyle.success
         
-        super().__init__(label=label, emoji=emoji, style=style, row=2)
+        super().__init__(label=label, emoji=emoji, style=style, row=2, custom_id=LOOP_BUTTON_ID)
     
     async def callback(self, interaction: discord.Interaction) -> None:
         # Check stage permission
@@ -831,7 +1388,7 @@ class LoopButton(StageProtectedButton):
             self.label = "Loop"
             self.emoji = "🔁"
         
-        logger.tree("🔁 Loop Mode Changed", [
+        logger.tree("🔁 Loop Mode Changed", lambda: [
             ("User", str(interaction.user)),
             ("New Mode", self.panel.loop_mode.title()),
             ("Button Label", self.label),
@@ -845,160 +1402,242 @@ class LoopButton(StageProtectedButton):
             # Update last interaction
             view.last_interaction_user = f"<@{interaction.user.id}>"
             view.last_interaction_action = f"set loop mode to {self.panel.loop_mode}"
-            await interaction.response.edit_message(
-                embed=view.create_status_embed(),
-                view=view
-            )
+            await view.respond(interaction)
 
 
 class NextButton(StageProtectedButton):
     """Next surah button."""
     def __init__(self, audio_service: AudioService) -> None:
-        super().__init__(label="Next", emoji="⏭️", style=ButtonStyle.primary, row=2)
+        super().__init__(label="Next", emoji="⏭️", style=ButtonStyle.primary, row=2, custom_id=NEXT_BUTTON_ID)
         self.audio_service: AudioService = audio_service
     
     async def callback(self, interaction: discord.Interaction) -> None:
+        trace: Optional[Trace] = tracer.start("next surah", interaction)
+        
         # Check stage permission
         if not await self._check_stage_permission(interaction):
             return
         
-        # Skip to next surah
-        current: int = self.audio_service.current_surah
-        # Calculate next surah (wraps from 114 to 1)
-        next_surah: int = current + 1 if current < 114 else 1
-        logger.tree("⏭️ Next Surah Navigation", [
-            ("User", str(interaction.user)),
-            ("Current Surah", str(current)),
-            ("Next Surah", str(next_surah)),
-            ("Action", "Skip to next"),
-            ("Direction", "Forward")
-        ])
-        self.audio_service.skip()
+        if trace:
+            trace.mark("permission")
         
+        # Move the panel's navigation target; the surah plays once the clicks stop
         view: Optional[View] = self.view
         if isinstance(view, ControlPanel):
-            # Update duration for the next surah
-            view.update_duration_for_surah(next_surah)
-            # Reset progress timer
-            view.start_time = time.time()
-            view.current_progress = 0
             # Update last interaction
             view.last_interaction_user = f"<@{interaction.user.id}>"
             view.last_interaction_action = "skipped to next surah"
-            await interaction.response.edit_message(
-                embed=view.create_status_embed(),
-                view=view
-            )
-
-
-class StageProtectedSelect(Select):
-    """Base select class with stage channel permission check."""
-    
-    async def _check_stage_permission(self, interaction: discord.Interaction) -> bool:
-        """Check if user is in the stage channel."""
-        # Get audio service from the select
-        audio_service = None
-        if hasattr(self, 'audio_service'):
-            audio_service = self.audio_service
-        
-        if audio_service and audio_service.voice_client and audio_service.voice_client.channel:
-            stage_channel = audio_service.voice_client.channel
-            if interaction.user not in stage_channel.members:
-                logger.tree("🚫 Access Denied - Control Panel Select", [
-                    ("User", str(interaction.user)),
-                    ("Action Attempted", "Control panel select interaction"),
-                    ("Reason", "User not in stage channel"),
-                    ("Required", "Stage channel membership")
-                ])
-                embed = discord.Embed(
-                    title="❌ Access Denied",
-                    description="You must be in the stage channel to use the control panel!",
-                    color=discord.Color.red()
-                )
-                # Set footer with developer credit and avatar
-                try:
-                    developer = await interaction.client.fetch_user(interaction.user.id)  # Use interaction user for now
-                    developer_avatar = developer.avatar.url if developer and developer.avatar else None
-                except:
-                    developer_avatar = None
-                embed.set_footer(text="Developed By: حَـــــنَّـــــا", icon_url=developer_avatar)
-                await interaction.response.send_message(
-                    embed=embed,
-                    ephemeral=True
-                )
-                return False
-        return True
+            await view.navigate(interaction, 1, trace)
+            logger.tree("⏭️ Next Surah Navigation", lambda: [
+                ("User", str(interaction.user)),
+                ("Playing Surah", str(self.audio_service.playing_surah)),
+                ("Target Surah", str(view.pending_surah)),
+                ("Direction", "Forward")
+            ])
 
 
 class ReciterSelect(StageProtectedSelect):
-    """Dropdown for selecting reciters."""
+    """
+    Dropdown for selecting reciters.
     
-    def __init__(self, reciters: List[str], audio_service: AudioService) -> None:
+    Libraries of up to 25 reciters are listed whole. Larger ones are shown
+    RECITER_PAGE_SIZE at a time, with options to page and to search.
+    """
+    
+    def __init__(self, panel: ControlPanel) -> None:
         """Initialize reciter selector."""
-        # Map English to Arabic names
-        reciter_arabic: Dict[str, str] = {
-            "Saad Al Ghamdi": "سعد الغامدي",
-            "Abdul Basit Abdul Samad": "عبد الباسط عبد الصمد",
-            "Maher Al Muaiqly": "ماهر المعيقلي",
-            "Muhammad Al Luhaidan": "محمد اللحيدان",
-            "Rashid Al Afasy": "راشد العفاسي",
-            "Yasser Al Dosari": "ياسر الدوسري"
-        }
-        
-        # Create options from reciter list with Arabic descriptions
-        options: List[SelectOption] = [
-            SelectOption(
-                label=reciter,
-                value=reciter,
-                description=reciter_arabic.get(reciter, reciter),
-                emoji="🎙️"
-            )
-            for reciter in reciters[:25]
-        ]
-        
+        self.panel: ControlPanel = panel
+        self.audio_service: AudioService = panel.audio_service
         super().__init__(
             placeholder="Select a Reciter...",
-            options=options,
-            row=0
+            options=self.build_options(),
+            row=0,
+            custom_id=RECITER_SELECT_ID
+        )
+    
+    @property
+    def paged(self) -> bool:
+        """Whether the library is too large for one select."""
+        return len(self.audio_service.library) > 25
+    
+    def build_options(self) -> List[SelectOption]:
+        """
+        Build the options for the panel's current reciter page.
+        
+        Returns:
+            Reciter options, plus paging and search options for large libraries
+        """
+        library: ReciterLibrary = self.audio_service.library
+        if not self.paged:
+            return [self._reciter_option(reciter) for reciter in library.reciters]
+        
+        pages: int = library.page_count(RECITER_PAGE_SIZE)
+        self.panel.reciter_page = min(max(self.panel.reciter_page, 0), pages - 1)
+        page: int = self.panel.reciter_page
+        
+        options: List[SelectOption] = [
+            self._reciter_option(reciter) for reciter in library.page(page, RECITER_PAGE_SIZE)
+        ]
+        if page > 0:
+            options.append(SelectOption(
+                label="Previous reciters",
+                value=RECITER_PREVIOUS_PAGE,
+                description=f"Page {page} of {pages}",
+                emoji="⬅️"
+            ))
+        if page < pages - 1:
+            options.append(SelectOption(
+                label="More reciters",
+                value=RECITER_NEXT_PAGE,
+                description=f"Page {page + 2} of {pages}",
+                emoji="➡️"
+            ))
+        options.append(SelectOption(
+            label="Search reciters",
+            value=RECITER_SEARCH,
+            description=f"Find any of the {len(library)} reciters by name",
+            emoji="🔎"
+        ))
+        return options
+    
+    @staticmethod
+    def _reciter_option(reciter: Reciter) -> SelectOption:
+        """Option for one reciter, described by its Arabic name, style and surah count."""
+        return SelectOption(
+            label=reciter.name[:100],
+            value=reciter.name,
+            description=reciter.description[:100],
+            emoji="🎙️"
         )
-        self.audio_service: AudioService = audio_service
     
     async def callback(self, interaction: discord.Interaction) -> None:
         """Handle reciter selection."""
+        trace: Optional[Trace] = tracer.start("reciter select", interaction)
+        
         # Check stage permission
         if not await self._check_stage_permission(interaction):
             return
         
-        selected_reciter: str = self.values[0]
-        
-        # Change reciter
-        success: bool = self.audio_service.set_reciter(selected_reciter)
-        
-        if success:
-            view: Optional[View] = self.view
-            if isinstance(view, ControlPanel):
-                # Update duration for current surah with new reciter
-                view.update_duration_for_surah()
-                # Update last interaction
-                view.last_interaction_user = f"<@{interaction.user.id}>"
-                view.last_interaction_action = f"changed reciter to {selected_reciter}"
-                await interaction.response.edit_message(
-                    embed=view.create_status_embed(),
-                    view=view
-                )
-            logger.tree("✅ Reciter Changed Successfully", [
-                ("User", str(interaction.user)),
-                ("New Reciter", selected_reciter),
-                ("Action", "Reciter selection from dropdown")
-            ])
-        else:
-            logger.error_tree("Failed to change reciter", None, [
+        if trace:
+            trace.mark("permission")
+        selected: str = self.values[0]
+        
+        # Paging only changes the options; the panel edit shows the new page
+        if selected in (RECITER_PREVIOUS_PAGE, RECITER_NEXT_PAGE):
+            self.panel.reciter_page += 1 if selected == RECITER_NEXT_PAGE else -1
+            self.options = self.build_options()
+            logger.tree("🎙️ Reciter Page Changed", lambda: [
                 ("User", str(interaction.user)),
-                ("Requested Reciter", selected_reciter),
-                ("Action", "Reciter selection"),
-                ("Success", "False")
-            ])
+                ("Page", f"{self.panel.reciter_page + 1}/{self.audio_service.library.page_count(RECITER_PAGE_SIZE)}")
+            ], level=logger.DEBUG)
+            await self.panel.respond(interaction)
+            return
+        
+        if selected == RECITER_SEARCH:
+            await interaction.response.send_modal(ReciterSearchModal(self.audio_service, self.panel))
+            return
+        
+        # Acknowledge first; restarting the surah runs on the command queue
+        await interaction.response.defer()
+        if trace:
+            trace.mark("responded")
+        await switch_reciter(
+            interaction, self.audio_service, self.panel, selected,
+            "Reciter selection from dropdown", trace
+        )
+
+
+class ReciterSearchModal(Modal):
+    """Modal for finding a reciter in a large library."""
+    
+    def __init__(self, audio_service: AudioService, control_panel: ControlPanel) -> None:
+        super().__init__(title="Search for a Reciter")
+        self.audio_service: AudioService = audio_service
+        self.control_panel: ControlPanel = control_panel
+        
+        # Add search input field
+        self.search_input: TextInput = TextInput(
+            label="Enter the reciter's name",
+            placeholder="e.g. 'Ghamdi', 'Maher', 'العفاسي'",
+            style=discord.TextStyle.short,
+            required=True,
+            min_length=1,
+            max_length=100
+        )
+        self.add_item(self.search_input)
+    
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        """Switch to a unique match, or offer up to 25 matches to pick from."""
+        trace: Optional[Trace] = tracer.start("reciter search", interaction)
+        query: str = self.search_input.value.strip()
+        matches: Tuple[str, ...] = self.audio_service.library.search(query)
+        logger.tree("🔍 Reciter Search Request", lambda: [
+            ("User", str(interaction.user)),
+            ("Query", query),
+            ("Matches", str(len(matches)))
+        ])
+        
+        if not matches:
             await interaction.response.send_message(
-                f"Failed to change reciter",
+                f"❌ No reciters found matching **'{query}'**",
                 ephemeral=True
-            )
\ No newline at end of file
+            )
+            return
+        
+        if len(matches) == 1:
+            await interaction.response.send_message(f"🎙️ Changing reciter to **{matches[0]}**...", ephemeral=True)
+            if trace:
+                trace.mark("responded")
+            await switch_reciter(
+                interaction, self.audio_service, self.control_panel, matches[0],
+                "Reciter search", trace
+            )
+            return
+        
+        await interaction.response.send_message(
+            f"🎙️ Reciters matching **'{query}'**:",
+            view=ReciterResultsView(matches, self.audio_service, self.control_panel),
+            ephemeral=True
+        )
+
+
+class ReciterResultsView(View):
+    """View for selecting from reciter search results."""
+    
+    def __init__(self, matches: Sequence[str], audio_service: AudioService, control_panel: ControlPanel) -> None:
+        super().__init__(timeout=60)
+        self.add_item(ReciterResultsSelect(matches, audio_service, control_panel))
+
+
+class ReciterResultsSelect(StageProtectedSelect):
+    """Dropdown of reciter search results."""
+    
+    def __init__(self, matches: Sequence[str], audio_service: AudioService, control_panel: ControlPanel) -> None:
+        library: ReciterLibrary = audio_service.library
+        super().__init__(
+            placeholder="Select a Reciter...",
+            options=[
+                ReciterSelect._reciter_option(library.get(name))
+                for name in matches[:25] if library.get(name)
+            ]
+        )
+        self.audio_service: AudioService = audio_service
+        self.control_panel: ControlPanel = control_panel
+    
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Switch to the chosen reciter."""
+        trace: Optional[Trace] = tracer.start("reciter search", interaction)
+        
+        # Check stage permission
+        if not await self._check_stage_permission(interaction):
+            return
+        
+        if trace:
+            trace.mark("permission")
+        await interaction.response.defer()
+        if trace:
+            trace.mark("responded")
+        await switch_reciter(
+            interaction, self.audio_service, self.control_panel, self.values[0],
+            "Reciter search result", trace
+        )
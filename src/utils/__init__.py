@@ -10,6 +10,10 @@ version management.
 
 Utilities:
 - SurahSearch: Fuzzy search functionality for finding Surahs by name or number
+- get_surah_search: Shared, preloaded SurahSearch instance
+- normalize: Arabic/English normalization and trigrams for the search index
+- PrefixTrie: Prefix trie with precomputed completions for autocomplete
+- AyahSearch: Optional memory-mapped phrase search over a local ayah corpus
 - Version: Centralized version management with semantic versioning
 
 Author: حَـــــنَّـــــا
@@ -17,11 +21,17 @@ Server: discord.gg/syria
 Version: v1.0.0
 """
 
-from .search import SurahSearch
+from .search import SurahSearch, get_surah_search
+from .trie import PrefixTrie
+from .ayah_search import AyahSearch, get_ayah_search
 from .version import Version, get_version_info, get_version_string
 
 __all__ = [
     "SurahSearch",
+    "get_surah_search",
+    "PrefixTrie",
+    "AyahSearch",
+    "get_ayah_search",
     "Version",
     "get_version_info", 
     "get_version_string"
@@ -0,0 +1,324 @@
+"""
+QuranBot - Ayah Full-Text Search
+================================
+
+Phrase search over a local Quran text corpus, used to find the surah that
+contains a remembered ayah.
+
+The corpus is optional and not bundled: place a UTF-8 file named
+quran_text.tsv next to surah_mapper.json with one ayah per line:
+
+    <surah>\t<ayah>\t<arabic text>\t<translation>
+
+When the file is absent the feature reports itself unavailable and nothing
+is loaded.
+
+Index Layout (quran_text.idx, little-endian, rebuilt when the corpus changes):
+- Header: magic, token count, ayah count, section offsets
+- Token directory: (blob offset, length, postings start, postings count), sorted by token bytes
+- Token blob: UTF-8 normalized tokens
+- Postings: uint32 ayah ids per token, ascending
+- Ayah table: (surah, ayah, byte offset of the corpus line)
+
+Both files are memory-mapped on first use, so an idle bot pays no RSS for
+the index; a query is a few binary searches over the mapped directory plus
+a postings intersection.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from src.core.logger import logger
+from src.utils.normalize import is_arabic, normalize_arabic, normalize_english
+
+
+# Index format
+_MAGIC: bytes = b"QIX1"
+_HEADER: struct.Struct = struct.Struct("<4sIIQQQQ")
+_TOKEN: struct.Struct = struct.Struct("<IHII")
+_AYAH: struct.Struct = struct.Struct("<HHQ")
+
+
+class AyahMatch(NamedTuple):
+    """One ayah matching a phrase query."""
+    surah: int
+    ayah: int
+    arabic: str
+    translation: str
+
+
+class AyahSearch:
+    """
+    Lazily loaded, memory-mapped inverted index over the ayah corpus.
+
+    Attributes:
+        corpus_file: Path to quran_text.tsv
+        index_file: Path to the binary index built from it
+    """
+
+    # Tokens shorter than this carry no signal and are not indexed
+    MIN_TOKEN_LENGTH: int = 2
+
+    # Completions considered for the last, possibly half-typed, query word
+    MAX_PREFIX_TOKENS: int = 64
+
+    def __init__(self, corpus_file: Optional[Path] = None) -> None:
+        """
+        Initialize the ayah search without loading anything.
+
+        Args:
+            corpus_file: Corpus path (defaults to src/data/quran_text.tsv)
+        """
+        # Navigate from src/utils/ to src/data/
+        self.corpus_file: Path = corpus_file or Path(__file__).parent.parent / "data" / "quran_text.tsv"
+        self.index_file: Path = self.corpus_file.with_suffix(".idx")
+
+        self._lock: threading.Lock = threading.Lock()
+        self._corpus: Optional[mmap.mmap] = None
+        self._index: Optional[mmap.mmap] = None
+        self._tokens: int = 0
+        self._ayahs: int = 0
+        self._blob_offset: int = 0
+        self._postings_offset: int = 0
+        self._ayah_offset: int = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether the optional corpus is installed."""
+        return self.corpus_file.exists()
+
+    def search(self, query: str, limit: int = 5) -> List[AyahMatch]:
+        """
+        Find ayahs containing every word of a phrase.
+
+        Arabic queries search the Arabic text, anything else the translation.
+        The last word also matches as a prefix. Exact phrase matches rank first.
+
+        Args:
+            query: Phrase to search for
+            limit: Maximum number of matches
+
+        Returns:
+            List[AyahMatch]: Matches in corpus order within each rank
+        """
+        try:
+            if not self.available or not query.strip():
+                return []
+            self._load()
+
+            arabic: bool = is_arabic(query)
+            phrase: str = self._normalize(query, arabic)
+            words: List[str] = [w for w in phrase.split() if len(w) >= self.MIN_TOKEN_LENGTH]
+            if not words:
+                return []
+
+            # Intersect postings, rarest word first keeps the working set small
+            postings: List[Set[int]] = [self._postings(w, prefix=(i == len(words) - 1)) for i, w in enumerate(words)]
+            postings.sort(key=len)
+            candidates: Set[int] = postings[0]
+            for other in postings[1:]:
+                candidates &= other
+                if not candidates:
+                    return []
+
+            phrase_hits: List[AyahMatch] = []
+            word_hits: List[AyahMatch] = []
+            for ayah_id in sorted(candidates):
+                match: AyahMatch = self._ayah(ayah_id)
+                text: str = self._normalize(match.arabic if arabic else match.translation, arabic)
+                (phrase_hits if phrase in text else word_hits).append(match)
+                if len(phrase_hits) >= limit:
+                    break
+
+            results: List[AyahMatch] = (phrase_hits + word_hits)[:limit]
+            logger.tree("📜 Ayah Search", lambda: [
+                ("Query", query),
+                ("Candidates", str(len(candidates))),
+                ("Top Match", f"{results[0].surah}:{results[0].ayah}" if results else "None")
+            ], level=logger.DEBUG)
+            return results
+
+        except Exception as e:
+            logger.error_tree("Ayah search failed", e, [
+                ("Query", query),
+                ("Corpus", str(self.corpus_file))
+            ])
+            return []
+
+    def _normalize(self, text: str, arabic: bool) -> str:
+        """Normalize text with the same rules used when indexing."""
+        return normalize_arabic(text) if arabic else normalize_english(text, keep_articles=True)
+
+    def _load(self) -> None:
+        """Build the index if missing or stale, then memory-map the corpus and index."""
+        if self._index is not None:
+            return
+        with self._lock:
+            if self._index is not None:
+                return
+
+            if not self.index_file.exists() or self.index_file.stat().st_mtime < self.corpus_file.stat().st_mtime:
+                self.build_index()
+
+            with open(self.corpus_file, "rb") as f:
+                self._corpus = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with open(self.index_file, "rb") as f:
+                index: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, tokens, ayahs, _, blob, postings, ayah_table = _HEADER.unpack_from(index, 0)
+            if magic != _MAGIC:
+                index.close()
+                raise ValueError(f"Unrecognized ayah index format in {self.index_file}")
+
+            self._tokens, self._ayahs = tokens, ayahs
+            self._blob_offset, self._postings_offset, self._ayah_offset = blob, postings, ayah_table
+            self._index = index
+
+            logger.tree("📜 Ayah Index Loaded", [
+                ("Ayahs", str(ayahs)),
+                ("Tokens", str(tokens)),
+                ("Index Size", f"{self.index_file.stat().st_size // 1024} KB")
+            ])
+
+    def build_index(self) -> None:
+        """
+        Tokenize the corpus and write the binary index atomically.
+
+        Arabic and translation words share one token space; Arabic tokens
+        never collide with Latin ones.
+        """
+        postings: Dict[bytes, List[int]] = {}
+        ayahs: List[Tuple[int, int, int]] = []
+
+        with open(self.corpus_file, "rb") as f:
+            offset: int = 0
+            for raw in f:
+                line_offset, offset = offset, offset + len(raw)
+                fields: List[str] = raw.decode("utf-8").rstrip("\r\n").split("\t")
+                if len(fields) < 3 or not fields[0].isdigit() or not fields[1].isdigit():
+                    continue
+
+                ayah_id: int = len(ayahs)
+                ayahs.append((int(fields[0]), int(fields[1]), line_offset))
+                text: str = self._normalize(fields[2], True)
+                if len(fields) > 3:
+                    text += " " + self._normalize(fields[3], False)
+                for word in set(text.split()):
+                    if len(word) >= self.MIN_TOKEN_LENGTH:
+                        postings.setdefault(word.encode("utf-8"), []).append(ayah_id)
+
+        tokens: List[bytes] = sorted(postings)
+        directory: bytearray = bytearray()
+        blob: bytearray = bytearray()
+        ids: array = array("I")
+        for token in tokens:
+            directory += _TOKEN.pack(len(blob), len(token), len(ids), len(postings[token]))
+            blob += token
+            ids.extend(postings[token])
+        if sys.byteorder == "big":
+            ids.byteswap()
+
+        table: bytearray = bytearray()
+        for surah, ayah, line_offset in ayahs:
+            table += _AYAH.pack(surah, ayah, line_offset)
+
+        directory_offset: int = _HEADER.size
+        blob_offset: int = directory_offset + len(directory)
+        postings_offset: int = blob_offset + len(blob)
+        ayah_offset: int = postings_offset + len(ids) * ids.itemsize
+
+        temp_file: Path = self.index_file.with_suffix(".idx.tmp")
+        with open(temp_file, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(tokens), len(ayahs), directory_offset, blob_offset, postings_offset, ayah_offset))
+            f.write(directory)
+            f.write(blob)
+            f.write(ids.tobytes())
+            f.write(table)
+        os.replace(temp_file, self.index_file)
+
+        logger.tree("📜 Ayah Index Built", [
+            ("Corpus", self.corpus_file.name),
+            ("Ayahs", str(len(ayahs))),
+            ("Tokens", str(len(tokens)))
+        ])
+
+    def _token_at(self, i: int) -> Tuple[bytes, int, int]:
+        """Read directory entry i as (token, postings start, postings count)."""
+        offset, length, start, count = _TOKEN.unpack_from(self._index, _HEADER.size + i * _TOKEN.size)
+        begin: int = self._blob_offset + offset
+        return self._index[begin:begin + length], start, count
+
+    def _lower_bound(self, token: bytes) -> int:
+        """Index of the first directory entry not less than token."""
+        lo, hi = 0, self._tokens
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if self._token_at(mid)[0] < token:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _postings(self, word: str, prefix: bool = False) -> Set[int]:
+        """
+        Get the ayah ids containing a word (or, for prefix, any word starting with it).
+
+        Args:
+            word: Normalized word
+            prefix: Also match tokens that start with the word
+
+        Returns:
+            Set[int]: Ayah ids
+        """
+        token: bytes = word.encode("utf-8")
+        ids: Set[int] = set()
+        i: int = self._lower_bound(token)
+        seen: int = 0
+        while i < self._tokens and seen < self.MAX_PREFIX_TOKENS:
+            current, start, count = self._token_at(i)
+            if current != token and not (prefix and current.startswith(token)):
+                break
+            chunk: array = array("I")
+            begin: int = self._postings_offset + start * chunk.itemsize
+            chunk.frombytes(self._index[begin:begin + count * chunk.itemsize])
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            ids.update(chunk)
+            i += 1
+            seen += 1
+        return ids
+
+    def _ayah(self, ayah_id: int) -> AyahMatch:
+        """Read an ayah's numbers from the table and its text from the mapped corpus."""
+        surah, ayah, line_offset = _AYAH.unpack_from(self._index, self._ayah_offset + ayah_id * _AYAH.size)
+        end: int = self._corpus.find(b"\n", line_offset)
+        line: bytes = self._corpus[line_offset:end if end != -1 else len(self._corpus)]
+        fields: List[str] = line.decode("utf-8").rstrip("\r").split("\t")
+        return AyahMatch(surah, ayah, fields[2], fields[3] if len(fields) > 3 else "")
+
+
+# Process-wide ayah search; the index itself is only mapped on first query
+_ayah_search: Optional[AyahSearch] = None
+
+
+def get_ayah_search() -> AyahSearch:
+    """
+    Get the shared AyahSearch instance.
+
+    Returns:
+        AyahSearch: The shared ayah search (nothing is loaded until it is queried)
+    """
+    global _ayah_search
+    if _ayah_search is None:
+        _ayah_search = AyahSearch()
+    return _ayah_search
@@ -0,0 +1,220 @@
+"""
+QuranBot - Text Normalization
+=============================
+
+Normalization helpers shared by the search index.
+
+Surah names are written many ways: with or without tashkeel, with different
+alef and hamza forms, with or without the "Al-"/"Ash-" article and with
+assorted apostrophes. These helpers fold all of those variants onto one
+canonical form so a name is matched the same way however it is typed.
+
+Features:
+- Arabic: strip tashkeel and tatweel, unify alef/hamza forms, ة→ه, ى→ي, drop "ال"
+- English: casefold, strip accents, apostrophes, hyphens and leading articles
+- Padded character trigrams for the inverted index
+- Phonetic keys: Arabizi digits, vowel-length folding and consonant skeletons
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+import re
+import unicodedata
+from typing import FrozenSet, List
+
+
+# ARABIC
+# ======
+# Tashkeel (harakat, tanween, shadda, sukun), superscript alef, Quranic
+# annotation marks and tatweel carry no meaning for name matching
+_ARABIC_MARKS = re.compile(r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]')
+
+# Letter variants folded onto a single base letter
+_ARABIC_FOLD = str.maketrans({
+    "أ": "ا",
+    "إ": "ا",
+    "آ": "ا",
+    "ٱ": "ا",
+    "ة": "ه",
+    "ى": "ي",
+    "ؤ": "و",
+    "ئ": "ي",
+})
+
+# Any character in the Arabic block marks a query as Arabic
+_ARABIC_CHARS = re.compile(r'[\u0600-\u06FF]')
+
+# ENGLISH
+# =======
+# Transliteration articles dropped from the start of a name ("Al-Kahf" → "kahf")
+# "the" is included so translations like "The Cave" fold the same way
+_ENGLISH_ARTICLES: FrozenSet[str] = frozenset({
+    "al", "an", "ar", "as", "ash", "at", "ad", "adh", "az", "ath", "el", "the",
+})
+
+# Apostrophes and ayn/hamza marks used in transliterations are removed outright
+_APOSTROPHES = re.compile(r"['`\u00B4\u2018\u2019\u02BC\u02BB\u02BE\u02BF]")
+
+# Anything else that isn't a letter or digit separates words
+_SEPARATORS = re.compile(r'[^\w]+')
+
+# PHONETIC
+# ========
+# Arabizi digits stand in for Arabic letters with no Latin equivalent;
+# hamza (2) and ain (3) are silent in most transliterations
+_ARABIZI = str.maketrans({
+    "2": "",
+    "3": "",
+    "5": "kh",
+    "6": "t",
+    "7": "h",
+    "8": "gh",
+    "9": "q",
+})
+
+# Spelling variants that sound the same: e/i, o/u and q/k
+_PHONETIC_FOLD = str.maketrans({
+    "e": "i",
+    "o": "u",
+    "q": "k",
+})
+
+# A "y" closing a diphthong is a vowel ("quraysh" = "quraish")
+_DIPHTHONG_Y = re.compile(r'(?<=[aiu])y(?![aiu])')
+
+# Runs of the same letter collapse, which also folds long vowels ("ee", "aa")
+_REPEATS = re.compile(r'(.)\1+')
+
+# Silent final "h" after a vowel ("fatihah" = "fatiha")
+_FINAL_H = re.compile(r'(?<=[aiu])h$')
+
+_VOWELS = re.compile(r'[aiu]')
+
+
+def is_arabic(text: str) -> bool:
+    """
+    Check whether text contains Arabic script.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        bool: True if any character is in the Arabic block
+    """
+    return bool(_ARABIC_CHARS.search(text))
+
+
+def normalize_arabic(text: str, keep_articles: bool = False) -> str:
+    """
+    Normalize Arabic text for matching.
+
+    Args:
+        text: Arabic text, with or without diacritics
+        keep_articles: Keep the definite article (used for autocomplete keys)
+
+    Returns:
+        str: Text without tashkeel/tatweel, with unified letter forms and
+        without the definite article on each word
+    """
+    text = _ARABIC_MARKS.sub('', text)
+    text = text.translate(_ARABIC_FOLD)
+    words: List[str] = []
+    for word in _SEPARATORS.split(text):
+        if not word:
+            continue
+        # Drop the definite article but keep short words like "ال" in "آل عمران"
+        if not keep_articles and word.startswith("ال") and len(word) > 3:
+            word = word[2:]
+        words.append(word)
+    return " ".join(words)
+
+
+def normalize_english(text: str, keep_articles: bool = False) -> str:
+    """
+    Normalize English or transliterated text for matching.
+
+    Args:
+        text: Latin-script text such as "Al-Baqarah" or "The Cow"
+        keep_articles: Keep leading articles (used for autocomplete keys)
+
+    Returns:
+        str: Casefolded words without accents, apostrophes or leading articles
+    """
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = _APOSTROPHES.sub('', text)
+    words: List[str] = [w for w in _SEPARATORS.split(text) if w]
+    # Only strip articles while a real word remains after them
+    while not keep_articles and len(words) > 1 and words[0] in _ENGLISH_ARTICLES:
+        words.pop(0)
+    return " ".join(words)
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text using the rules for its script.
+
+    Args:
+        text: Arabic or Latin-script text
+
+    Returns:
+        str: Normalized text
+    """
+    return normalize_arabic(text) if is_arabic(text) else normalize_english(text)
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Build the set of padded character trigrams of normalized text.
+
+    Each word is padded with a space on both sides so short words still
+    produce trigrams and word boundaries carry weight.
+
+    Args:
+        text: Normalized text
+
+    Returns:
+        FrozenSet[str]: Trigrams of every word
+    """
+    grams: set = set()
+    for word in text.split():
+        padded: str = f" {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return frozenset(grams)
+
+
+def phonetic_key(text: str) -> str:
+    """
+    Build a transliteration-insensitive key for a Latin-script name.
+
+    "Yaseen", "ya sin" and "Ya-Sin" all map to "yasin"; "7amd" maps to "hamd".
+
+    Args:
+        text: Name or query, normalized or raw
+
+    Returns:
+        str: Phonetic key without spaces, or "" if nothing is left
+    """
+    text = normalize_english(text).translate(_ARABIZI)
+    text = "".join(text.split()).translate(_PHONETIC_FOLD)
+    text = _DIPHTHONG_Y.sub('i', text)
+    text = _REPEATS.sub(r'\1', text)
+    return _FINAL_H.sub('', text)
+
+
+def skeleton_key(key: str) -> str:
+    """
+    Reduce a phonetic key to its consonants.
+
+    Catches vowel mistakes the phonetic key keeps ("ikhlaas" vs "akhlas").
+
+    Args:
+        key: Phonetic key from phonetic_key()
+
+    Returns:
+        str: Consonant skeleton
+    """
+    return _REPEATS.sub(r'\1', _VOWELS.sub('', key))
@@ -5,17 +5,88 @@ QuranBot - Surah Search Utility
 Fuzzy search functionality for finding Surahs by name or number.
 Handles typos and partial matches for both Arabic and English names.
 
+Search Index:
+- Every name is normalized once at load (see src/utils/normalize.py)
+- A trigram inverted index maps each padded trigram to the names containing it
+- Queries only score the candidates that share trigrams with them
+
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 Version: v1.0.0
 """
 
-import json
-from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+import threading
+from collections import Counter, OrderedDict
+from typing import List, Dict, Tuple, Optional, Any, FrozenSet, NamedTuple, Union
 from difflib import SequenceMatcher
 
 from src.core.logger import logger
+from src.data.surahs import Surah, SURAHS
+from src.utils.normalize import is_arabic, normalize_arabic, normalize_english, trigrams, phonetic_key, skeleton_key
+from src.utils.trie import PrefixTrie
+
+
+# Common alternative names users search for, beyond the names in the surah table
+SURAH_ALIASES: Dict[int, Tuple[str, ...]] = {
+    1: ("Al-Hamd", "Umm al-Kitab"),
+    3: ("Al-Imran", "Aal Imran"),
+    9: ("Bara'ah",),
+    17: ("Bani Isra'il",),
+    21: ("Al-Anbiya",),
+    40: ("Al-Mu'min",),
+    41: ("Ha-Mim As-Sajdah",),
+    42: ("Ash-Shura",),
+    47: ("Al-Qital",),
+    76: ("Ad-Dahr",),
+    78: ("Amma",),
+    93: ("Ad-Duha",),
+    94: ("Al-Inshirah", "Alam Nashrah"),
+    111: ("Al-Lahab", "Tabbat"),
+    112: ("At-Tawhid",),
+}
+
+
+class SearchResult(NamedTuple):
+    """
+    One search hit: a shared entry of the surah table plus its similarity score.
+    
+    The surah's fields are exposed directly (result.number, result.english, ...)
+    without copying them out of the table.
+    """
+    surah: Surah
+    score: float
+    
+    @property
+    def number(self) -> int:
+        return self.surah.number
+    
+    @property
+    def arabic(self) -> str:
+        return self.surah.arabic
+    
+    @property
+    def english(self) -> str:
+        return self.surah.english
+    
+    @property
+    def translation(self) -> str:
+        return self.surah.translation
+    
+    @property
+    def emoji(self) -> str:
+        return self.surah.emoji
+    
+    @property
+    def label(self) -> str:
+        return self.surah.label
+
+
+class IndexEntry(NamedTuple):
+    """One searchable name of a surah, normalized and split into trigrams."""
+    number: int
+    field: str
+    text: str
+    grams: FrozenSet[str]
 
 
 class SurahSearch:
@@ -27,178 +98,342 @@ class SurahSearch:
     - Arabic name with typo tolerance
     - English name with typo tolerance
     - Partial name matching
+    
+    Instances are immutable after construction. Use get_surah_search() to
+    share the preloaded instance instead of rebuilding the index.
     """
     
+    # Maximum score for a match on the translation (weaker than a name match)
+    TRANSLATION_WEIGHT: float = 0.9
+    
+    # Index entries scored per query, ranked by shared trigrams
+    CANDIDATE_LIMIT: int = 30
+    
+    # Minimum score for a surah to be returned
+    MIN_SCORE: float = 0.5
+    
+    # Scores for hash-matched phonetic keys, checked before fuzzy scoring
+    PHONETIC_SCORE: float = 0.97
+    SKELETON_SCORE: float = 0.9
+    
+    # LRU cache of normalized query -> results; users repeat the same few searches
+    CACHE_SIZE: int = 512
+    
+    # Results computed per cache entry, so different limits share one entry
+    CACHE_DEPTH: int = 10
+    
     def __init__(self) -> None:
         """
-        Initialize the Surah search system by loading the mapper data.
+        Initialize the Surah search system over the canonical surah table.
         
-        This method loads the comprehensive surah mapping data from the JSON file,
-        which contains all 114 surahs with their Arabic names, English names,
-        and translations. If the file is missing or corrupted, it gracefully
-        falls back to empty data to prevent the bot from crashing.
+        The table (src/data/surahs.py) is shared, not copied: index entries
+        and search results reference its immutable Surah records directly.
         """
-        try:
-            # Construct path to the surah mapper JSON file
-            # Navigate from src/utils/ to src/data/surah_mapper.json
-            mapper_path: Path = Path(__file__).parent.parent / "data" / "surah_mapper.json"
-            
-            if not mapper_path.exists():
-                # Log the missing file error with helpful debugging information
-                logger.error_tree("Surah mapper file not found", FileNotFoundError("Missing surah_mapper.json"), [
-                    ("Expected Path", str(mapper_path)),
-                    ("Current Directory", str(Path.cwd()))
-                ])
-                # Create empty default data to prevent crashes
-                # This allows the bot to continue operating without search functionality
-                self.data = {"surahs": {}}
-                self.surahs = {}
-                return
-            
-            # Load the JSON data with UTF-8 encoding to support Arabic characters
-            with open(mapper_path, 'r', encoding='utf-8') as f:
-                self.data: Dict[str, Any] = json.load(f)
-            
-            # Extract the surahs dictionary from the loaded data
-            # This contains all 114 surahs with their metadata
-            self.surahs: Dict[str, Dict[str, str]] = self.data.get("surahs", {})
-            
-            logger.success(f"Loaded {len(self.surahs)} Surahs for search")
+        # The canonical surah table, indexed directly by surah number
+        # (slot 0 is unused so lookups never need an offset)
+        self.records: Tuple[Optional[Surah], ...] = SURAHS
+        logger.success(f"Loaded {len(self)} Surahs for search")
+        
+        self._build_index()
+        
+        # Result cache; results are immutable tuples so they can be shared as-is
+        self._cache: "OrderedDict[str, Tuple[SearchResult, ...]]" = OrderedDict()
+        self._cache_lock: threading.Lock = threading.Lock()
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+    
+    def __len__(self) -> int:
+        """Number of surahs available for search."""
+        return sum(1 for record in self.records if record)
+    
+    def _build_index(self) -> None:
+        """
+        Normalize every name once and build the trigram inverted index.
+        
+        Arabic names are indexed under Arabic normalization; English names,
+        aliases and translations under English normalization. Each trigram
+        maps to the positions of the entries that contain it.
+        
+        Transliterated names and aliases also get phonetic keys (with and
+        without the article) and consonant skeletons in hash maps.
+        """
+        entries: List[IndexEntry] = []
+        postings: Dict[str, List[int]] = {}
+        phonetic: Dict[str, List[int]] = {}
+        skeletons: Dict[str, List[int]] = {}
+        
+        for record in self.records:
+            if record is None:
+                continue
             
-        except json.JSONDecodeError as e:
-            logger.error_tree("Failed to parse surah mapper JSON", e, [
-                ("File", str(mapper_path)),
-                ("Error Position", f"Line {e.lineno}, Column {e.colno}" if hasattr(e, 'lineno') else "Unknown")
-            ])
-            self.data = {"surahs": {}}
-            self.surahs = {}
+            names: List[Tuple[str, str]] = [(field, getattr(record, field)) for field in ('arabic', 'english', 'translation')]
+            names.extend(('alias', alias) for alias in SURAH_ALIASES.get(record.number, ()))
             
-        except Exception as e:
-            logger.error_tree("Failed to initialize SurahSearch", e, [
-                ("Type", type(e).__name__)
-            ])
-            self.data = {"surahs": {}}
-            self.surahs = {}
+            for field, raw in names:
+                if not raw:
+                    continue
+                text: str = normalize_arabic(raw) if field == 'arabic' else normalize_english(raw)
+                entry: IndexEntry = IndexEntry(record.number, field, text, trigrams(text))
+                for gram in entry.grams:
+                    postings.setdefault(gram, []).append(len(entries))
+                entries.append(entry)
+                
+                if field in ('english', 'alias'):
+                    key: str = phonetic_key(raw)
+                    for variant in (key, "al" + key, phonetic_key(normalize_english(raw, keep_articles=True).replace(" ", ""))):
+                        if record.number not in phonetic.setdefault(variant, []):
+                            phonetic[variant].append(record.number)
+                    skeleton: str = skeleton_key(key)
+                    if len(skeleton) >= 2 and record.number not in skeletons.setdefault(skeleton, []):
+                        skeletons[skeleton].append(record.number)
+        
+        # The index is frozen into tuples once complete; it is never mutated
+        # afterwards, so one instance can be shared by every caller
+        self.entries: Tuple[IndexEntry, ...] = tuple(entries)
+        self.postings: Dict[str, Tuple[int, ...]] = {
+            gram: tuple(positions) for gram, positions in postings.items()
+        }
+        self.phonetic: Dict[str, Tuple[int, ...]] = {key: tuple(nums) for key, nums in phonetic.items()}
+        self.skeletons: Dict[str, Tuple[int, ...]] = {key: tuple(nums) for key, nums in skeletons.items()}
+        
+        # Prefix trie for autocomplete over numbers, names and translations;
+        # every word is a key so "kahf" and "al kahf" both complete Al-Kahf
+        self.trie: PrefixTrie[int] = PrefixTrie()
+        for record in self.records:
+            if record is None:
+                continue
+            self.trie.insert(str(record.number), record.number, rank=record.number)
+            for text in (
+                normalize_english(record.english, keep_articles=True),
+                normalize_english(record.translation, keep_articles=True),
+                normalize_arabic(record.arabic, keep_articles=True),
+                normalize_arabic(record.arabic),
+                *(normalize_english(alias, keep_articles=True) for alias in SURAH_ALIASES.get(record.number, ())),
+            ):
+                words: List[str] = text.split()
+                for i in range(len(words)):
+                    self.trie.insert(" ".join(words[i:]), record.number, rank=record.number)
+        self.trie.freeze()
+        
+        logger.tree("🔍 Search Index Built", lambda: [
+            ("Entries", str(len(self.entries))),
+            ("Trigrams", str(len(self.postings))),
+            ("Phonetic Keys", str(len(self.phonetic)))
+        ], level=logger.DEBUG)
     
-    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def search(self, query: str, limit: int = 5) -> Tuple[SearchResult, ...]:
         """
         Search for Surahs matching the query.
         
+        Results are cached by normalized query, so a repeated search is a
+        dictionary lookup.
+        
         Args:
             query: Search query (number, Arabic name, or English name)
             limit: Maximum number of results to return
             
         Returns:
-            List of matching Surahs with similarity scores
+            Matching Surahs with similarity scores, best first
         """
-        try:
-            if not query:
-                logger.tree("⚠️ Empty Search Query", [
-                    ("Query", "Empty string"),
-                    ("Action", "Returning empty results")
-                ])
-                return []
-            
-            query: str = query.strip()
+        if not query or not query.strip():
+            logger.tree("⚠️ Empty Search Query", lambda: [
+                ("Query", "Empty string"),
+                ("Action", "Returning empty results")
+            ], level=logger.DEBUG)
+            return ()
+        
+        query = query.strip()
+        key: str = query if query.isdigit() else (normalize_arabic(query) if is_arabic(query) else normalize_english(query))
+        
+        if limit <= self.CACHE_DEPTH:
+            with self._cache_lock:
+                cached: Optional[Tuple[SearchResult, ...]] = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return cached[:limit]
+                self.cache_misses += 1
+        
+        results: Tuple[SearchResult, ...] = self._search(query, max(limit, self.CACHE_DEPTH))
+        
+        with self._cache_lock:
+            self._cache[key] = results
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
+        return results[:limit]
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache counters for metrics.
+        
+        Returns:
+            Dict with hits, misses, hit rate and current size
+        """
+        total: int = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / total if total else 0.0,
+            "size": len(self._cache),
+            "capacity": self.CACHE_SIZE,
+        }
+    
+    def _search(self, query: str, limit: int) -> Tuple[SearchResult, ...]:
+        """
+        Score the index for a stripped, non-empty query (uncached).
+        
+        Args:
+            query: Search query
+            limit: Maximum number of results to return
             
+        Returns:
+            Matching Surahs with similarity scores, best first
+        """
+        try:
             # Check if query is a numeric surah number (1-114)
             # This provides the fastest and most accurate search for numeric queries
             if query.isdigit():
                 num: int = int(query)
                 if 1 <= num <= 114:
-                    if str(num) in self.surahs:
-                        # Create a copy of the surah data and add search metadata
-                        surah: Dict[str, Any] = self.surahs[str(num)].copy()
-                        surah['number'] = num
-                        surah['score'] = 1.0  # Perfect match for numeric queries
+                    if self.records[num]:
+                        # Perfect match for numeric queries
+                        surah: SearchResult = SearchResult(self.records[num], 1.0)
                         
-                        logger.tree(f"🔍 Surah Found by Number", [
+                        logger.tree(f"🔍 Surah Found by Number", lambda: [
                             ("Query", query),
-                            ("Surah", f"{num}. {surah.get('english', 'Unknown')}")
-                        ])
+                            ("Surah", f"{num}. {surah.english}")
+                        ], level=logger.DEBUG)
                         
-                        return [surah]
+                        return (surah,)
                     else:
                         logger.tree("⚠️ Surah Not in Database", [
                             ("Requested Number", str(num)),
                             ("Valid Range", "1-114"),
                             ("Action", "Returning empty results")
                         ])
-                        return []
+                        return ()
             
-            # FUZZY SEARCH BY NAME
-            # ====================
-            # Perform intelligent fuzzy search across Arabic, English, and translation names
-            # This handles typos, partial matches, and different naming conventions
-            results: List[Dict[str, Any]] = []
-            query_lower: str = query.lower()
+            # INDEXED SEARCH BY NAME
+            # =======================
+            # Normalize the query with the rules for its script, then only score
+            # the names that share at least one trigram with it
+            arabic_query: bool = is_arabic(query)
+            normalized: str = normalize_arabic(query) if arabic_query else normalize_english(query)
+            if not normalized:
+                return ()
             
-            for num_str, surah_data in self.surahs.items():
-                try:
-                    num: int = int(num_str)
-                    
-                    # Calculate similarity scores using SequenceMatcher for each name type
-                    # Arabic names are searched with original case to preserve authenticity
-                    arabic_score: float = self._calculate_similarity(query, surah_data.get('arabic', ''))
-                    # English and translation names are searched case-insensitively
-                    english_score: float = self._calculate_similarity(query_lower, surah_data.get('english', '').lower())
-                    translation_score: float = self._calculate_similarity(query_lower, surah_data.get('translation', '').lower())
-                    
-                    # Take the best similarity score from all three name types
-                    # This ensures we catch matches regardless of which name field contains the query
-                    best_score: float = max(arabic_score, english_score, translation_score)
-                    
-                    # PARTIAL MATCH BOOSTING
-                    # ======================
-                    # Boost scores for partial matches (query contained within names)
-                    # This helps with incomplete searches and partial typing
-                    if query in surah_data.get('arabic', ''):
-                        best_score = max(best_score, 0.8)  # High boost for Arabic partial matches
-                    if query_lower in surah_data.get('english', '').lower():
-                        best_score = max(best_score, 0.8)  # High boost for English partial matches
-                    if query_lower in surah_data.get('translation', '').lower():
-                        best_score = max(best_score, 0.7)  # Medium boost for translation partial matches
-                    
-                    # Only include results above the minimum similarity threshold
-                    # 0.3 threshold balances accuracy with recall
-                    if best_score > 0.3:
-                        result: Dict[str, Any] = surah_data.copy()
-                        result['number'] = num
-                        result['score'] = best_score
-                        results.append(result)
-                        
-                except (ValueError, KeyError) as e:
-                    logger.error_tree(f"Error processing surah {num_str}", e, [
-                        ("Surah Number", num_str),
-                        ("Query", query)
-                    ])
+            query_grams: FrozenSet[str] = trigrams(normalized)
+            hits: Counter = Counter()
+            for gram in query_grams:
+                hits.update(self.postings.get(gram, ()))
+            
+            # PHONETIC MATCH
+            # ==============
+            # Transliteration variants ("yaseen", "7amd", "ikhlaas") hit a
+            # precomputed key directly; fuzzy scoring below only adds to these
+            best: Dict[int, float] = {}
+            if not arabic_query:
+                key: str = phonetic_key(query)
+                for num in self.phonetic.get(key, ()):
+                    best[num] = self.PHONETIC_SCORE
+                if len(key) >= 3:
+                    for num in self.skeletons.get(skeleton_key(key), ()):
+                        best.setdefault(num, self.SKELETON_SCORE)
+            
+            for position, shared in hits.most_common(self.CANDIDATE_LIMIT):
+                entry: IndexEntry = self.entries[position]
+                
+                # Arabic queries only match Arabic names and vice versa
+                if (entry.field == 'arabic') != arabic_query:
                     continue
+                
+                score: float = self._score(normalized, query_grams, entry, shared)
+                if score > best.get(entry.number, 0.0):
+                    best[entry.number] = score
+            
+            results: List[SearchResult] = [
+                SearchResult(self.records[num], score)
+                for num, score in best.items()
+                if score > self.MIN_SCORE
+            ]
             
             # Sort results by similarity score (highest first) and return top matches
             # This ensures the most relevant results appear first in the search results
-            results.sort(key=lambda x: x['score'], reverse=True)
+            results.sort(key=lambda x: x.score, reverse=True)
             
             if results:
-                logger.tree(f"🔍 Search Results", [
+                logger.tree(f"🔍 Search Results", lambda: [
                     ("Query", query),
                     ("Results Found", str(len(results))),
-                    ("Top Match", f"{results[0]['number']}. {results[0].get('english', 'Unknown')}")
-                ])
+                    ("Top Match", f"{results[0].number}. {results[0].english}")
+                ], level=logger.DEBUG)
             else:
-                logger.tree("ℹ️ No Search Results", [
+                logger.tree("ℹ️ No Search Results", lambda: [
                     ("Query", query),
                     ("Results", "0 matches"),
                     ("Action", "Returning empty list")
-                ])
+                ], level=logger.DEBUG)
             
-            return results[:limit]
+            return tuple(results[:limit])
             
         except Exception as e:
             logger.error_tree("Search failed", e, [
                 ("Query", query),
                 ("Limit", str(limit))
             ])
-            return []
+            return ()
+    
+    def autocomplete(self, query: str, limit: int = 25) -> List[Surah]:
+        """
+        Complete a partially typed surah name or number.
+        
+        Answers from the prefix trie, so the cost is a walk down the typed
+        prefix regardless of how many surahs match.
+        
+        Args:
+            query: Raw text typed by the user
+            limit: Maximum number of suggestions
+            
+        Returns:
+            List[Surah]: Matching surahs, lowest number first
+        """
+        prefix: str = normalize_arabic(query, keep_articles=True) if is_arabic(query) else normalize_english(query, keep_articles=True)
+        if not prefix:
+            return [record for record in self.records[1:limit + 1] if record]
+        return [self.records[number] for number in self.trie.complete(prefix, limit)]
+    
+    def _score(self, query: str, query_grams: FrozenSet[str], entry: IndexEntry, shared: int) -> float:
+        """
+        Score one candidate name against a normalized query.
+        
+        Args:
+            query: Normalized query
+            query_grams: Trigrams of the query
+            entry: Candidate index entry
+            shared: Number of trigrams the query and entry have in common
+            
+        Returns:
+            Score between 0 and 1
+        """
+        if query == entry.text:
+            score: float = 1.0
+        else:
+            # Dice coefficient on trigrams rewards typos that keep most of the
+            # name intact; SequenceMatcher catches transpositions and dropped letters
+            dice: float = 2.0 * shared / (len(query_grams) + len(entry.grams))
+            score = max(dice, self._calculate_similarity(query, entry.text))
+            
+            # Partial matches (query typed as the start or inside of a name)
+            if entry.text.startswith(query):
+                score = max(score, 0.9)
+            elif query in entry.text:
+                score = max(score, 0.8)
+        
+        if entry.field == 'translation':
+            score *= self.TRANSLATION_WEIGHT
+        return score
     
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
@@ -222,7 +457,7 @@ class SurahSearch:
             ])
             return 0.0
     
-    def get_surah(self, number: int) -> Optional[Dict[str, Any]]:
+    def get_surah(self, number: int) -> Optional[Surah]:
         """
         Get a specific Surah by number.
         
@@ -242,14 +477,13 @@ class SurahSearch:
                 return None
                 
             if 1 <= number <= 114:
-                if str(number) in self.surahs:
-                    surah: Dict[str, Any] = self.surahs[str(number)].copy()
-                    surah['number'] = number
+                if self.records[number]:
+                    surah: Surah = self.records[number]
                     
-                    logger.tree(f"📖 Retrieved Surah", [
+                    logger.tree(f"📖 Retrieved Surah", lambda: [
                         ("Number", str(number)),
-                        ("Name", surah.get('english', 'Unknown'))
-                    ])
+                        ("Name", surah.english)
+                    ], level=logger.DEBUG)
                     
                     return surah
                 else:
@@ -273,12 +507,12 @@ class SurahSearch:
             ])
             return None
     
-    def format_result(self, surah: Dict[str, Any]) -> str:
+    def format_result(self, surah: Union[SearchResult, Surah]) -> str:
         """
         Format a Surah result for display.
         
         Args:
-            surah: Surah data dictionary
+            surah: Search result or surah
             
         Returns:
             Formatted string for display
@@ -287,16 +521,30 @@ class SurahSearch:
             if not surah:
                 return "❌ Invalid surah data"
             
-            # Get values with defaults
-            emoji: str = surah.get('emoji', '📖')
-            number: int = surah.get('number', 0)
-            english: str = surah.get('english', 'Unknown')
-            arabic: str = surah.get('arabic', 'غير معروف')
-            
-            return f"{emoji} **{number}. {english}** - {arabic}"
+            return f"{surah.emoji} **{surah.label}** - {surah.arabic}"
             
         except Exception as e:
             logger.error_tree("Failed to format surah result", e, [
-                ("Surah Number", str(surah.get('number', 'Unknown')))
+                ("Surah Number", str(getattr(surah, 'number', 'Unknown')))
             ])
-            return "❌ Error formatting result"
\ No newline at end of file
+            return "❌ Error formatting result"
+
+
+# Process-wide search engine, created once and shared by every caller
+_surah_search: Optional[SurahSearch] = None
+
+
+def get_surah_search() -> SurahSearch:
+    """
+    Get the shared SurahSearch instance, loading it on first use.
+    
+    The bot calls this at startup so the surah table is indexed
+    before the first interaction; afterwards each search only costs the query.
+    
+    Returns:
+        SurahSearch: The shared search engine
+    """
+    global _surah_search
+    if _surah_search is None:
+        _surah_search = SurahSearch()
+    return _surah_search
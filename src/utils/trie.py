@@ -0,0 +1,141 @@
+"""
+QuranBot - Prefix Trie
+======================
+
+Prefix trie used to answer slash command autocomplete.
+
+Discord expects autocomplete answers within 3 seconds and fires a request
+on every keystroke, so lookups must cost almost nothing. Each node keeps a
+precomputed tuple of its best values, which makes a lookup a walk down the
+prefix followed by returning an existing tuple: no traversal of the
+subtree, no sorting and no per-request allocation beyond the slice.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+Version: v1.0.0
+"""
+
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T", bound=Hashable)
+
+
+class _TrieNode(Generic[T]):
+    """Single trie node with its children and the best values below it."""
+
+    __slots__ = ("children", "values", "top")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode[T]"] = {}
+        self.values: List[Tuple[int, T]] = []
+        self.top: Tuple[T, ...] = ()
+
+
+class PrefixTrie(Generic[T]):
+    """
+    Immutable-after-freeze prefix trie mapping string keys to ranked values.
+
+    Usage:
+        trie.insert("kahf", 18, rank=18)
+        trie.freeze()
+        trie.complete("ka")  # -> (18, ...)
+
+    Keys are expected to be normalized by the caller. A value may be inserted
+    under any number of keys; it appears at most once per completion.
+
+    Attributes:
+        top_k: Number of values kept per node (Discord shows at most 25 choices)
+    """
+
+    def __init__(self, top_k: int = 25) -> None:
+        """
+        Initialize an empty trie.
+
+        Args:
+            top_k: Number of best values precomputed for every prefix
+        """
+        self.top_k: int = top_k
+        self._root: _TrieNode[T] = _TrieNode()
+        self._frozen: bool = False
+
+    def insert(self, key: str, value: T, rank: int = 0) -> None:
+        """
+        Add a value under a key.
+
+        Args:
+            key: Normalized key
+            value: Value returned for every prefix of the key
+            rank: Lower ranks are returned first
+        """
+        if self._frozen:
+            raise RuntimeError("PrefixTrie is frozen")
+        if not key:
+            return
+        node: _TrieNode[T] = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.values.append((rank, value))
+
+    def insert_all(self, keys: Iterable[str], value: T, rank: int = 0) -> None:
+        """
+        Add a value under several keys.
+
+        Args:
+            keys: Normalized keys
+            value: Value returned for every prefix of each key
+            rank: Lower ranks are returned first
+        """
+        for key in keys:
+            self.insert(key, value, rank)
+
+    def freeze(self) -> None:
+        """Precompute the best values for every prefix; the trie is read-only afterwards."""
+        self._fill(self._root)
+        self._frozen = True
+
+    def _fill(self, node: _TrieNode[T]) -> List[Tuple[int, T]]:
+        """
+        Compute the ranked values of a subtree bottom-up and store the top ones.
+
+        Args:
+            node: Subtree root
+
+        Returns:
+            List[Tuple[int, T]]: Best (rank, value) pairs of the subtree, deduplicated
+        """
+        best: Dict[T, int] = {}
+        for rank, value in node.values:
+            if rank < best.get(value, rank + 1):
+                best[value] = rank
+        for child in node.children.values():
+            for rank, value in self._fill(child):
+                if rank < best.get(value, rank + 1):
+                    best[value] = rank
+
+        ranked: List[Tuple[int, T]] = sorted(((rank, value) for value, rank in best.items()), key=lambda p: p[0])
+        ranked = ranked[:self.top_k]
+        node.top = tuple(value for _, value in ranked)
+        # Exact-key values are folded into top; the raw list is no longer needed
+        node.values = []
+        return ranked
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> Tuple[T, ...]:
+        """
+        Get the best values whose keys start with a prefix.
+
+        Args:
+            prefix: Normalized prefix
+            limit: Maximum number of values (defaults to top_k)
+
+        Returns:
+            Tuple[T, ...]: Values in rank order; empty if nothing matches
+        """
+        node: Optional[_TrieNode[T]] = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return ()
+        if limit is None or limit >= len(node.top):
+            return node.top
+        return node.top[:limit]